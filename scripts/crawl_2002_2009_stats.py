@@ -2,10 +2,12 @@
 Adapts the robust 2001 crawler logic to loop through years.
 """
 
+import argparse
 import logging
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from queue import Empty, Queue
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,7 @@ from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 from typing import Any
+from collections.abc import Callable
 from src.repositories.player_season_pitching_repository import save_pitching_stats_to_db as save_pitching_stats_safe
 from src.crawlers.player_batting_all_series_crawler import (
     get_series_mapping as get_batting_series_mapping,
@@ -23,20 +26,84 @@ from src.crawlers.player_pitching_all_series_crawler import (  # type: ignore[at
     get_series_mapping as get_pitching_series_mapping,
 )
 from src.repositories.safe_batting_repository import save_batting_stats_safe
+from src.utils.playwright_helpers import wait_for_postback
+from src.utils.request_policy import RequestPolicy
+from src.utils.type_helpers import parse_innings_to_outs
 
 
-def safe_parse_number(val_str: str | None, data_type: type) -> Any:
-    if not val_str:
+MISSING_VALUES = frozenset({"-", "N/A"})
+
+
+# Type-specialized cell parsers so the column tables pick int/float once instead of per cell.
+# int()/float() already tolerate surrounding whitespace, so no strip() copy is needed.
+# Numba @njit does not apply here: cells are Python str objects, which nopython mode cannot compile.
+def _parse_int(val_str: str) -> int | None:
+    if not val_str or val_str in MISSING_VALUES:
         return None
-    val_str = val_str.strip()
-    if not val_str or val_str in ["-", "N/A", ""]:
+    try:
+        return int(val_str)
+    except ValueError:
+        return None
+
+
+def _parse_float(val_str: str) -> float | None:
+    if not val_str or val_str in MISSING_VALUES:
         return None
     try:
-        return data_type(val_str)
-    except (ValueError, TypeError):
+        return float(val_str)
+    except ValueError:
         return None
 
 
+# (key, cell index, parser) for the wide 2002-2009 tables.
+BATTING_COLUMNS = (
+    ("avg", 3, _parse_float),
+    ("games", 4, _parse_int),
+    ("plate_appearances", 5, _parse_int),
+    ("at_bats", 6, _parse_int),
+    ("runs", 7, _parse_int),
+    ("hits", 8, _parse_int),
+    ("doubles", 9, _parse_int),
+    ("triples", 10, _parse_int),
+    ("home_runs", 11, _parse_int),
+    ("total_bases", 12, _parse_int),
+    ("rbi", 13, _parse_int),
+    ("sacrifice_hits", 14, _parse_int),
+    ("sacrifice_flies", 15, _parse_int),
+    ("walks", 16, _parse_int),
+    ("hbp", 17, _parse_int),
+    ("strikeouts", 18, _parse_int),
+    ("gdp", 19, _parse_int),
+    ("slg", 20, _parse_float),
+    ("obp", 21, _parse_float),
+    ("ops", 22, _parse_float),
+)
+PITCHING_COLUMNS = (
+    ("era", 3, _parse_float),
+    ("games", 4, _parse_int),
+    ("wins", 5, _parse_int),
+    ("losses", 6, _parse_int),
+    ("saves", 7, _parse_int),
+    ("holds", 8, _parse_int),
+)
+INNINGS_CELL_INDEX = 10
+PITCHING_ALLOWED_COLUMNS = (
+    ("hits_allowed", 11, _parse_int),
+    ("home_runs_allowed", 12, _parse_int),
+    ("walks_allowed", 13, _parse_int),
+    ("hit_batters", 14, _parse_int),
+    ("strikeouts", 15, _parse_int),
+    ("runs_allowed", 16, _parse_int),
+    ("earned_runs", 17, _parse_int),
+    ("whip", 18, _parse_float),
+)
+
+
+def _parse_columns(cells: list[str], columns: tuple[tuple[str, int, Callable[[str], Any]], ...]) -> dict[str, Any]:
+    size = len(cells)
+    return {key: parse(cells[idx]) if idx < size else None for key, idx, parse in columns}
+
+
 def _build_batting_data(
     cells: list[str],
     player_id: int,
@@ -45,34 +112,11 @@ def _build_batting_data(
     series_key: str,
     is_basic2: bool,
 ) -> dict[str, Any]:
-    def cell(idx: int) -> str | None:
-        return cells[idx] if len(cells) > idx else None
-
-    # wide table old stats mapping:
     return {
         "player_id": player_id,
         "player_name": player_name,
         "team_code": team_code,
-        "avg": safe_parse_number(cell(3), float),
-        "games": safe_parse_number(cell(4), int),
-        "plate_appearances": safe_parse_number(cell(5), int),
-        "at_bats": safe_parse_number(cell(6), int),
-        "runs": safe_parse_number(cell(7), int),
-        "hits": safe_parse_number(cell(8), int),
-        "doubles": safe_parse_number(cell(9), int),
-        "triples": safe_parse_number(cell(10), int),
-        "home_runs": safe_parse_number(cell(11), int),
-        "total_bases": safe_parse_number(cell(12), int),
-        "rbi": safe_parse_number(cell(13), int),
-        "sacrifice_hits": safe_parse_number(cell(14), int),
-        "sacrifice_flies": safe_parse_number(cell(15), int),
-        "walks": safe_parse_number(cell(16), int),
-        "hbp": safe_parse_number(cell(17), int),
-        "strikeouts": safe_parse_number(cell(18), int),
-        "gdp": safe_parse_number(cell(19), int),
-        "slg": safe_parse_number(cell(20), float),
-        "obp": safe_parse_number(cell(21), float),
-        "ops": safe_parse_number(cell(22), float),
+        **_parse_columns(cells, BATTING_COLUMNS),
     }
 
 
@@ -84,62 +128,17 @@ def _build_pitching_data(
     series_key: str,
     is_basic2: bool,
 ) -> dict[str, Any]:
-    def cell(idx: int) -> str | None:
-        return cells[idx] if len(cells) > idx else None
-
-    ip_str = cell(10)
-    innings_pitched = None
-    innings_outs = None
-    if ip_str:
-        try:
-            parts = ip_str.strip().split()
-            whole = 0.0
-            fraction = 0.0
-            if len(parts) == 2:
-                whole = float(parts[0])
-                frac_str = parts[1]
-            else:
-                frac_str = parts[0]
-                if "/" not in frac_str and "." not in frac_str:
-                    whole = float(frac_str)
-                    frac_str = ""
-
-            if "/" in frac_str:
-                num, denom = map(float, frac_str.split("/"))
-                fraction = num / denom
-            elif "." in frac_str:
-                whole = float(frac_str)
-
-            innings_pitched = whole + fraction
-            whole_int = int(whole)
-            outs = whole_int * 3
-            if "/" in frac_str:
-                num, denom = map(int, frac_str.split("/"))
-                outs += num
-            innings_outs = outs
-        except Exception:
-            logger.debug("Failed to parse innings pitched value: %s", ip_str, exc_info=True)
+    innings_outs = parse_innings_to_outs(cells[INNINGS_CELL_INDEX]) if len(cells) > INNINGS_CELL_INDEX else None
+    innings_pitched = innings_outs / 3 if innings_outs is not None else None
 
     return {
         "player_id": player_id,
         "player_name": player_name,
         "team_code": team_code,
-        "era": safe_parse_number(cell(3), float),
-        "games": safe_parse_number(cell(4), int),
-        "wins": safe_parse_number(cell(5), int),
-        "losses": safe_parse_number(cell(6), int),
-        "saves": safe_parse_number(cell(7), int),
-        "holds": safe_parse_number(cell(8), int),
+        **_parse_columns(cells, PITCHING_COLUMNS),
         "innings_pitched": innings_pitched,
         "innings_outs": innings_outs,
-        "hits_allowed": safe_parse_number(cell(11), int),
-        "home_runs_allowed": safe_parse_number(cell(12), int),
-        "walks_allowed": safe_parse_number(cell(13), int),
-        "hit_batters": safe_parse_number(cell(14), int),
-        "strikeouts": safe_parse_number(cell(15), int),
-        "runs_allowed": safe_parse_number(cell(16), int),
-        "earned_runs": safe_parse_number(cell(17), int),
-        "whip": safe_parse_number(cell(18), float),
+        **_parse_columns(cells, PITCHING_ALLOWED_COLUMNS),
     }
 
 
@@ -147,17 +146,22 @@ from src.utils.team_codes import resolve_team_code
 
 CRAWLER_EXCEPTIONS = (PlaywrightError, PlaywrightTimeoutError, RuntimeError, ValueError, TypeError, KeyError, OSError)
 
+SEASON_SELECTOR = 'select[name*="ddlSeason"]'
+TABLE_WAIT_TIMEOUT_MS = 5000
+
 # Custom extraction scripts
 EXTRACT_BATTING_JS = r"""
     () => {
         const table = document.querySelector('table.tData01') || document.querySelector('.record_table table') || document.querySelector('table');
         if (!table) return { error: "Table not found" };
 
-        const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.innerText.trim());
-        const is_basic2 = headers.join('').includes('BB') || headers.join('').includes('볼넷');
+        const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
+        const headerText = headers.join('');
+        const is_basic2 = headerText.includes('BB') || headerText.includes('볼넷');
 
         const rows = Array.from(table.querySelectorAll('tbody tr'));
         const results = [];
+        const PLAYER_ID_RE = /playerId=(\d+)/;
 
         rows.forEach(row => {
             const cells = Array.from(row.querySelectorAll('td'));
@@ -167,9 +171,9 @@ EXTRACT_BATTING_JS = r"""
             const a = nameCell.querySelector('a');
             if (!a) return;
 
-            const name = a.innerText.trim();
+            const name = a.textContent.trim();
             const href = a.getAttribute('href') || "";
-            const idMatch = href.match(/playerId=(\d+)/);
+            const idMatch = PLAYER_ID_RE.exec(href);
             const playerId = idMatch ? parseInt(idMatch[1], 10) : null;
 
             if (!playerId) return;
@@ -177,8 +181,8 @@ EXTRACT_BATTING_JS = r"""
             results.push({
                 player_id: playerId,
                 player_name: name,
-                team_name: cells[2].innerText.trim(),
-                cells: cells.map(c => c.innerText.trim()),
+                team_name: cells[2].textContent.trim(),
+                cells: cells.map(c => c.textContent.trim()),
                 is_basic2: is_basic2
             });
         });
@@ -192,11 +196,13 @@ EXTRACT_PITCHING_JS = r"""
         const table = document.querySelector('table.tData01') || document.querySelector('.record_table table') || document.querySelector('table');
         if (!table) return { error: "Table not found" };
 
-        const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.innerText.trim());
-        const is_basic2 = headers.join('').includes('W') || headers.join('').includes('승');
+        const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
+        const headerText = headers.join('');
+        const is_basic2 = headerText.includes('W') || headerText.includes('승');
 
         const rows = Array.from(table.querySelectorAll('tbody tr'));
         const results = [];
+        const PLAYER_ID_RE = /playerId=(\d+)/;
 
         rows.forEach(row => {
             const cells = Array.from(row.querySelectorAll('td'));
@@ -206,9 +212,9 @@ EXTRACT_PITCHING_JS = r"""
             const a = nameCell.querySelector('a');
             if (!a) return;
 
-            const name = a.innerText.trim();
+            const name = a.textContent.trim();
             const href = a.getAttribute('href') || "";
-            const idMatch = href.match(/playerId=(\d+)/);
+            const idMatch = PLAYER_ID_RE.exec(href);
             const playerId = idMatch ? parseInt(idMatch[1], 10) : null;
 
             if (!playerId) return;
@@ -216,8 +222,8 @@ EXTRACT_PITCHING_JS = r"""
             results.push({
                 player_id: playerId,
                 player_name: name,
-                team_name: cells[2].innerText.trim(),
-                cells: cells.map(c => c.innerText.trim()),
+                team_name: cells[2].textContent.trim(),
+                cells: cells.map(c => c.textContent.trim()),
                 is_basic2: is_basic2
             });
         });
@@ -227,7 +233,7 @@ EXTRACT_PITCHING_JS = r"""
 """
 
 
-def _setup_page(page, year, mode):
+def _setup_page(page, year, mode, policy):
     if mode == "batting":
         url = "https://www.koreabaseball.com/Record/Player/HitterBasic/BasicOld.aspx"
         mapping = get_batting_series_mapping()
@@ -242,20 +248,23 @@ def _setup_page(page, year, mode):
     series_info = mapping[series_key]
     league_name = series_info.get("league") or series_info.get("league_name") or "REGULAR"
 
-    page.goto(url, wait_until="load")
-    time.sleep(1)
-    page.select_option('select[name*="ddlSeason"]', str(year))
-    page.wait_for_load_state("networkidle")
-    time.sleep(2)
+    policy.delay(host="www.koreabaseball.com")
+    page.goto(url, wait_until="domcontentloaded")
+    page.wait_for_selector(SEASON_SELECTOR, state="attached", timeout=TABLE_WAIT_TIMEOUT_MS)
+    _postback(page, lambda: page.select_option(SEASON_SELECTOR, str(year)), policy)
     return series_key, league_name, extract_js, build_func
 
 
-def _parse_page(page, extract_js, build_func, year, series_key, league_name, all_players):
+def _parse_page(page, extract_js, build_func, year, series_key, league_name, all_players, seen):
     res = page.evaluate(extract_js)
     if "error" in res:
         logger.warning("      ⚠️ 테이블 못찾음: %s", res["error"])
         return True
     for r in res["results"]:
+        # A pager postback that re-renders an earlier page re-emits rows already parsed for this team.
+        if r["player_id"] in seen:
+            continue
+        seen.add(r["player_id"])
         team_code = resolve_team_code(r["team_name"], year) or r["team_name"]
         data = build_func(
             cells=r["cells"],
@@ -271,32 +280,40 @@ def _parse_page(page, extract_js, build_func, year, series_key, league_name, all
     return False
 
 
-def _go_to_next_page(page, page_num):
+def _postback(page, action, policy=None):
+    return wait_for_postback(page, action, policy, timeout=TABLE_WAIT_TIMEOUT_MS)
+
+
+def _go_to_next_page(page, page_num, policy=None):
     next_page_num = page_num + 1
-    sel = f'#cphContents_cphContents_cphContents_udpRecord .paging a[id*="btnNo{next_page_num}"]'
-    if not page.query_selector(sel):
-        sel = f'.paging a[href*="btnNo{next_page_num}"]'
-    btn = page.query_selector(sel)
-    if not btn:
-        return None
-    first_player_before = page.evaluate(
-        "() => document.querySelector('table.tData01 tbody tr td:nth-child(2)')?.innerText.trim()",
+    # One selector list instead of probing the id match and href match separately.
+    sel = (
+        f'#cphContents_cphContents_cphContents_udpRecord .paging a[id*="btnNo{next_page_num}"], '
+        f'.paging a[href*="btnNo{next_page_num}"]'
     )
-    btn.click()
-    try:
-        page.wait_for_function(
-            "oldName => document.querySelector('table.tData01 tbody tr td:nth-child(2)')?.innerText.trim() !== oldName",
-            arg=first_player_before,
-            timeout=5000,
-        )
-    except CRAWLER_EXCEPTIONS:
-        logger.debug("Timed out waiting for next page table update; continuing")
+    # Locators resolve on use, so no ElementHandle is left pinned in the page between postbacks.
+    btn = page.locator(sel).first
+    if not btn.count():
+        return None
+    _postback(page, btn.click, policy)
     return next_page_num
 
 
-def crawl_stats_for_year(page, year, mode="batting"):
+def _reset_to_first_page(page, policy=None):
+    page1_btn = page.locator('.paging a[id*="btnNo1"]').first
+    if not page1_btn.count():
+        return
+    # The team select postback already renders page 1, so only post back when another page is current.
+    if "on" in (page1_btn.get_attribute("class") or "").split():
+        return
+    _postback(page, page1_btn.click, policy)
+
+
+def crawl_stats_for_year(page, year, mode="batting", policy=None):
     """Crawls stats for a specific year and mode (batting/pitching)."""
-    series_key, league_name, extract_js, build_func = _setup_page(page, year, mode)
+    # Every navigation and postback is paced like the other KBO crawlers.
+    policy = policy or RequestPolicy()
+    series_key, league_name, extract_js, build_func = _setup_page(page, year, mode, policy)
     logger.info("📡 %s년 %s 데이터 크롤링 시작", year, mode)
 
     try:
@@ -309,24 +326,19 @@ def crawl_stats_for_year(page, year, mode="batting"):
         all_players: dict[int, dict] = {}
 
         for tm in teams:
-            page.select_option(team_selector, tm["value"])
-            page.wait_for_load_state("networkidle")
-            time.sleep(1.5)
-            page1_btn = page.query_selector('.paging a[id*="btnNo1"]')
-            if page1_btn:
-                page1_btn.click()
-                page.wait_for_load_state("networkidle")
-                time.sleep(1)
+            _postback(page, lambda value=tm["value"]: page.select_option(team_selector, value), policy)
+            _reset_to_first_page(page, policy)
 
             page_num = 1
+            seen: set[int] = set()
             while True:
                 try:
-                    if _parse_page(page, extract_js, build_func, year, series_key, league_name, all_players):
+                    if _parse_page(page, extract_js, build_func, year, series_key, league_name, all_players, seen):
                         break
                 except CRAWLER_EXCEPTIONS as e:
                     logger.warning("      ⚠️ 파싱 에러: %s", e)
 
-                next_pn = _go_to_next_page(page, page_num)
+                next_pn = _go_to_next_page(page, page_num, policy)
                 if next_pn is None:
                     break
                 page_num = next_pn
@@ -337,37 +349,77 @@ def crawl_stats_for_year(page, year, mode="batting"):
         return []
 
 
-def main():
-    years = list(range(2002, 2010))  # 2002 ~ 2009
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+# Parallel year lanes are opt-in (--workers); each lane paces its own requests.
+YEAR_WORKERS = 1
 
+
+def _crawl_years(years, results):
+    """Crawl a lane of years on this thread's own browser and queue each year's rows."""
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        )
-        page = context.new_page()
+        try:
+            page = browser.new_context(user_agent=USER_AGENT).new_page()
+            policy = RequestPolicy()
+            for year in years:
+                logger.info("🗓️ YEAR %s Handling...", year)
+                batting_data = crawl_stats_for_year(page, year, "batting", policy)
+                pitching_data = crawl_stats_for_year(page, year, "pitching", policy)
+                results.put((year, batting_data, pitching_data))
+        finally:
+            browser.close()
+
+
+def _save_year(year, batting_data, pitching_data):
+    # 1. Batting
+    if batting_data:
+        save_batting_stats_safe(batting_data)
+        logger.info("✅ %s년 타자 데이터 %s건 저장 완료", year, len(batting_data))
+    else:
+        logger.warning("⚠️ %s년 타자 데이터 없음", year)
 
-        for year in years:
-            logger.info("🗓️ YEAR %s Handling...", year)
+    # 2. Pitching
+    if pitching_data:
+        save_pitching_stats_safe(pitching_data)
+        logger.info("✅ %s년 투수 데이터 %s건 저장 완료", year, len(pitching_data))
+    else:
+        logger.warning("⚠️ %s년 투수 데이터 없음", year)
 
-            # 1. Batting
-            batting_data = crawl_stats_for_year(page, year, "batting")
-            if batting_data:
-                save_batting_stats_safe(batting_data)
-                logger.info("✅ %s년 타자 데이터 %s건 저장 완료", year, len(batting_data))
-            else:
-                logger.warning("⚠️ %s년 타자 데이터 없음", year)
 
-            # 2. Pitching
-            pitching_data = crawl_stats_for_year(page, year, "pitching")
-            if pitching_data:
-                save_pitching_stats_safe(pitching_data)
-                logger.info("✅ %s년 투수 데이터 %s건 저장 완료", year, len(pitching_data))
-            else:
-                logger.warning("⚠️ %s년 투수 데이터 없음", year)
+def main(workers=YEAR_WORKERS):
+    years = list(range(2002, 2010))  # 2002 ~ 2009
 
-        browser.close()
+    # Each worker thread drives its own sync Playwright instance over a lane of years;
+    # saves stay on the main thread so DB writes are never concurrent.
+    workers = max(1, min(workers, len(years)))
+    lanes = [years[i::workers] for i in range(workers)]
+    results: Queue = Queue()
+    with ThreadPoolExecutor(max_workers=len(lanes)) as pool:
+        futures = [pool.submit(_crawl_years, lane, results) for lane in lanes]
+        pending = len(years)
+        while pending:
+            try:
+                year, batting_data, pitching_data = results.get(timeout=1)
+            except Empty:
+                if all(future.done() for future in futures) and results.empty():
+                    break
+                continue
+            _save_year(year, batting_data, pitching_data)
+            pending -= 1
+        for future in futures:
+            future.result()
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="KBO 2002-2009 batting/pitching stats crawler")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=YEAR_WORKERS,
+        help="연도 묶음별 병렬 브라우저(스레드) 수 (기본값: 1, 순차)",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    main()
+    main(workers=_parse_args().workers)
@@ -9,7 +9,7 @@ import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, Self
 
 from src.constants import GAME_ID_FULL_LEN, GAME_ID_MIN_LEN, GAME_ID_YEAR_LEN, KST, MAX_INNINGS
 
@@ -20,7 +20,6 @@ RHE_COLUMN_COUNT = 3
 MIN_SCOREBOARD_CELL_COUNT = RHE_COLUMN_COUNT + 1
 RHE_HITS_INDEX = 1
 RHE_ERRORS_INDEX = 2
-DURATION_PART_COUNT = 2
 PARK_JUNYOUNG_RESOLUTION_ROW_THRESHOLD = 4
 PARK_JUNYOUNG_ERA_THRESHOLD = 3.0
 PARK_JUNYOUNG_SPECIAL_SEASON = 2026
@@ -41,6 +40,10 @@ from src.utils.request_policy import RequestPolicy
 from src.utils.team_codes import normalize_kbo_game_id, resolve_team_code, team_code_from_game_id_segment
 from src.utils.type_helpers import parse_innings_to_outs, safe_int_or_none
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
 HITTER_HEADER_MAP = {
     "타석": "plate_appearances",
     "타수": "at_bats",
@@ -93,8 +96,31 @@ PITCHER_HEADER_MAP = {
 }
 
 
+# Box score extraction only reads DOM text, so headshots, logos, ads, webfonts
+# and stylesheets are dead weight on every REVIEW/LINEUP navigation.
+GAME_DETAIL_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
 HITTER_FLOAT_KEYS = {"avg", "obp", "slg", "ops", "iso", "babip"}
 PITCHER_FLOAT_KEYS = {"era", "whip", "fip", "k_per_nine", "bb_per_nine", "kbb"}
+
+
+def _parse_stat_float(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# Header -> (stat key, parser), resolved once so each cell costs a single lookup.
+_HITTER_PARSERS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    header: (key, _parse_stat_float if key in HITTER_FLOAT_KEYS else safe_int_or_none)
+    for header, key in HITTER_HEADER_MAP.items()
+}
+_PITCHER_PARSERS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    header: (key, _parse_stat_float if key in PITCHER_FLOAT_KEYS else safe_int_or_none)
+    for header, key in PITCHER_HEADER_MAP.items()
+}
+_PITCHER_PARSERS["이닝"] = ("innings_outs", parse_innings_to_outs)
 DETAIL_CRAWLER_EXCEPTIONS = (
     PlaywrightError,
     TimeoutError,
@@ -124,6 +150,305 @@ TEAM_CODE_TO_NAME: dict[str, str] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Extraction JS - runs in browser context
+# ---------------------------------------------------------------------------
+_LIVE_SCORES_JS = """
+(function() {
+    var selected = document.querySelector('li.game-cont.on');
+    if (!selected) return null;
+    var info = selected.querySelector('.info');
+    if (!info) return null;
+    var teams = info.querySelectorAll('[class*="team"]');
+    if (teams.length < 2) return null;
+    var away = teams[0];
+    var home = teams[1];
+    var awayScore = away.querySelector('.score');
+    var homeScore = home.querySelector('.score');
+    var awayName = away.querySelector('img');
+    var homeName = home.querySelector('img');
+    return {
+        away: {
+            code: awayName ? (awayName.alt || '').toUpperCase() : '',
+            name: awayName ? (awayName.alt || '') : '',
+            score: awayScore ? parseInt(awayScore.innerText.trim(), 10) : null,
+        },
+        home: {
+            code: homeName ? (homeName.alt || '').toUpperCase() : '',
+            name: homeName ? (homeName.alt || '') : '',
+            score: homeScore ? parseInt(homeScore.innerText.trim(), 10) : null,
+        }
+    };
+})()
+"""
+
+_TEAM_INFO_JS = r"""
+() => {
+    const getRows = (t, extractTh) => Array.from(t.querySelectorAll('tbody tr')).map(tr =>
+        Array.from(tr.querySelectorAll(extractTh ? 'td, th' : 'td')).map(td => {
+            const img = td.querySelector('img');
+            if (img && img.alt) return img.alt;
+            if (img && img.src && img.src.includes('team')) {
+                const match = img.src.match(/\/([A-Z]{2})\.png/i);
+                if (match) return match[1];
+            }
+            const clone = td.cloneNode(true);
+            Array.from(clone.querySelectorAll('span, em, strong, p')).forEach(el => {
+                const txt = (el.textContent || '').trim();
+                if (['승', '패', '무', '세'].includes(txt)) {
+                    el.remove();
+                }
+            });
+            let text = (clone.textContent || '').replace(/\u00a0/g, ' ').trim();
+            text = text.replace(/^[승패무세]\s*/, '').replace(/\s*[승패무세]$/, '').trim();
+            text = text.replace(/[\d]+승\s*[\d]+패\s*[\d]+무/, '').trim();
+            return text;
+        }).filter(text => text !== '')
+    );
+
+    let teamTable = document.getElementById('tblScordboard1') || document.getElementById('tblScoreboard1');
+    let inningTable = document.getElementById('tblScordboard2') || document.getElementById('tblScoreboard2');
+    let totalTable = document.getElementById('tblScordboard3') || document.getElementById('tblScoreboard3');
+
+    if (teamTable && inningTable && totalTable) {
+        const teamRows = getRows(teamTable, true);
+        const inningRows = getRows(inningTable, false);
+        const totalRows = getRows(totalTable, false);
+
+        if (teamRows.length >= 2 && inningRows.length >= 2 && totalRows.length >= 2) {
+            const headers = [
+                "TEAM", ...Array.from({length: inningRows[0].length}, (_,k)=>String(k+1)),
+                "R", "H", "E"
+            ];
+            const rows = [];
+            for (let i=0; i<2; i++) {
+                const teamName = teamRows[i][0] || "Unknown";
+                const innings = inningRows[i];
+                const totals = totalRows[i].slice(0, 3);
+                rows.push([teamName, ...innings, ...totals]);
+            }
+            return { headers, rows };
+        }
+    }
+
+    const tables = Array.from(document.querySelectorAll('table'));
+    teamTable = null; inningTable = null; totalTable = null;
+
+    for (const table of tables) {
+        const headers = Array.from(table.querySelectorAll('thead th')).map(
+            th => (th.textContent || '').replace(/\u00a0/g, ' ').trim().toUpperCase()
+        );
+
+        if (!teamTable && (
+            headers.some(h => h.includes('TEAM')) || headers.includes('팀') || headers.includes('\u00a0')
+        )) {
+            if (headers.length <= 4) teamTable = table;
+        }
+        if (!inningTable && headers.includes('1') && headers.includes('2') && headers.includes('3')) {
+            inningTable = table;
+        }
+        if (!totalTable && headers.includes('R') && headers.includes('H')) totalTable = table;
+    }
+
+    if (!teamTable || !inningTable || !totalTable) return null;
+
+    const getRowsFallback = (t) => Array.from(t.querySelectorAll('tbody tr')).map(tr =>
+        Array.from(tr.querySelectorAll('td')).map(td => {
+            const img = td.querySelector('img');
+            if (img && img.alt) return img.alt;
+            if (img && img.src && img.src.includes('team')) {
+                const match = img.src.match(/\/([A-Z]{2})\.png/i);
+                if (match) return match[1];
+            }
+            const clone = td.cloneNode(true);
+            Array.from(clone.querySelectorAll('span, em, strong, p')).forEach(el => {
+                const txt = (el.textContent || '').trim();
+                if (['승', '패', '무', '세'].includes(txt)) {
+                    el.remove();
+                }
+            });
+            let text = (clone.textContent || '').replace(/\u00a0/g, ' ').trim();
+            // Keep the record part if it looks like "X승 Y패 Z무" to avoid total wipe
+            if (text.includes('승') && text.includes('패')) {
+                 // Don't treat this as the team name if possible
+                 return "";
+            }
+            text = text.replace(/^[승패무세]\s*/, '').replace(/\s*[승패무세]$/, '').trim();
+            return text;
+        })
+    );
+
+    const teamRows = getRowsFallback(teamTable);
+    const inningRows = getRowsFallback(inningTable);
+    const totalRows = getRowsFallback(totalTable);
+
+    if (teamRows.length >= 2 && inningRows.length >= 2 && totalRows.length >= 2) {
+        const headers = [
+            "TEAM", ...Array.from({length: inningRows[0].length}, (_,k)=>String(k+1)),
+            "R", "H", "E"
+        ];
+        const rows = [];
+        for (let i=0; i<2; i++) {
+            let teamName = teamRows[i][0] || "";
+            if (teamName === "TEAM") teamName = ""; // Skip header re-read
+            const innings = inningRows[i];
+            const totals = totalRows[i].slice(0, 3);
+            rows.push([teamName, ...innings, ...totals]);
+        }
+        return { headers, rows };
+    }
+    return null;
+}
+"""
+
+_TABLE_ROWS_JS = r"""
+(sel) => {
+    const PLAYER_ID_RE = /(?:playerId|p_id|pCode|pcode|id)=(\d+)/i;
+    const DIGITS_RE = /^\d+$/;
+    const table = document.querySelector(sel);
+    if (!table) return [];
+    const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
+
+    // Find '선수명' index
+    let nameIndex = -1;
+    for (let i = 0; i < headers.length; i++) {
+        if (headers[i] === '선수명') {
+            nameIndex = i;
+            break;
+        }
+    }
+
+    return Array.from(table.querySelectorAll('tbody tr')).map((tr, index) => {
+        const cells = Array.from(tr.querySelectorAll('th,td'));
+        const values = {};
+        for (let i = 0; i < cells.length; i++) {
+            const header = headers[i] || `COL_${i}`;
+            values[header] = cells[i].textContent.trim();
+        }
+        const link = tr.querySelector(
+            'a[href*="playerId="], a[href*="p_id="], a[href*="pCode="], '
+            + 'a[href*="pcode="], a[href*="PlayerDetail"]'
+        );
+        let playerId = null;
+        let playerName = null;
+        let uniformNo = null;
+
+        // Try to find uniform number in the first cell or a cell with specific header
+        if (cells.length > 0) {
+            const firstVal = cells[0].textContent.trim();
+            if (DIGITS_RE.test(firstVal)) {
+                uniformNo = firstVal;
+            }
+        }
+
+        if (link) {
+            playerName = link.textContent.trim();
+            const href = link.getAttribute('href');
+            try {
+                const url = new URL(href, window.location.origin);
+                playerId = url.searchParams.get('playerId') ||
+                           url.searchParams.get('p_id') ||
+                           url.searchParams.get('pCode') ||
+                           url.searchParams.get('pcode');
+            } catch (e) {
+                playerId = null;
+            }
+            if (!playerId && href) {
+                const m = PLAYER_ID_RE.exec(href);
+                playerId = m ? m[1] : null;
+            }
+        }
+
+        // Fallback: Use name column if link not found
+        if (!playerName && nameIndex !== -1 && cells.length > nameIndex) {
+            playerName = cells[nameIndex].textContent.trim();
+        }
+
+        return { index, cells: values, playerId, playerName, uniformNo };
+    });
+}
+"""
+
+_SUMMARY_JS = r"""
+(sel) => {
+    const table = document.querySelector(sel);
+    if (!table) return [];
+
+    const results = [];
+    const rows = table.querySelectorAll('tbody tr');
+
+    rows.forEach(tr => {
+        const th = tr.querySelector('th');
+        const td = tr.querySelector('td');
+        if (th && td) {
+            const category = (th.textContent || '').trim();
+            const content = (td.textContent || '').trim();
+            if (content && content !== '없음') {
+                 results.push({
+                     'summary_type': category,
+                     'detail_text': content
+                 });
+            }
+        }
+    });
+    return results;
+}
+"""
+
+_ROSTER_JS = r"""
+() => {
+    const PLAYER_ID_RE = /(?:playerId|p_id|pCode|pcode|id)=(\d+)/i;
+    const UNIFORM_RE = /No\.(\d+)/;
+    const map = {};
+    const addToMap = (name, id, uniform) => {
+        const cleanName = name.trim();
+        if (!cleanName) return;
+
+        if (!map[cleanName]) {
+            map[cleanName] = [];
+        }
+
+        // Avoid duplicates
+        const exists = map[cleanName].some(p => p.id === id);
+        if (!exists) {
+            map[cleanName].push({id, uniform});
+        }
+    };
+
+    // Find all anchor tags that look like player links
+    const links = document.querySelectorAll(
+        'a[href*="PlayerDetail"], a[href*="playerId="], a[href*="p_id="], '
+        + 'a[href*="pCode="], a[href*="pcode="]'
+    );
+
+    links.forEach(a => {
+        const name = a.textContent.trim();
+        const href = a.getAttribute('href');
+        if (!href) return;
+
+        const idMatch = PLAYER_ID_RE.exec(href);
+        if (name && idMatch) {
+            let uniform = null;
+
+            // strategy 1: Check nearby lists or text for "No.XX"
+            const parentLi = a.closest('li');
+            if (parentLi) {
+                const text = parentLi.textContent;
+                const uniMatch = UNIFORM_RE.exec(text);
+                if (uniMatch) uniform = uniMatch[1];
+            }
+
+            // strategy 2: Check previous sibling or parent structure (table columns)
+            // (Simplification: just take what we found)
+
+            addToMap(name, idMatch[1], uniform);
+        }
+    });
+    return map;
+}
+"""
+
+
 def _team_code_to_name(code: str) -> str:
     return TEAM_CODE_TO_NAME.get(code.upper(), code)
 
@@ -244,6 +569,52 @@ class GameDetailCrawler:
         """
         return self._last_failure_reason.get(game_id)
 
+    async def __aenter__(self) -> Self:
+        """Enters the async runtime context."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Exit the async runtime context.
+
+        Args:
+            exc_type: Exc Type.
+            exc: Exc.
+            tb: Tb.
+
+        """
+        await self.close()
+
+    async def start(self, concurrency: int | None = None) -> None:
+        """Launch the shared browser pool reused by subsequent crawl calls.
+
+        Args:
+            concurrency: Number of pages to open when creating the pool.
+
+        """
+        if self.pool is None:
+            max_pages = concurrency or int(os.getenv("KBO_GAME_DETAIL_CONCURRENCY", "3"))
+            self.pool = self._build_pool(max(1, max_pages))
+        await self.pool.start()
+
+    @staticmethod
+    def _build_pool(max_pages: int) -> AsyncPlaywrightPool:
+        """Build a page pool that skips assets irrelevant to box score extraction.
+
+        Args:
+            max_pages: Number of pages to keep in the pool.
+
+        Returns:
+            AsyncPlaywrightPool instance.
+
+        """
+        return AsyncPlaywrightPool(max_pages=max_pages, blocked_resource_types=GAME_DETAIL_BLOCKED_RESOURCE_TYPES)
+
     async def close(self) -> None:
         """Handle the close operation."""
         if self.pool:
@@ -451,7 +822,7 @@ class GameDetailCrawler:
         max_concurrency = concurrency or int(os.getenv("KBO_GAME_DETAIL_CONCURRENCY", "3"))
         max_concurrency = max(1, min(max_concurrency, len(games)))
 
-        pool = self.pool or AsyncPlaywrightPool(max_pages=max_concurrency)
+        pool = self.pool or self._build_pool(max_concurrency)
         owns_pool = self.pool is None
         if self.pool:
             max_concurrency = min(max_concurrency, self.pool.max_pages)
@@ -1094,34 +1465,7 @@ class GameDetailCrawler:
 
     async def _extract_live_scores(self, page: Page) -> dict[str, dict[str, Any]] | None:
         try:
-            data = await page.evaluate("""
-            (function() {
-                var selected = document.querySelector('li.game-cont.on');
-                if (!selected) return null;
-                var info = selected.querySelector('.info');
-                if (!info) return null;
-                var teams = info.querySelectorAll('[class*="team"]');
-                if (teams.length < 2) return null;
-                var away = teams[0];
-                var home = teams[1];
-                var awayScore = away.querySelector('.score');
-                var homeScore = home.querySelector('.score');
-                var awayName = away.querySelector('img');
-                var homeName = home.querySelector('img');
-                return {
-                    away: {
-                        code: awayName ? (awayName.alt || '').toUpperCase() : '',
-                        name: awayName ? (awayName.alt || '') : '',
-                        score: awayScore ? parseInt(awayScore.innerText.trim(), 10) : null,
-                    },
-                    home: {
-                        code: homeName ? (homeName.alt || '').toUpperCase() : '',
-                        name: homeName ? (homeName.alt || '') : '',
-                        score: homeScore ? parseInt(homeScore.innerText.trim(), 10) : null,
-                    }
-                };
-            })()
-            """)
+            data = await page.evaluate(_LIVE_SCORES_JS)
             if not data or not data.get("away") or not data.get("home"):
                 return None
             if data["away"]["score"] is None and data["home"]["score"] is None:
@@ -1276,127 +1620,7 @@ class GameDetailCrawler:
             Dictionary mapping.
 
         """
-        script = r"""
-
-        () => {
-            const getRows = (t, extractTh) => Array.from(t.querySelectorAll('tbody tr')).map(tr =>
-                Array.from(tr.querySelectorAll(extractTh ? 'td, th' : 'td')).map(td => {
-                    const img = td.querySelector('img');
-                    if (img && img.alt) return img.alt;
-                    if (img && img.src && img.src.includes('team')) {
-                        const match = img.src.match(/\/([A-Z]{2})\.png/i);
-                        if (match) return match[1];
-                    }
-                    const clone = td.cloneNode(true);
-                    Array.from(clone.querySelectorAll('span, em, strong, p')).forEach(el => {
-                        const txt = (el.textContent || '').trim();
-                        if (['승', '패', '무', '세'].includes(txt)) {
-                            el.remove();
-                        }
-                    });
-                    let text = (clone.textContent || '').replace(/\u00a0/g, ' ').trim();
-                    text = text.replace(/^[승패무세]\s*/, '').replace(/\s*[승패무세]$/, '').trim();
-                    text = text.replace(/[\d]+승\s*[\d]+패\s*[\d]+무/, '').trim();
-                    return text;
-                }).filter(text => text !== '')
-            );
-
-            let teamTable = document.getElementById('tblScordboard1') || document.getElementById('tblScoreboard1');
-            let inningTable = document.getElementById('tblScordboard2') || document.getElementById('tblScoreboard2');
-            let totalTable = document.getElementById('tblScordboard3') || document.getElementById('tblScoreboard3');
-
-            if (teamTable && inningTable && totalTable) {
-                const teamRows = getRows(teamTable, true);
-                const inningRows = getRows(inningTable, false);
-                const totalRows = getRows(totalTable, false);
-
-                if (teamRows.length >= 2 && inningRows.length >= 2 && totalRows.length >= 2) {
-                    const headers = [
-                        "TEAM", ...Array.from({length: inningRows[0].length}, (_,k)=>String(k+1)),
-                        "R", "H", "E"
-                    ];
-                    const rows = [];
-                    for (let i=0; i<2; i++) {
-                        const teamName = teamRows[i][0] || "Unknown";
-                        const innings = inningRows[i];
-                        const totals = totalRows[i].slice(0, 3);
-                        rows.push([teamName, ...innings, ...totals]);
-                    }
-                    return { headers, rows };
-                }
-            }
-
-            const tables = Array.from(document.querySelectorAll('table'));
-            teamTable = null; inningTable = null; totalTable = null;
-
-            for (const table of tables) {
-                const headers = Array.from(table.querySelectorAll('thead th')).map(
-                    th => (th.textContent || '').replace(/\u00a0/g, ' ').trim().toUpperCase()
-                );
-
-                if (!teamTable && (
-                    headers.some(h => h.includes('TEAM')) || headers.includes('팀') || headers.includes('\u00a0')
-                )) {
-                    if (headers.length <= 4) teamTable = table;
-                }
-                if (!inningTable && headers.includes('1') && headers.includes('2') && headers.includes('3')) {
-                    inningTable = table;
-                }
-                if (!totalTable && headers.includes('R') && headers.includes('H')) totalTable = table;
-            }
-
-            if (!teamTable || !inningTable || !totalTable) return null;
-
-            const getRowsFallback = (t) => Array.from(t.querySelectorAll('tbody tr')).map(tr =>
-                Array.from(tr.querySelectorAll('td')).map(td => {
-                    const img = td.querySelector('img');
-                    if (img && img.alt) return img.alt;
-                    if (img && img.src && img.src.includes('team')) {
-                        const match = img.src.match(/\/([A-Z]{2})\.png/i);
-                        if (match) return match[1];
-                    }
-                    const clone = td.cloneNode(true);
-                    Array.from(clone.querySelectorAll('span, em, strong, p')).forEach(el => {
-                        const txt = (el.textContent || '').trim();
-                        if (['승', '패', '무', '세'].includes(txt)) {
-                            el.remove();
-                        }
-                    });
-                    let text = (clone.textContent || '').replace(/\u00a0/g, ' ').trim();
-                    // Keep the record part if it looks like "X승 Y패 Z무" to avoid total wipe
-                    if (text.includes('승') && text.includes('패')) {
-                         // Don't treat this as the team name if possible
-                         return "";
-                    }
-                    text = text.replace(/^[승패무세]\s*/, '').replace(/\s*[승패무세]$/, '').trim();
-                    return text;
-                })
-            );
-
-            const teamRows = getRowsFallback(teamTable);
-            const inningRows = getRowsFallback(inningTable);
-            const totalRows = getRowsFallback(totalTable);
-
-            if (teamRows.length >= 2 && inningRows.length >= 2 && totalRows.length >= 2) {
-                const headers = [
-                    "TEAM", ...Array.from({length: inningRows[0].length}, (_,k)=>String(k+1)),
-                    "R", "H", "E"
-                ];
-                const rows = [];
-                for (let i=0; i<2; i++) {
-                    let teamName = teamRows[i][0] || "";
-                    if (teamName === "TEAM") teamName = ""; // Skip header re-read
-                    const innings = inningRows[i];
-                    const totals = totalRows[i].slice(0, 3);
-                    rows.push([teamName, ...innings, ...totals]);
-                }
-                return { headers, rows };
-            }
-            return null;
-        }
-        """
-
-        result = await page.evaluate(script)
+        result = await page.evaluate(_TEAM_INFO_JS)
 
         away_info: dict[str, Any] | None
         home_info: dict[str, Any] | None
@@ -1480,23 +1704,25 @@ class GameDetailCrawler:
             is_pitcher=False,
         )
         if p_id:
-            logger.info("   [RESOLVED] %s (%s) -> %s", player_name, team_code, p_id)
+            logger.debug("   [RESOLVED] %s (%s) -> %s", player_name, team_code, p_id)
         return p_id
 
     @staticmethod
     def _select_hitter_extra_row(
         *,
         extra_has_names: bool,
-        extra_map: dict[str, dict[str, Any]],
         extra_rows: list[dict[str, Any]],
         player_name: str,
         idx: int,
     ) -> dict[str, Any] | None:
         """Handle the select hitter extra row operation.
 
+        The extra hitter table lists the same players in the same order as the
+        primary table, so rows are joined by position. A name scan is only used
+        when the positional row carries a different player name.
+
         Args:
             extra_has_names: Extra Has Names.
-            extra_map: Extra Map.
             extra_rows: Extra Rows.
             player_name: Player Name.
             idx: Idx.
@@ -1505,10 +1731,11 @@ class GameDetailCrawler:
             The result of the operation.
 
         """
-        if extra_has_names:
-            return extra_map.get(player_name)
         base_idx = idx - 1
-        return extra_rows[base_idx] if base_idx < len(extra_rows) else None
+        candidate = extra_rows[base_idx] if base_idx < len(extra_rows) else None
+        if not extra_has_names or (candidate is not None and candidate.get("playerName") == player_name):
+            return candidate
+        return next((row for row in extra_rows if row.get("playerName") == player_name), None)
 
     @staticmethod
     def _apply_hitter_inning_derivatives(stats: dict[str, Any], inning_rows: list[dict[str, Any]], idx: int) -> None:
@@ -1624,10 +1851,6 @@ class GameDetailCrawler:
 
         extra_has_names = any(r.get("playerName") for r in extra_rows)
 
-        extra_map = {}
-        if extra_has_names:
-            extra_map = {row["playerName"]: row for row in extra_rows if row["playerName"]}
-
         results: list[dict[str, Any]] = []
         team_total_stats: dict[str, Any] = {}
 
@@ -1655,7 +1878,6 @@ class GameDetailCrawler:
 
             extra_row = self._select_hitter_extra_row(
                 extra_has_names=extra_has_names,
-                extra_map=extra_map,
                 extra_rows=extra_rows,
                 player_name=player_name,
                 idx=idx,
@@ -1804,7 +2026,7 @@ class GameDetailCrawler:
         if p_id is None:
             p_id = await self._search_and_register_pitcher(ctx.player_name, ctx.team_code)
         if p_id:
-            logger.info("   [RESOLVED] %s (%s) -> %s", ctx.player_name, ctx.team_code, p_id)
+            logger.debug("   [RESOLVED] %s (%s) -> %s", ctx.player_name, ctx.team_code, p_id)
         return p_id
 
     @staticmethod
@@ -1947,73 +2169,7 @@ class GameDetailCrawler:
         if not selector:
             return []
 
-        script = r"""
-        (sel) => {
-            const table = document.querySelector(sel);
-            if (!table) return [];
-            const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
-
-            // Find '선수명' index
-            let nameIndex = -1;
-            for (let i = 0; i < headers.length; i++) {
-                if (headers[i] === '선수명') {
-                    nameIndex = i;
-                    break;
-                }
-            }
-
-            return Array.from(table.querySelectorAll('tbody tr')).map((tr, index) => {
-                const cells = Array.from(tr.querySelectorAll('th,td'));
-                const values = {};
-                for (let i = 0; i < cells.length; i++) {
-                    const header = headers[i] || `COL_${i}`;
-                    values[header] = cells[i].textContent.trim();
-                }
-                const link = tr.querySelector(
-                    'a[href*="playerId="], a[href*="p_id="], a[href*="pCode="], '
-                    + 'a[href*="pcode="], a[href*="PlayerDetail"]'
-                );
-                let playerId = null;
-                let playerName = null;
-                let uniformNo = null;
-
-                // Try to find uniform number in the first cell or a cell with specific header
-                if (cells.length > 0) {
-                    const firstVal = cells[0].textContent.trim();
-                    if (/^\d+$/.test(firstVal)) {
-                        uniformNo = firstVal;
-                    }
-                }
-
-                if (link) {
-                    playerName = link.textContent.trim();
-                    const href = link.getAttribute('href');
-                    try {
-                        const url = new URL(href, window.location.origin);
-                        playerId = url.searchParams.get('playerId') ||
-                                   url.searchParams.get('p_id') ||
-                                   url.searchParams.get('pCode') ||
-                                   url.searchParams.get('pcode');
-                    } catch (e) {
-                        playerId = null;
-                    }
-                    if (!playerId && href) {
-                        const m = href.match(/(?:playerId|p_id|pCode|pcode|id)=(\d+)/i);
-                        playerId = m ? m[1] : null;
-                    }
-                }
-
-                // Fallback: Use name column if link not found
-                if (!playerName && nameIndex !== -1 && cells.length > nameIndex) {
-                    playerName = cells[nameIndex].textContent.trim();
-                }
-
-                return { index, cells: values, playerId, playerName, uniformNo };
-            });
-        }
-        """
-
-        return await page.evaluate(script, selector)
+        return await page.evaluate(_TABLE_ROWS_JS, selector)
 
     async def _extract_game_summary(self, page: Page) -> list[dict[str, str]]:
         """Extract game summary details from #tblEtc (Winning hit, HR, Errors, Umpires, etc.).
@@ -2027,32 +2183,7 @@ class GameDetailCrawler:
         if not await page.query_selector(selector):
             return []
 
-        script = r"""
-        (sel) => {
-            const table = document.querySelector(sel);
-            if (!table) return [];
-
-            const results = [];
-            const rows = table.querySelectorAll('tbody tr');
-
-            rows.forEach(tr => {
-                const th = tr.querySelector('th');
-                const td = tr.querySelector('td');
-                if (th && td) {
-                    const category = (th.textContent || '').trim();
-                    const content = (td.textContent || '').trim();
-                    if (content && content !== '없음') {
-                         results.push({
-                             'summary_type': category,
-                             'detail_text': content
-                         });
-                    }
-                }
-            });
-            return results;
-        }
-        """
-        return await page.evaluate(script, selector)
+        return await page.evaluate(_SUMMARY_JS, selector)
 
     async def _load_roster_map_from_lineup(
         self,
@@ -2202,19 +2333,16 @@ class GameDetailCrawler:
 
         """
         for header, value in cells.items():
-            key = HITTER_HEADER_MAP.get(header)
-            if not key:
+            parser = _HITTER_PARSERS.get(header)
+            if parser is None:
                 extras.setdefault(header, value)
                 continue
             if value in ("", "-", None):
                 continue
-            if key in HITTER_FLOAT_KEYS:
-                try:
-                    stats[key] = float(value)
-                except ValueError:
-                    continue
-            else:
-                stats[key] = safe_int_or_none(value)
+            key, parse = parser
+            parsed = parse(value)
+            if parsed is not None:
+                stats[key] = parsed
 
     @staticmethod
     def _populate_pitcher_stats(stats: dict[str, Any], extras: dict[str, Any], cells: dict[str, str]) -> None:
@@ -2230,21 +2358,16 @@ class GameDetailCrawler:
 
         """
         for header, value in cells.items():
-            key = PITCHER_HEADER_MAP.get(header)
-            if not key:
+            parser = _PITCHER_PARSERS.get(header)
+            if parser is None:
                 extras.setdefault(header, value)
                 continue
             if value in ("", "-", None):
                 continue
-            if key in PITCHER_FLOAT_KEYS:
-                try:
-                    stats[key] = float(value)
-                except ValueError:
-                    continue
-            elif key == "innings":
-                stats["innings_outs"] = parse_innings_to_outs(value)
-            else:
-                stats[key] = safe_int_or_none(value)
+            key, parse = parser
+            parsed = parse(value)
+            if parsed is not None:
+                stats[key] = parsed
 
     def _parse_scoreboard_row(
         self,
@@ -2386,13 +2509,11 @@ class GameDetailCrawler:
         """
         if not duration:
             return None
-        parts = duration.strip().split(":")
-        if len(parts) != DURATION_PART_COUNT:
+        hours, sep, minutes = duration.strip().partition(":")
+        if not sep or ":" in minutes:
             return None
         try:
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            return hours * 60 + minutes
+            return int(hours) * 60 + int(minutes)
         except ValueError:
             return None
 
@@ -2408,8 +2529,12 @@ class GameDetailCrawler:
             The result of the operation.
 
         """
-        digits = "".join(ch for ch in str(game_date) if ch.isdigit())
+        text = str(game_date)
+        prefix = text[:GAME_ID_YEAR_LEN]
+        if len(prefix) == GAME_ID_YEAR_LEN and prefix.isascii() and prefix.isdigit():
+            return int(prefix)
 
+        digits = "".join(ch for ch in text if ch.isdigit())
         if len(digits) >= GAME_ID_YEAR_LEN:
             try:
                 return int(digits[:GAME_ID_YEAR_LEN])
@@ -2425,60 +2550,9 @@ class GameDetailCrawler:
         Args:
             page: Page.
 
-        """
-        script = r"""
-
-        () => {
-            const map = {};
-            const addToMap = (name, id, uniform) => {
-                const cleanName = name.trim();
-                if (!cleanName) return;
-
-                if (!map[cleanName]) {
-                    map[cleanName] = [];
-                }
-
-                // Avoid duplicates
-                const exists = map[cleanName].some(p => p.id === id);
-                if (!exists) {
-                    map[cleanName].push({id, uniform});
-                }
-            };
-
-            // Find all anchor tags that look like player links
-            const links = document.querySelectorAll(
-                'a[href*="PlayerDetail"], a[href*="playerId="], a[href*="p_id="], '
-                + 'a[href*="pCode="], a[href*="pcode="]'
-            );
-
-            links.forEach(a => {
-                const name = a.textContent.trim();
-                const href = a.getAttribute('href');
-                if (!href) return;
-
-                const idMatch = href.match(/(?:playerId|p_id|pCode|pcode|id)=(\d+)/i);
-                if (name && idMatch) {
-                    let uniform = null;
-
-                    // strategy 1: Check nearby lists or text for "No.XX"
-                    const parentLi = a.closest('li');
-                    if (parentLi) {
-                        const text = parentLi.textContent;
-                        const uniMatch = text.match(/No\.(\d+)/);
-                        if (uniMatch) uniform = uniMatch[1];
-                    }
-
-                    // strategy 2: Check previous sibling or parent structure (table columns)
-                    // (Simplification: just take what we found)
-
-                    addToMap(name, idMatch[1], uniform);
-                }
-            });
-            return map;
-        }
         """
         try:
-            return await page.evaluate(script)
+            return await page.evaluate(_ROSTER_JS)
         except PlaywrightError as e:
             logger.warning("Error executing roster extraction script: %s", e, exc_info=True)
             return {}
@@ -2500,8 +2574,8 @@ async def main() -> None:  # pragma: no cover
     game_date = args.date or game_id[:8]
 
     logger.info("🚀 Starting crawl for game %s (%s)...", game_id, game_date)
-    crawler = GameDetailCrawler()
-    game_data = await crawler.crawl_game(game_id, game_date)
+    async with GameDetailCrawler() as crawler:
+        game_data = await crawler.crawl_game(game_id, game_date)
     if game_data and args.save:
         logger.info(
             "Direct --save is intended for one-off parser checks. "
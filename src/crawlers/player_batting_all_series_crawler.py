@@ -15,14 +15,18 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import logging
 import os
 import re
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from playwright.sync_api import ElementHandle, Page, sync_playwright
+from playwright.sync_api import Browser, Page, sync_playwright
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from sqlalchemy.exc import SQLAlchemyError
@@ -37,21 +41,110 @@ from src.repositories.safe_batting_repository import save_batting_stats_safe
 from src.urls import HITTER_BASIC1
 from src.utils.compliance import compliance
 from src.utils.fallback_monitor import FallbackMonitor
+from src.utils.page_cache import PAGE_CACHE_ENABLED, PageCacheKey, get_cached_rows, put_cached_rows
 from src.utils.player_season_stat_validation import filter_valid_season_stat_payloads
-from src.utils.player_stats_helpers import extract_rows_fast
-from src.utils.playwright_blocking import install_sync_resource_blocking
-from src.utils.playwright_retry import NAV_TIMEOUT, SEL_TIMEOUT, retry_navigation, retry_wait_for_selector
+from src.utils.playwright_blocking import TABLE_ONLY_BLOCKED_RESOURCE_TYPES, install_sync_resource_blocking
+from src.utils.playwright_helpers import select_option_if_changed, wait_for_postback
+from src.utils.playwright_retry import (
+    NAV_TIMEOUT,
+    SEL_TIMEOUT,
+    SHORT_TIMEOUT,
+    retry_navigation,
+    retry_wait_for_selector,
+)
 from src.utils.request_policy import RequestPolicy
 from src.utils.team_codes import resolve_team_code
-from src.utils.team_mapping import get_team_code, get_team_mapping_for_year
 
 logger = logging.getLogger(__name__)
 
 MIN_BATTING_TABLE_CELLS = 10
-MIN_LEGACY_ROW_CELLS = 5
 PLAYER_NAME_CELL_INDEX = 1
 TEAM_NAME_CELL_INDEX = 2
-DEBUG_ROW_LIMIT = 3
+PLAYER_ID_PATTERN = re.compile(r"playerId=(\d+)")
+# KBO_FAST_PARSE=0이면 page.evaluate 일괄 추출 대신 DOM 순회 파서를 사용 (import 시 한 번만 읽음)
+FAST_PARSE_ENABLED = os.getenv("KBO_FAST_PARSE", "1") != "0"
+
+SEASON_SELECTOR = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeason$ddlSeason"]'
+SERIES_SELECTOR = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeries$ddlSeries"]'
+TEAM_SELECTOR = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlTeam$ddlTeam"]'
+TEAM_OPTION_SELECTOR = f"{TEAM_SELECTOR} option"
+PA_SORT_LINK_SELECTOR = "a[href=\"javascript:sort('PA_CN');\"]"
+BASIC2_LINK_SELECTOR = 'a[href="/Record/Player/HitterBasic/Basic2.aspx"]'
+TABLE_HEADER_TEXTS_JS = "ths => ths.map(th => (th.textContent || '').trim())"
+# 느린(DOM) 경로에서도 행당 evaluate 한 번으로 셀 텍스트와 선수 링크를 함께 읽는다.
+LEGACY_ROW_JS = """
+(row, nameIndex) => {
+    const cells = Array.from(row.querySelectorAll('td'));
+    const link = cells[nameIndex] ? cells[nameIndex].querySelector('a') : null;
+    return {
+        cells: cells.map(td => (td.textContent || '').trim()),
+        linkHref: link ? link.getAttribute('href') : null,
+        linkText: link ? (link.textContent || '').trim() : null,
+    };
+}
+"""
+
+# 다음 페이지 버튼이 클릭 가능한지 (페이징 영역 존재, 버튼 존재, 비활성 아님) 한 번에 판정한다.
+NEXT_PAGE_AVAILABLE_JS = """
+(selector) => {
+    if (!document.querySelector('td[id*="paging"]')) return false;
+    const btn = document.querySelector(selector);
+    if (!btn || btn.hasAttribute('disabled')) return false;
+    return !(btn.getAttribute('class') || '').includes('disabled');
+}
+"""
+
+
+# (필드명, 셀 인덱스, 타입) — 행마다 같은 인덱스 표를 다시 쓰지 않도록 모듈 상수로 둔다.
+REGULAR_BASIC1_BATTING_COLUMNS: tuple[tuple[str, int, type], ...] = (
+    ("avg", 3, float),
+    ("games", 4, int),
+    ("plate_appearances", 5, int),
+    ("at_bats", 6, int),
+    ("runs", 7, int),
+    ("hits", 8, int),
+    ("doubles", 9, int),
+    ("triples", 10, int),
+    ("home_runs", 11, int),
+    ("total_bases", 12, int),
+    ("rbi", 13, int),
+    ("sacrifice_hits", 14, int),
+    ("sacrifice_flies", 15, int),
+)
+REGULAR_BASIC2_BATTING_COLUMNS: tuple[tuple[str, int, type], ...] = (
+    ("avg", 3, float),
+    ("walks", 4, int),
+    ("intentional_walks", 5, int),
+    ("hbp", 6, int),
+    ("strikeouts", 7, int),
+    ("gdp", 8, int),
+    ("slg", 9, float),
+    ("obp", 10, float),
+    ("ops", 11, float),
+)
+REGULAR_BASIC2_BATTING_EXTRA_COLUMNS: tuple[tuple[str, int, type], ...] = (
+    ("multi_hits", 12, int),
+    ("risp_avg", 13, float),
+    ("pinch_hit_avg", 14, float),
+)
+OTHER_SERIES_BATTING_COLUMNS: tuple[tuple[str, int, type], ...] = (
+    ("avg", 3, float),
+    ("games", 4, int),
+    ("plate_appearances", 5, int),
+    ("at_bats", 6, int),
+    ("hits", 7, int),
+    ("doubles", 8, int),
+    ("triples", 9, int),
+    ("home_runs", 10, int),
+    ("rbi", 11, int),
+    ("stolen_bases", 12, int),
+    ("caught_stealing", 13, int),
+    ("walks", 14, int),
+    ("hbp", 15, int),
+    ("strikeouts", 16, int),
+    ("gdp", 17, int),
+)
+OTHER_SERIES_BATTING_EXTRA_COLUMNS: tuple[tuple[str, int, type], ...] = (("errors", 18, int),)
 
 
 @dataclass
@@ -67,6 +160,8 @@ class BattingCrawlContext:
     policy: RequestPolicy
     unique_players: set[int]
     all_players_data: list[dict]
+    # 팀 선택/파싱/페이지 이동 실패 없이 끝까지 수집했는지 (부분 결과는 캐시하지 않는다)
+    complete: bool = True
 
 
 @dataclass
@@ -82,18 +177,6 @@ class BattingRowData:
     year: int | None = None
 
 
-@dataclass
-class LegacyRowContext:
-    """LegacyRowContext class."""
-
-    row_idx: int
-    row: ElementHandle
-    current_header: str
-    description: str
-    year: int
-    team_mapping: dict[str, str]
-
-
 CRAWLER_EXCEPTIONS = (
     PlaywrightError,
     PlaywrightTimeoutError,
@@ -104,18 +187,24 @@ CRAWLER_EXCEPTIONS = (
     OSError,
 )
 DB_SAVE_EXCEPTIONS = (*CRAWLER_EXCEPTIONS, SQLAlchemyError)
+# Basic2 병합 시 Basic1 값을 유지하는 식별 컬럼
+BASIC2_MERGE_SKIP_KEYS = frozenset(("player_id", "player_name", "team_code", "season", "league", "level", "source"))
+
+
+# 시리즈 이름과 선택 값 매핑 (실제 페이지에서 확인된 값)
+SERIES_MAPPING: dict[str, dict[str, str]] = {
+    "regular": {"name": "KBO 정규시즌", "value": "0", "league": "REGULAR"},
+    "exhibition": {"name": "KBO 시범경기", "value": "1", "league": "EXHIBITION"},
+    "wildcard": {"name": "KBO 와일드카드", "value": "4", "league": "WILDCARD"},
+    "semi_playoff": {"name": "KBO 준플레이오프", "value": "3", "league": "SEMI_PLAYOFF"},
+    "playoff": {"name": "KBO 플레이오프", "value": "5", "league": "PLAYOFF"},
+    "korean_series": {"name": "KBO 한국시리즈", "value": "7", "league": "KOREAN_SERIES"},
+}
 
 
 def get_series_mapping() -> dict[str, dict[str, str]]:
     """시리즈 이름과 선택 값 매핑 (실제 페이지에서 확인된 값)."""
-    return {
-        "regular": {"name": "KBO 정규시즌", "value": "0", "league": "REGULAR"},
-        "exhibition": {"name": "KBO 시범경기", "value": "1", "league": "EXHIBITION"},
-        "wildcard": {"name": "KBO 와일드카드", "value": "4", "league": "WILDCARD"},
-        "semi_playoff": {"name": "KBO 준플레이오프", "value": "3", "league": "SEMI_PLAYOFF"},
-        "playoff": {"name": "KBO 플레이오프", "value": "5", "league": "PLAYOFF"},
-        "korean_series": {"name": "KBO 한국시리즈", "value": "7", "league": "KOREAN_SERIES"},
-    }
+    return SERIES_MAPPING
 
 
 def safe_parse_number(value_str: str | None, data_type: type, *, _allow_zero: bool = True) -> int | float | None:
@@ -151,7 +240,7 @@ def safe_parse_number(value_str: str | None, data_type: type, *, _allow_zero: bo
 def _extract_player_id_from_href(href: str | None) -> int | None:
     if not href:
         return None
-    match = re.search(r"playerId=(\d+)", href)
+    match = PLAYER_ID_PATTERN.search(href)
     return int(match.group(1)) if match else None
 
 
@@ -161,106 +250,51 @@ def _is_basic2_headers(headers: list[str]) -> bool:
     return any(indicator in combined for indicator in basic2_indicators)
 
 
-def _build_batting_data(ctx: BattingRowData) -> dict[str, Any]:
-    year = ctx.year or datetime.now(KST).year
-    series_map = get_series_mapping()
-    league_name = series_map.get(ctx.series_key, {}).get("league", "REGULAR")
+def _parse_columns(cells: list[str], columns: tuple[tuple[str, int, type], ...]) -> dict[str, Any]:
+    size = len(cells)
+    return {key: safe_parse_number(cells[idx], data_type) if idx < size else None for key, idx, data_type in columns}
 
-    def cell(idx: int) -> str | None:
-        """Handle the cell operation.
 
-        Args:
-            idx: Idx.
-            idx: Idx.
-
-        Returns:
-            The result of the operation.
-
-        """
-        return ctx.cells[idx] if len(ctx.cells) > idx else None
-
-    if ctx.series_key == "regular":
-        if ctx.is_basic2:
-            return {
-                "player_id": ctx.player_id,
-                "player_name": ctx.player_name,
-                "team_code": ctx.team_code,
-                "season": year,
-                "league": league_name,
-                "avg": safe_parse_number(cell(3), float),
-                "walks": safe_parse_number(cell(4), int),
-                "intentional_walks": safe_parse_number(cell(5), int),
-                "hbp": safe_parse_number(cell(6), int),
-                "strikeouts": safe_parse_number(cell(7), int),
-                "gdp": safe_parse_number(cell(8), int),
-                "slg": safe_parse_number(cell(9), float),
-                "obp": safe_parse_number(cell(10), float),
-                "ops": safe_parse_number(cell(11), float),
-                "extra_stats": {
-                    "multi_hits": safe_parse_number(cell(12), int),
-                    "risp_avg": safe_parse_number(cell(13), float),
-                    "pinch_hit_avg": safe_parse_number(cell(14), float),
-                },
-            }
-        return {
-            "player_id": ctx.player_id,
-            "player_name": ctx.player_name,
-            "team_code": ctx.team_code,
-            "season": year,
-            "league": league_name,
-            "avg": safe_parse_number(cell(3), float),
-            "games": safe_parse_number(cell(4), int),
-            "plate_appearances": safe_parse_number(cell(5), int),
-            "at_bats": safe_parse_number(cell(6), int),
-            "runs": safe_parse_number(cell(7), int),
-            "hits": safe_parse_number(cell(8), int),
-            "doubles": safe_parse_number(cell(9), int),
-            "triples": safe_parse_number(cell(10), int),
-            "home_runs": safe_parse_number(cell(11), int),
-            "total_bases": safe_parse_number(cell(12), int),
-            "rbi": safe_parse_number(cell(13), int),
-            "sacrifice_hits": safe_parse_number(cell(14), int),
-            "sacrifice_flies": safe_parse_number(cell(15), int),
-        }
+def _build_batting_data(ctx: BattingRowData) -> dict[str, Any]:
+    year = ctx.year or datetime.now(KST).year
+    league_name = SERIES_MAPPING.get(ctx.series_key, {}).get("league", "REGULAR")
 
-    return {
+    batting_data: dict[str, Any] = {
         "player_id": ctx.player_id,
         "player_name": ctx.player_name,
         "team_code": ctx.team_code,
         "season": year,
         "league": league_name,
-        "avg": safe_parse_number(cell(3), float),
-        "games": safe_parse_number(cell(4), int),
-        "plate_appearances": safe_parse_number(cell(5), int),
-        "at_bats": safe_parse_number(cell(6), int),
-        "hits": safe_parse_number(cell(7), int),
-        "doubles": safe_parse_number(cell(8), int),
-        "triples": safe_parse_number(cell(9), int),
-        "home_runs": safe_parse_number(cell(10), int),
-        "rbi": safe_parse_number(cell(11), int),
-        "stolen_bases": safe_parse_number(cell(12), int),
-        "caught_stealing": safe_parse_number(cell(13), int),
-        "walks": safe_parse_number(cell(14), int),
-        "hbp": safe_parse_number(cell(15), int),
-        "strikeouts": safe_parse_number(cell(16), int),
-        "gdp": safe_parse_number(cell(17), int),
-        "extra_stats": {"errors": safe_parse_number(cell(18), int)},
     }
+    if ctx.series_key != "regular":
+        batting_data.update(_parse_columns(ctx.cells, OTHER_SERIES_BATTING_COLUMNS))
+        batting_data["extra_stats"] = _parse_columns(ctx.cells, OTHER_SERIES_BATTING_EXTRA_COLUMNS)
+    elif ctx.is_basic2:
+        batting_data.update(_parse_columns(ctx.cells, REGULAR_BASIC2_BATTING_COLUMNS))
+        batting_data["extra_stats"] = _parse_columns(ctx.cells, REGULAR_BASIC2_BATTING_EXTRA_COLUMNS)
+    else:
+        batting_data.update(_parse_columns(ctx.cells, REGULAR_BASIC1_BATTING_COLUMNS))
+    return batting_data
 
 
-def _parse_batting_stats_table_fast(page: Page, series_key: str, year: int | None = None) -> list[dict]:
+def _parse_batting_stats_table_fast(
+    page: Page,
+    series_key: str,
+    year: int | None = None,
+    *,
+    strict: bool = False,
+) -> list[dict]:
     """Parse batting table using JS extraction for reduced RPC.
 
     Args:
         page: Page.
         series_key: Series Key.
         year: Season year.
+        strict: True면 파싱 오류를 삼키지 않고 올린다.
 
     """
     year = year or datetime.now(KST).year
 
-    get_team_mapping_for_year(year)
-
     extraction_script = r"""
     () => {
         const table = document.querySelector('table.tData01.tt');
@@ -272,6 +306,7 @@ def _parse_batting_stats_table_fast(page: Page, series_key: str, year: int | Non
         const basic2_indicators = ['BB', '볼넷', 'IBB', 'HBP', 'SLG', 'OBP', 'OPS'];
         const is_basic2 = basic2_indicators.some(ind => headers.join('').includes(ind));
 
+        const playerIdRe = /playerId=(\d+)/;
         const results = [];
         rows.forEach(row => {
             const cells = Array.from(row.querySelectorAll('td'));
@@ -282,7 +317,7 @@ def _parse_batting_stats_table_fast(page: Page, series_key: str, year: int | Non
 
             const playerName = nameLink.textContent.trim();
             const href = nameLink.getAttribute('href');
-            const idMatch = href ? href.match(/playerId=(\d+)/) : null;
+            const idMatch = href ? playerIdRe.exec(href) : null;
             if (!idMatch) return;
             const playerId = parseInt(idMatch[1], 10);
 
@@ -329,51 +364,47 @@ def _parse_batting_stats_table_fast(page: Page, series_key: str, year: int | Non
             players_data.append(batting_data)
 
     except CRAWLER_EXCEPTIONS:
+        if strict:
+            raise
         logger.exception("❌ 테이블 파싱 오류 (JS)")
         return []
     else:
         return players_data
 
 
-def _parse_batting_stats_table_legacy(page: Page, series_key: str, year: int | None = None) -> list[dict]:
+def _parse_batting_stats_table_legacy(
+    page: Page,
+    series_key: str,
+    year: int | None = None,
+    *,
+    strict: bool = False,
+) -> list[dict]:
     year = year or datetime.now(KST).year
-    get_team_mapping_for_year(year)
     try:
         table = page.query_selector("table")
         if not table:
             return []
 
-        thead = table.query_selector("thead")
-        headers = []
-        if thead:
-            header_cells = thead.query_selector_all("th")
-            headers = [(cell.text_content() or "").strip() for cell in header_cells]
+        headers = table.eval_on_selector_all("thead th", TABLE_HEADER_TEXTS_JS)
         is_basic2 = _is_basic2_headers(headers) if headers else False
 
-        tbody = table.query_selector("tbody")
-        rows = tbody.query_selector_all("tr") if tbody else table.query_selector_all("tr")
+        rows = table.query_selector_all("tbody tr") or table.query_selector_all("tr")
         if not rows:
             return []
 
         players_data = []
         for row in rows:
-            cell_nodes = row.query_selector_all("td")
-            if len(cell_nodes) < MIN_BATTING_TABLE_CELLS:
+            row_info = row.evaluate(LEGACY_ROW_JS, PLAYER_NAME_CELL_INDEX)
+            cells = row_info["cells"]
+            if len(cells) < MIN_BATTING_TABLE_CELLS:
                 continue
 
-            cells = [(cell.text_content() or "").strip() for cell in cell_nodes]
-            name_link = cell_nodes[PLAYER_NAME_CELL_INDEX].query_selector("a")
-            href = name_link.get_attribute("href") if name_link else None
-            player_id = _extract_player_id_from_href(href)
+            player_id = _extract_player_id_from_href(row_info["linkHref"])
             if not player_id:
                 continue
 
-            player_name = (
-                (name_link.text_content() or "").strip()
-                if name_link
-                else (cells[PLAYER_NAME_CELL_INDEX] if len(cells) > PLAYER_NAME_CELL_INDEX else "")
-            )
-            team_name = cells[TEAM_NAME_CELL_INDEX] if len(cells) > TEAM_NAME_CELL_INDEX else ""
+            player_name = row_info["linkText"] or cells[PLAYER_NAME_CELL_INDEX]
+            team_name = cells[TEAM_NAME_CELL_INDEX]
             team_code = resolve_team_code(team_name, year) or team_name
 
             batting_data = _build_batting_data(
@@ -390,6 +421,8 @@ def _parse_batting_stats_table_legacy(page: Page, series_key: str, year: int | N
             players_data.append(batting_data)
 
     except CRAWLER_EXCEPTIONS:
+        if strict:
+            raise
         logger.exception("❌ 테이블 파싱 오류 (Legacy)")
         return []
     else:
@@ -402,6 +435,7 @@ def parse_batting_stats_table(
     year: int | None = None,
     *,
     use_fast: bool | None = None,
+    strict: bool = False,
 ) -> list[dict]:
     """Parse batting stats table.
 
@@ -410,6 +444,7 @@ def parse_batting_stats_table(
         series_key: Series Key.
         year: Season year.
         use_fast: Use Fast.
+        strict: True면 파싱 오류를 빈 리스트로 삼키지 않고 올린다.
         page: Page.
         series_key: Series Key.
         year: Season year.
@@ -421,10 +456,10 @@ def parse_batting_stats_table(
     year = year or datetime.now(KST).year
 
     if use_fast is None:
-        use_fast = os.getenv("KBO_FAST_PARSE", "1") != "0"
+        use_fast = FAST_PARSE_ENABLED
     if use_fast:
-        return _parse_batting_stats_table_fast(page, series_key, year)
-    return _parse_batting_stats_table_legacy(page, series_key, year)
+        return _parse_batting_stats_table_fast(page, series_key, year, strict=strict)
+    return _parse_batting_stats_table_legacy(page, series_key, year, strict=strict)
 
 
 def build_batting_crawl_summary(rows: list[dict]) -> tuple[dict[str, object], list[dict]]:
@@ -449,13 +484,20 @@ def build_batting_crawl_summary(rows: list[dict]) -> tuple[dict[str, object], li
     return summary, valid_rows
 
 
-def go_to_next_page(page: Page, current_page_num: int, policy: RequestPolicy | None = None) -> bool:
+def go_to_next_page(
+    page: Page,
+    current_page_num: int,
+    policy: RequestPolicy | None = None,
+    *,
+    strict: bool = False,
+) -> bool:
     """다음 페이지로 이동 (1→2,3,4,5→다음→6,7,8,9,10→다음 반복).
 
     Args:
         page: Page.
         current_page_num: Current Page Num.
         policy: Policy.
+        strict: True면 이동 실패를 False(마지막 페이지)로 삼키지 않고 올린다.
 
     """
     try:
@@ -468,22 +510,14 @@ def go_to_next_page(page: Page, current_page_num: int, policy: RequestPolicy | N
             selector = f'a[href*="btnNo{relative_page_num}"]'
             desc = f"{next_page_num}페이지로 이동 (btnNo{relative_page_num})"
 
-        # 빠른 종료: pagination 컨테이너 자체가 없으면 마지막 페이지
-        paging = page.query_selector('td[id*="paging"]')
-        if not paging:
-            return False
-
-        # 1회만 확인 (리로드 없음)
-        btn = page.query_selector(selector)
-        if not btn or btn.get_attribute("disabled") or "disabled" in (btn.get_attribute("class") or ""):
+        # 페이징 컨테이너/버튼 존재와 비활성 여부를 evaluate 한 번으로 확인한다.
+        if not page.evaluate(NEXT_PAGE_AVAILABLE_JS, selector):
             return False
 
-        if policy:
-            policy.delay()
-
-        page.click(selector, timeout=SEL_TIMEOUT)
-        page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+        wait_for_postback(page, lambda: page.click(selector, timeout=SEL_TIMEOUT), policy)
     except CRAWLER_EXCEPTIONS:
+        if strict:
+            raise
         logger.exception("❌ 페이지 이동 실패 (%sp -> next)", current_page_num)
         return False
     else:
@@ -493,38 +527,29 @@ def go_to_next_page(page: Page, current_page_num: int, policy: RequestPolicy | N
 
 def _select_year_option(page: Page, year: int, policy: RequestPolicy | None) -> None:
     try:
-        season_selector = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeason$ddlSeason"]'
-        if not retry_wait_for_selector(page, season_selector):
+        if not retry_wait_for_selector(page, SEASON_SELECTOR):
             logger.warning("   ⚠️ 연도 선택기를 찾을 수 없습니다.")
         else:
-            if policy:
-                policy.delay()
-            page.select_option(season_selector, str(year))
-            page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+            select_option_if_changed(page, SEASON_SELECTOR, str(year), policy)
     except CRAWLER_EXCEPTIONS:
         logger.exception("   ⚠️ 연도 선택 중 오류 (무시)")
 
 
 def _select_series_option(page: Page, series_value: str, policy: RequestPolicy | None) -> None:
     try:
-        series_selector = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeries$ddlSeries"]'
-        if retry_wait_for_selector(page, series_selector):
-            if policy:
-                policy.delay()
-            page.select_option(series_selector, value=series_value)
-            page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+        if retry_wait_for_selector(page, SERIES_SELECTOR):
+            select_option_if_changed(page, SERIES_SELECTOR, series_value, policy)
     except CRAWLER_EXCEPTIONS:
         logger.exception("   ⚠️ 시리즈 선택 중 오류 (무시)")
 
 
 def _navigate_to_basic2(page: Page, policy: RequestPolicy | None) -> bool:
     try:
-        next_link_selector = 'a[href="/Record/Player/HitterBasic/Basic2.aspx"]'
-        if retry_wait_for_selector(page, next_link_selector):
+        if retry_wait_for_selector(page, BASIC2_LINK_SELECTOR):
             if policy:
                 policy.delay()
-            page.click(next_link_selector)
-            page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+            page.click(BASIC2_LINK_SELECTOR)
+            page.wait_for_url("**/Basic2.aspx*", wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
             success = True
         else:
             logger.error("   ❌ Basic2 이동 링크를 찾을 수 없습니다.")
@@ -541,14 +566,26 @@ def _collect_basic2_pages(
     year: int,
     all_player_data: dict[int, dict],
     policy: RequestPolicy | None = None,
-) -> None:
+) -> bool:
+    """Collect every Basic2 page into ``all_player_data``.
+
+    Returns:
+        헤더 로딩/파싱/페이지 이동 실패 없이 마지막 페이지까지 수집했으면 True.
+
+    """
+    complete = True
     page_num = 1
     while True:
         if not retry_wait_for_selector(page, "table.tData01.tt thead th", timeout=SEL_TIMEOUT):
             logger.warning("   ⚠️ %s페이지 테이블 헤더 로딩 실패", page_num)
-            break
+            return False
 
-        current_page_data = parse_batting_stats_table(page, "regular", year)
+        try:
+            current_page_data = parse_batting_stats_table(page, "regular", year, strict=True)
+        except CRAWLER_EXCEPTIONS:
+            logger.exception("   ❌ Basic2 %s페이지 파싱 오류", page_num)
+            complete = False
+            current_page_data = []
         for player_stat in current_page_data:
             pid = player_stat["player_id"]
             if pid not in all_player_data:
@@ -556,8 +593,12 @@ def _collect_basic2_pages(
             else:
                 all_player_data[pid].update(player_stat)
 
-        if not go_to_next_page(page, page_num, policy):
-            break
+        try:
+            if not go_to_next_page(page, page_num, policy, strict=True):
+                return complete
+        except CRAWLER_EXCEPTIONS:
+            logger.exception("   ❌ Basic2 페이지 이동 실패 (%sp -> next)", page_num)
+            return False
         page_num += 1
 
 
@@ -566,6 +607,8 @@ def crawl_basic2_with_headers(
     year: int,
     series_info: dict,
     policy: RequestPolicy | None = None,
+    *,
+    basic1_selected: bool = False,
 ) -> dict[int, dict]:
     """정규시즌용 Basic2 페이지에서 각 헤더를 클릭하여 고급 통계 데이터 수집.
 
@@ -574,313 +617,83 @@ def crawl_basic2_with_headers(
         year: Season year.
         series_info: Series Info.
         policy: Policy.
+        basic1_selected: page가 이미 같은 시즌/시리즈가 선택된 Basic1에 있으면 True (재탐색/재선택 생략).
 
     """
-    all_player_data: dict[int, dict] = {}
-
-    try:
-        logger.info("   🔍 Basic2 접근을 위해 Basic1에서 시작...")
-
-        url = HITTER_BASIC1
-        if policy:
-            policy.delay()
-        if not retry_navigation(page, url, timeout=45000):
-            logger.error("   ❌ Basic1 페이지 로딩 실패")
-            return {}
-
-        _select_year_option(page, year, policy)
-        _select_series_option(page, series_info["value"], policy)
-
-        if not _navigate_to_basic2(page, policy):
-            return {}
-
-        _collect_basic2_pages(page, year, all_player_data, policy)
-        logger.info("   ✅ Basic2 전체 수집 완료: %s명", len(all_player_data))
-
-    except CRAWLER_EXCEPTIONS:
-        logger.exception("   ❌ Basic2 크롤링 중 오류")
-
+    all_player_data, _complete = _crawl_basic2(page, year, series_info, policy, basic1_selected=basic1_selected)
     return all_player_data
 
 
-def _extract_basic2_stat_by_header(
-    current_header: str,
-    cells: list[str],
-    batting_data: dict[str, Any],
-) -> None:
-    """Basic2 테이블의 헤더(BB, IBB, HBP 등)에 맞춰 데이터를 파싱하여 batting_data에 추가합니다.
-
-    Args:
-        current_header: Current Header.
-        cells: Cells.
-        batting_data: Batting Data.
-
-    """
-    mapping = {
-        "BB": (4, int, "walks"),
-        "IBB": (5, int, "intentional_walks"),
-        "HBP": (6, int, "hbp"),
-        "SO": (7, int, "strikeouts"),
-        "GDP": (8, int, "gdp"),
-        "SLG": (9, float, "slg"),
-        "OBP": (10, float, "obp"),
-        "OPS": (11, float, "ops"),
-    }
-
-    if current_header in mapping:
-        idx, data_type, key = mapping[current_header]
-        if len(cells) > idx:
-            batting_data[key] = safe_parse_number(cells[idx], data_type)
-        return
-
-    extra_mapping = {
-        "MH": (12, int, "multi_hits"),
-        "RISP": (13, float, "risp_avg"),
-        "PH-BA": (14, float, "pinch_hit_avg"),
-    }
-
-    if current_header in extra_mapping:
-        idx, data_type, key = extra_mapping[current_header]
-        if len(cells) > idx:
-            batting_data.setdefault("extra_stats", {})
-            batting_data["extra_stats"][key] = safe_parse_number(cells[idx], data_type)
-
-
-def _log_debug_legacy_table(page: Page, rows: list, description: str) -> None:
-    thead = page.query_selector("thead")
-    if thead:
-        header_cells = thead.query_selector_all("th")
-        headers = [(cell.text_content() or "").strip() for cell in header_cells]
-        logger.info("      🔍 %s 기준 테이블 헤더: %s", description, headers)
-
-    if len(rows) > 0:
-        first_row_cells = rows[0].query_selector_all("td")
-        logger.info("      🔍 %s 기준 첫 행 데이터 (%s개 컬럼):", description, len(first_row_cells))
-        for i, cell in enumerate(first_row_cells[:10]):
-            content = cell.text_content().strip()
-            logger.info("         [%s]: '%s'", i, content)
-
-
-def _log_first_rows_basic2_legacy(
-    row_idx: int,
-    player_name: str,
-    team_name: str,
-    current_header: str,
-    batting_data: dict[str, Any],
-) -> None:
-    if row_idx < DEBUG_ROW_LIMIT:
-        sort_value = "N/A"
-        if current_header in ["BB", "IBB", "HBP", "SO", "GDP", "SLG", "OBP", "OPS"]:
-            sort_value = batting_data.get(current_header.lower(), "N/A")
-        elif current_header in ["MH", "RISP", "PH-BA"]:
-            sort_value = batting_data.get("extra_stats", {}).get(
-                current_header.lower().replace("-", "_"),
-                "N/A",
-            )
-        logger.info("      ✅ %s (%s) - %s: %s", player_name, team_name, current_header, sort_value)
-
-
-def _parse_legacy_row(ctx: LegacyRowContext) -> tuple[int, dict] | None:
-    cells = ctx.row.query_selector_all("td")
-    if len(cells) < MIN_LEGACY_ROW_CELLS:
-        return None
-
-    try:
-        name_cell = cells[PLAYER_NAME_CELL_INDEX]
-        name_link = name_cell.query_selector("a")
-        if not name_link:
-            return None
-
-        player_name = (name_link.text_content() or "").strip()
-        href = name_link.get_attribute("href")
-        player_id = _extract_player_id_from_href(href)
-        if not player_id:
-            return None
-
-        team_name = (cells[TEAM_NAME_CELL_INDEX].text_content() or "").strip()
-        team_code = get_team_code(team_name, ctx.year)
-        if not team_code:
-            team_code = ctx.team_mapping.get(team_name, team_name)
-            logger.warning("⚠️ %s년 '%s' 팀 매핑 실패, 폴백: %s", ctx.year, team_name, team_code)
-
-        batting_data = {
-            "player_id": player_id,
-            "player_name": player_name,
-            "team_code": team_code,
-        }
-
-        cell_texts = [(c.text_content() or "").strip() for c in cells]
-        _extract_basic2_stat_by_header(ctx.current_header, cell_texts, batting_data)
-
-        _log_first_rows_basic2_legacy(ctx.row_idx, player_name, team_name, ctx.current_header, batting_data)
-    except (ValueError, AttributeError):
-        logger.exception("      ⚠️ %s 행 파싱 오류", ctx.description)
-        return None
-    else:
-        return player_id, batting_data
-
-
-def _parse_basic2_header_data_legacy(
+def _crawl_basic2(
     page: Page,
-    current_header: str,
-    description: str,
-    year: int | None = None,
-) -> dict[int, dict]:
-    """Basic2 페이지에서 특정 헤더 클릭 후 데이터 파싱.
-
-    각 헤더 클릭시 해당 기준으로 정렬된 선수 데이터를 수집.
-
-    Args:
-        page: Page.
-        current_header: Current Header.
-        description: Description.
-        year: Season year.
-
-    """
-    year = year or datetime.now(KST).year
-
-    players_data: dict[int, dict] = {}
-    team_mapping = get_team_mapping_for_year(year)
+    year: int,
+    series_info: dict,
+    policy: RequestPolicy | None,
+    *,
+    basic1_selected: bool,
+) -> tuple[dict[int, dict], bool]:
+    # crawl_basic2_with_headers와 같지만, 끝까지 오류 없이 수집했는지(캐시 가능 여부)도 함께 돌려준다.
+    all_player_data: dict[int, dict] = {}
+    complete = False
 
     try:
-        table = page.query_selector("table")
-        if not table:
-            return players_data
+        if not basic1_selected:
+            logger.info("   🔍 Basic2 접근을 위해 Basic1에서 시작...")
 
-        tbody = table.query_selector("tbody")
-        rows = tbody.query_selector_all("tr") if tbody else table.query_selector_all("tr")
+            url = HITTER_BASIC1
+            if policy:
+                policy.delay()
+            if not retry_navigation(page, url, timeout=45000):
+                logger.error("   ❌ Basic1 페이지 로딩 실패")
+                return {}, False
 
-        if len(rows) == 0:
-            return players_data
+            _select_year_option(page, year, policy)
+            _select_series_option(page, series_info["value"], policy)
 
-        _log_debug_legacy_table(page, rows, description)
+        if not _navigate_to_basic2(page, policy):
+            return {}, False
 
-        for row_idx, row in enumerate(rows):
-            res = _parse_legacy_row(
-                LegacyRowContext(
-                    row_idx=row_idx,
-                    row=row,
-                    current_header=current_header,
-                    description=description,
-                    year=year,
-                    team_mapping=team_mapping,
-                ),
-            )
-            if res:
-                player_id, batting_data = res
-                players_data[player_id] = batting_data
+        complete = _collect_basic2_pages(page, year, all_player_data, policy)
+        logger.info("   ✅ Basic2 전체 수집 완료: %s명", len(all_player_data))
 
     except CRAWLER_EXCEPTIONS:
-        logger.exception("      ❌ %s 테이블 파싱 오류", description)
-
-    return players_data
-
-
-def _log_debug_fast_table(rows_data: list[dict], description: str, thead_node: ElementHandle | None) -> None:
-    if thead_node:
-        header_cells = thead_node.query_selector_all("th")
-        headers = [(cell.text_content() or "").strip() for cell in header_cells]
-        logger.info("      🔍 %s 기준 테이블 헤더: %s", description, headers)
-
-    if rows_data:
-        first_row = rows_data[0]
-        cells = first_row.get("cells") or []
-        logger.info("      🔍 %s 기준 첫 행 데이터 (%s개 컬럼):", description, len(cells))
-        for idx, value in enumerate(cells[:10]):
-            logger.info("         [%s]: '%s'", idx, value)
-
-
-def _parse_fast_row(
-    row: dict,
-    current_header: str,
-    year: int,
-    team_mapping: dict[str, str],
-) -> tuple[int, dict] | None:
-    cells = row.get("cells") or []
-    if len(cells) < MIN_LEGACY_ROW_CELLS:
-        return None
-
-    href = row.get("linkHref")
-    player_id = _extract_player_id_from_href(href)
-    if not player_id:
-        return None
-
-    player_name = (
-        row.get("linkText") or (cells[PLAYER_NAME_CELL_INDEX] if len(cells) > PLAYER_NAME_CELL_INDEX else "")
-    ).strip()
-    team_name = cells[TEAM_NAME_CELL_INDEX] if len(cells) > TEAM_NAME_CELL_INDEX else ""
-    team_code = get_team_code(team_name, year)
-    if not team_code:
-        team_code = team_mapping.get(team_name, team_name)
-
-    batting_data = {
-        "player_id": player_id,
-        "player_name": player_name,
-        "team_code": team_code,
-    }
-
-    _extract_basic2_stat_by_header(current_header, cells, batting_data)
-    return player_id, batting_data
-
-
-def _parse_basic2_header_data_fast(
-    page: Page,
-    current_header: str,
-    description: str,
-    year: int | None = None,
-) -> dict[int, dict]:
-    year = year or datetime.now(KST).year
-    players_data: dict[int, dict] = {}
-    team_mapping = get_team_mapping_for_year(year)
-
-    rows_data = extract_rows_fast(page)
-    if not rows_data:
-        return players_data
-
-    thead = page.query_selector("thead")
-    _log_debug_fast_table(rows_data, description, thead)
-
-    for row in rows_data:
-        res = _parse_fast_row(row, current_header, year, team_mapping)
-        if res:
-            player_id, batting_data = res
-            players_data[player_id] = batting_data
+        logger.exception("   ❌ Basic2 크롤링 중 오류")
+        complete = False
 
-    return players_data
+    return all_player_data, complete
 
 
 def parse_basic2_header_data(
     page: Page,
-    current_header: str,
-    description: str,
+    current_header: str,  # noqa: ARG001
+    description: str,  # noqa: ARG001
     year: int | None = None,
     *,
     use_fast: bool | None = None,
 ) -> dict[int, dict]:
-    """Parse basic2 header data.
+    """Parse the current Basic2 page keyed by player_id (deprecated).
+
+    헤더별 정렬 순회는 더 이상 하지 않는다. 한 페이지에 모든 Basic2 컬럼이 있으므로
+    ``parse_batting_stats_table(page, "regular", year)``를 직접 사용한다.
 
     Args:
         page: Page.
-        current_header: Current Header.
-        description: Description.
+        current_header: Ignored; kept for call compatibility.
+        description: Ignored; kept for call compatibility.
         year: Season year.
         use_fast: Use Fast.
-        page: Page.
-        current_header: Current Header.
-        description: Description.
-        year: Season year.
 
     Returns:
         Dictionary result.
 
     """
-    year = year or datetime.now(KST).year
-
-    if use_fast is None:
-        use_fast = os.getenv("KBO_FAST_PARSE", "1") != "0"
-    if use_fast:
-        return _parse_basic2_header_data_fast(page, current_header, description, year)
-    return _parse_basic2_header_data_legacy(page, current_header, description, year)
+    warnings.warn(
+        "parse_basic2_header_data is deprecated; use parse_batting_stats_table(page, 'regular', year)",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    rows = parse_batting_stats_table(page, "regular", year, use_fast=use_fast)
+    return {row["player_id"]: row for row in rows}
 
 
 # ---------------------------------------------------------------------------
@@ -969,26 +782,19 @@ def _select_season_and_series(
     series_info: dict,
     policy: RequestPolicy,
 ) -> None:
-    season_selector = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeason$ddlSeason"]'
-    policy.delay()
-    page.select_option(season_selector, str(year))
+    select_option_if_changed(page, SEASON_SELECTOR, str(year), policy)
     logger.info("✅ %s년 시즌 선택", year)
-    page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
 
-    series_selector = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeries$ddlSeries"]'
-    policy.delay()
-    page.select_option(series_selector, value=series_info["value"])
+    select_option_if_changed(page, SERIES_SELECTOR, series_info["value"], policy)
     logger.info("✅ %s 선택", series_info["name"])
-    page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
 
 
 def _get_team_options(page: Page, *, by_team: bool) -> list[dict]:
     if not by_team:
         return [{"value": "", "text": "전체"}]
     try:
-        team_selector = 'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlTeam$ddlTeam"]'
         options = page.eval_on_selector_all(
-            f"{team_selector} option",
+            TEAM_OPTION_SELECTOR,
             "options => options.map(o => ({text: o.textContent, value: o.value}))",
         )
         team_options = [opt for opt in options if opt["value"]]  # Empty value is "Team Selection"
@@ -1001,11 +807,10 @@ def _get_team_options(page: Page, *, by_team: bool) -> list[dict]:
 
 
 def _apply_pa_sorting(page: Page, policy: RequestPolicy) -> None:
-    pa_sort_link = "a[href=\"javascript:sort('PA_CN');\"]"
-    if page.query_selector(pa_sort_link):
-        page.click(pa_sort_link)
+    pa_sort_link = page.locator(PA_SORT_LINK_SELECTOR)
+    if pa_sort_link.count():
+        wait_for_postback(page, lambda: pa_sort_link.first.click())
         logger.info("✅ 타석(PA) 기준 정렬 적용")
-        page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
         policy.delay()
     else:
         logger.warning("⚠️ 타석 정렬 버튼을 찾을 수 없습니다.")
@@ -1015,11 +820,7 @@ def _select_team_if_needed(page: Page, tm: dict, *, by_team: bool, policy: Reque
     if by_team and tm["value"]:
         logger.info("🔍 팀 선택: %s (%s)", tm["text"], tm["value"])
         try:
-            page.select_option(
-                'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlTeam$ddlTeam"]',
-                tm["value"],
-            )
-            page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+            wait_for_postback(page, lambda: page.select_option(TEAM_SELECTOR, tm["value"]))
             policy.delay()
         except CRAWLER_EXCEPTIONS:
             logger.exception("⚠️ 팀 선택 실패 (%s)", tm["text"])
@@ -1029,21 +830,23 @@ def _select_team_if_needed(page: Page, tm: dict, *, by_team: bool, policy: Reque
     return True
 
 
-def _process_current_page_batting(
-    page: Page,
-    year: int,
-    series_key: str,
-    unique_players: set[int],
-    all_players_data: list[dict],
-) -> int:
-    current_page_data = parse_batting_stats_table(page, series_key, year)
+def _process_current_page_batting(ctx: BattingCrawlContext, remaining: int | None) -> int:
+    try:
+        current_page_data = parse_batting_stats_table(ctx.page, ctx.series_key, ctx.year, strict=True)
+    except CRAWLER_EXCEPTIONS:
+        logger.exception("❌ 테이블 파싱 오류")
+        ctx.complete = False
+        return 0
+    if remaining is not None:
+        # limit을 넘는 행은 처리하지 않는다 (마지막에 잘라낼 필요 없음).
+        current_page_data = current_page_data[:remaining]
     for player_stat in current_page_data:
         pid = player_stat["player_id"]
-        if pid not in unique_players:
-            unique_players.add(pid)
-            all_players_data.append(player_stat)
+        if pid not in ctx.unique_players:
+            ctx.unique_players.add(pid)
+            ctx.all_players_data.append(player_stat)
         else:
-            for p in all_players_data:
+            for p in ctx.all_players_data:
                 if p["player_id"] == pid:
                     p.update(player_stat)
                     break
@@ -1054,19 +857,15 @@ def _collect_batting_stats_loop(ctx: BattingCrawlContext) -> None:
     total_collected = 0
     for tm in ctx.iteration_targets:
         if not _select_team_if_needed(ctx.page, tm, by_team=ctx.by_team, policy=ctx.policy):
+            ctx.complete = False
             continue
 
         _apply_pa_sorting(ctx.page, ctx.policy)
 
         page_num = 1
         while True:
-            added = _process_current_page_batting(
-                page=ctx.page,
-                year=ctx.year,
-                series_key=ctx.series_key,
-                unique_players=ctx.unique_players,
-                all_players_data=ctx.all_players_data,
-            )
+            remaining = ctx.limit - total_collected if ctx.limit else None
+            added = _process_current_page_batting(ctx, remaining)
             total_collected += added
 
             logger.info(
@@ -1080,45 +879,39 @@ def _collect_batting_stats_loop(ctx: BattingCrawlContext) -> None:
                 logger.info("🎯 목표 수(%s명) 달성. 수집 중단.", ctx.limit)
                 return
 
-            if not go_to_next_page(ctx.page, page_num, ctx.policy):
+            try:
+                if not go_to_next_page(ctx.page, page_num, ctx.policy, strict=True):
+                    break
+            except CRAWLER_EXCEPTIONS:
+                logger.exception("❌ 페이지 이동 실패 (%sp -> next)", page_num)
+                ctx.complete = False
                 break
 
             page_num += 1
             ctx.policy.delay()
 
 
-def _merge_basic2_data(
-    all_players_data: list[dict],
-    page: Page,
-    year: int,
-    series_info: dict,
-    policy: RequestPolicy,
-) -> list[dict]:
-    logger.info("\n🔍 정규시즌 Basic2 추가 데이터 수집 시작...")
-    basic2_data = crawl_basic2_with_headers(page, year, series_info, policy)
-
+def _merge_basic2_data(all_players_data: list[dict], basic2_data: dict[int, dict]) -> list[dict]:
     if not basic2_data:
         logger.warning("⚠️ Basic2 데이터 수집 실패, Basic1 데이터만 사용")
         return all_players_data
 
-    basic1_dict = {p["player_id"]: p for p in all_players_data}
+    # 행 dict를 제자리에서 갱신하므로 all_players_data를 다시 만들 필요가 없다 (player_id는 수집 시 이미 중복 제거됨).
+    basic1_index = {p["player_id"]: p for p in all_players_data}
 
     for player_id, basic2_player in basic2_data.items():
-        if player_id in basic1_dict:
-            for key, value in basic2_player.items():
-                if value is not None and key not in [
-                    "player_id",
-                    "player_name",
-                    "team_code",
-                    "season",
-                    "league",
-                    "level",
-                    "source",
-                ]:
-                    basic1_dict[player_id][key] = value
+        basic1_player = basic1_index.get(player_id)
+        if basic1_player is not None:
+            basic1_player.update(
+                {
+                    key: value
+                    for key, value in basic2_player.items()
+                    if value is not None and key not in BASIC2_MERGE_SKIP_KEYS
+                },
+            )
 
     logger.info("✅ Basic1 + Basic2 데이터 병합 완료")
-    return list(basic1_dict.values())
+    return all_players_data
 
 
 def _handle_batting_fallback(
@@ -1157,11 +950,102 @@ class BattingSeriesCrawlRequest:
     by_team: bool = False
 
 
-def crawl_series_batting_stats(request: BattingSeriesCrawlRequest) -> list[dict]:
+def _collect_batting_series(
+    browser: Browser,
+    request: BattingSeriesCrawlRequest,
+    year: int,
+    series_info: dict,
+    policy: RequestPolicy,
+) -> tuple[list[dict], str | None, bool]:
+    """Collect one series in a fresh context on ``browser``.
+
+    Args:
+        browser: Browser.
+        request: Selection and persistence settings.
+        year: Season year.
+        series_info: Series Info.
+        policy: Policy.
+
+    Returns:
+        수집된 타자 기록, 시즌/시리즈 선택 실패 시 DB 폴백 사유,
+        그리고 오류 없이 끝까지 수집했는지 여부 (정규시즌은 Basic2 병합 포함).
+
+    """
+    all_players_data: list[dict] = []  # List of dicts
+    unique_players: set[int] = set()  # Track by ID
+    complete = False
+
+    # Apply UA rotation via context
+    context = browser.new_context(**policy.build_context_kwargs(locale="ko-KR"))
+    try:
+        # 컨텍스트 단위로 걸어 Basic2 등 이후 탐색에도 같은 차단 규칙이 적용되게 한다.
+        install_sync_resource_blocking(context, blocked_types=TABLE_ONLY_BLOCKED_RESOURCE_TYPES)
+        page = context.new_page()
+        # 없는 셀렉터 하나가 30초씩 잡아먹지 않도록 설정 가능한 공통 타임아웃을 쓴다.
+        page.set_default_timeout(SEL_TIMEOUT)
+        page.set_default_navigation_timeout(NAV_TIMEOUT)
+
+        policy.delay(host="www.koreabaseball.com")
+        page.goto(HITTER_BASIC1, wait_until="load", timeout=NAV_TIMEOUT)
+        # 표는 load 시점에 이미 그려져 있으므로 networkidle은 짧게 기다리고 넘어간다.
+        with contextlib.suppress(PlaywrightTimeoutError):
+            page.wait_for_load_state("networkidle", timeout=SHORT_TIMEOUT)
+
+        # 시즌과 시리즈 설정
+        try:
+            _select_season_and_series(page, year, series_info, policy)
+        except CRAWLER_EXCEPTIONS as e:
+            logger.exception("Season/Series selection error, falling back to DB aggregation")
+            return all_players_data, f"Season/Series selection error: {e}", False
+
+        # 순회 대상 설정 (팀 옵션이 있으면 팀별, 없으면 전체 1회)
+        team_options = _get_team_options(page, by_team=request.by_team)
+        crawl_ctx = BattingCrawlContext(
+            page=page,
+            year=year,
+            series_key=request.series_key,
+            iteration_targets=team_options,
+            by_team=request.by_team,
+            limit=request.limit,
+            policy=policy,
+            unique_players=unique_players,
+            all_players_data=all_players_data,
+        )
+        _collect_batting_stats_loop(crawl_ctx)
+        complete = crawl_ctx.complete
+
+        # 정규시즌인 경우 Basic2 페이지에서 추가 데이터 수집
+        if request.series_key == "regular" and all_players_data:
+            logger.info("\n🔍 정규시즌 Basic2 추가 데이터 수집 시작...")
+            # 팀별 모드에서는 마지막 팀 필터가 남아 있으므로 Basic1부터 다시 선택한다.
+            basic2_data, basic2_complete = _crawl_basic2(
+                page,
+                year,
+                series_info,
+                policy,
+                basic1_selected=not request.by_team,
+            )
+            # Basic1만으로 대체됐거나 Basic2가 중간에 끊긴 결과는 캐시하지 않는다.
+            complete = complete and basic2_complete and bool(basic2_data)
+            all_players_data = _merge_basic2_data(all_players_data, basic2_data)
+
+        logger.info("✅ %s 데이터 수집 완료", series_info["name"])
+
+    except DB_SAVE_EXCEPTIONS:
+        logger.exception("❌ 크롤링 중 오류")
+        complete = False
+
+    finally:
+        context.close()
+    return all_players_data, None, complete
+
+
+def crawl_series_batting_stats(request: BattingSeriesCrawlRequest, browser: Browser | None = None) -> list[dict]:
     """특정 시리즈의 타자 기록을 크롤링.
 
     Args:
         request: Selection and persistence settings.
+        browser: 재사용할 브라우저. 생략하면 전용 브라우저를 띄우고 종료한다.
 
     Returns:
         수집된 타자 기록 리스트
@@ -1169,10 +1053,6 @@ def crawl_series_batting_stats(request: BattingSeriesCrawlRequest) -> list[dict]
     """
     year = request.year or datetime.now(KST).year
     series_key = request.series_key
-    limit = request.limit
-    save_to_db = request.save_to_db
-    headless = request.headless
-    by_team = request.by_team
 
     series_mapping = get_series_mapping()
 
@@ -1181,72 +1061,60 @@ def crawl_series_batting_stats(request: BattingSeriesCrawlRequest) -> list[dict]
         return []
 
     series_info = series_mapping[series_key]
-    all_players_data: list[dict] = []  # List of dicts
-    unique_players: set[int] = set()  # Track by ID
-
     policy = RequestPolicy()
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        # Apply UA rotation via context
-        context = browser.new_context(**policy.build_context_kwargs(locale="ko-KR"))
-        page = context.new_page()
-        page.set_default_timeout(30000)
-        install_sync_resource_blocking(page)
-
-        try:
-            logger.info("\n📊 %s년 %s 타자 기록 수집 시작 (by_team=%s)", year, series_info["name"], by_team)
-            logger.info("-" * 60)
+    logger.info("\n📊 %s년 %s 타자 기록 수집 시작 (by_team=%s)", year, series_info["name"], request.by_team)
+    logger.info("-" * 60)
 
-            # 페이지로 이동 (Basic1 사용)
-            url = HITTER_BASIC1
-            if not compliance.is_allowed_sync(url):
-                logger.info("[COMPLIANCE] Navigation to %s aborted.", url)
-                return []
+    # 부분 수집(limit)은 캐시하지 않는다.
+    cache_key = None
+    if PAGE_CACHE_ENABLED and request.limit is None:
+        cache_key = PageCacheKey(year, series_key, "basic_by_team" if request.by_team else "basic")
+    cached_rows = get_cached_rows(cache_key) if cache_key else None
 
-            policy.delay(host="www.koreabaseball.com")
-            page.goto(url, wait_until="load", timeout=NAV_TIMEOUT)
-            page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+    if cached_rows is not None:
+        logger.info("♻️  캐시된 %s 타자 기록 사용: %s명", series_info["name"], len(cached_rows))
+        all_players_data = cached_rows
+    else:
+        # 페이지로 이동 (Basic1 사용)
+        if not compliance.is_allowed_sync(HITTER_BASIC1):
+            logger.info("[COMPLIANCE] Navigation to %s aborted.", HITTER_BASIC1)
+            return []
 
-            # 시즌과 시리즈 설정
-            try:
-                _select_season_and_series(page, year, series_info, policy)
-            except CRAWLER_EXCEPTIONS as e:
-                reason = f"Season/Series selection error: {e}"
-                logger.exception("Season/Series selection error, falling back to DB aggregation")
-                browser.close()
-                return _handle_batting_fallback(year, series_key, reason, save_to_db=save_to_db)
-
-            # 순회 대상 설정 (팀 옵션이 있으면 팀별, 없으면 전체 1회)
-            team_options = _get_team_options(page, by_team=by_team)
-            _collect_batting_stats_loop(
-                BattingCrawlContext(
-                    page=page,
-                    year=year,
-                    series_key=series_key,
-                    iteration_targets=team_options,
-                    by_team=by_team,
-                    limit=limit,
-                    policy=policy,
-                    unique_players=unique_players,
-                    all_players_data=all_players_data,
-                ),
+        if browser is not None:
+            all_players_data, fallback_reason, complete = _collect_batting_series(
+                browser,
+                request,
+                year,
+                series_info,
+                policy,
             )
-
-            # 정규시즌인 경우 Basic2 페이지에서 추가 데이터 수집
-            if series_key == "regular" and all_players_data:
-                all_players_data = _merge_basic2_data(all_players_data, page, year, series_info, policy)
-
-            logger.info("✅ %s 데이터 수집 완료", series_info["name"])
-
-        except DB_SAVE_EXCEPTIONS:
-            logger.exception("❌ 크롤링 중 오류")
-
-        finally:
-            browser.close()
+        else:
+            with sync_playwright() as playwright:
+                owned_browser = playwright.chromium.launch(headless=request.headless)
+                try:
+                    all_players_data, fallback_reason, complete = _collect_batting_series(
+                        owned_browser,
+                        request,
+                        year,
+                        series_info,
+                        policy,
+                    )
+                finally:
+                    owned_browser.close()
+
+        if fallback_reason:
+            return _handle_batting_fallback(year, series_key, fallback_reason, save_to_db=request.save_to_db)
+
+        # 오류를 삼킨 부분 수집 결과가 (지난 시즌이면 만료 없이) 캐시에 남지 않도록 완주한 경우만 저장한다.
+        if cache_key and all_players_data:
+            if complete:
+                put_cached_rows(cache_key, all_players_data)
+            else:
+                logger.warning("⚠️ 불완전한 수집 결과라 캐시하지 않습니다 (%s명)", len(all_players_data))
 
     all_players_data = _finalize_batting_summary(all_players_data, series_info)
-    _save_batting_if_needed(all_players_data, save_to_db=save_to_db)
+    _save_batting_if_needed(all_players_data, save_to_db=request.save_to_db)
     return all_players_data
 
 
@@ -1273,96 +1141,166 @@ def _save_batting_if_needed(all_players_data: list[dict], *, save_to_db: bool) -
 
 
 def crawl_all_series(
-    year: int | None = None,
-    limit: int | None = None,
+    request: BattingSeriesCrawlRequest | None = None,
     *,
-    save_to_db: bool = False,
-    headless: bool = False,
-    by_team: bool = False,
+    workers: int = 1,
+    browser: Browser | None = None,
 ) -> dict[str, list[dict]]:
     """모든 시리즈의 타자 기록을 크롤링.
 
     Args:
-        year: Season year.
-        limit: Limit.
-        save_to_db: Save To Db.
-        headless: Whether to run the browser in headless mode.
-        by_team: By Team.
+        request: 시리즈 공통 수집 설정 (series_key는 무시하고 모든 시리즈를 순회).
+        workers: 동시에 크롤링할 시리즈 수 (1이면 순차).
+        browser: 순차 모드에서 재사용할 브라우저 (None이면 새로 띄움).
 
     Returns:
         시리즈별 수집된 데이터 딕셔너리
 
+    Raises:
+        ValueError: workers가 1보다 큰데 browser를 함께 넘긴 경우.
+
     """
-    year = year or datetime.now(KST).year
+    if workers > 1 and browser is not None:
+        # sync Playwright 브라우저는 스레드 간에 공유할 수 없어 병렬 모드는 시리즈마다 브라우저를 따로 띄운다.
+        msg = "browser cannot be shared when workers > 1; pass one or the other"
+        raise ValueError(msg)
+
+    options = request or BattingSeriesCrawlRequest()
+    year = options.year or datetime.now(KST).year
 
     policy = RequestPolicy()
     series_mapping = get_series_mapping()
-    all_series_data = {}
 
-    for series_key, series_info in series_mapping.items():
-        logger.info("\n🚀 %s 시작...", series_info["name"])
-        series_data = crawl_series_batting_stats(
+    def crawl(series_key: str, browser: Browser | None = None) -> list[dict]:
+        logger.info("\n🚀 %s 시작...", series_mapping[series_key]["name"])
+        return crawl_series_batting_stats(
             BattingSeriesCrawlRequest(
                 year=year,
                 series_key=series_key,
-                limit=limit,
-                save_to_db=save_to_db,
-                headless=headless,
-                by_team=by_team,
+                limit=options.limit,
+                save_to_db=options.save_to_db,
+                headless=options.headless,
+                by_team=options.by_team,
             ),
+            browser=browser,
         )
-        all_series_data[series_key] = series_data
 
-        policy.delay()
+    workers = max(1, min(workers, len(series_mapping)))
+    if workers > 1:
+        # crawl_series_batting_stats는 호출마다 자체 sync_playwright/브라우저를 열므로 스레드 간 공유 상태가 없다.
+        # 워커(스레드)마다 RequestPolicy를 하나씩 두고 순차 모드처럼 시리즈 사이에 지연한다.
+        worker_state = threading.local()
+
+        def crawl_paced(series_key: str) -> list[dict]:
+            worker_policy = getattr(worker_state, "policy", None)
+            if worker_policy is None:
+                worker_policy = worker_state.policy = RequestPolicy()
+            data = crawl(series_key)
+            worker_policy.delay()
+            return data
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(series_mapping, executor.map(crawl_paced, series_mapping), strict=True))
+
+    # 순차 모드에서는 Chromium을 한 번만 띄우고 시리즈마다 새 컨텍스트만 연다.
+    if browser is None:
+        with sync_playwright() as playwright:
+            own_browser = playwright.chromium.launch(headless=options.headless)
+            try:
+                return crawl_all_series(options, browser=own_browser)
+            finally:
+                own_browser.close()
 
+    all_series_data = {}
+    for series_key in series_mapping:
+        all_series_data[series_key] = crawl(series_key, browser)
+        policy.delay()
     return all_series_data
 
 
+def _parse_years(value: str) -> list[int]:
+    # argparse type= 함수: ArgumentTypeError는 parser.error로 바뀌어 사용법과 함께 종료 코드 2로 끝난다.
+    start_text, sep, end_text = value.partition("-")
+    try:
+        start = int(start_text)
+        end = int(end_text) if sep else start
+    except ValueError:
+        msg = f"Invalid years: {value}. Use YYYY or YYYY-YYYY."
+        raise argparse.ArgumentTypeError(msg) from None
+    if start > end:
+        msg = f"Invalid years: {value}. Start year must not be after end year."
+        raise argparse.ArgumentTypeError(msg)
+    return list(range(start, end + 1))
+
+
+def _crawl_year(args: argparse.Namespace, year: int, browser: Browser | None) -> None:
+    request = BattingSeriesCrawlRequest(
+        year=year,
+        series_key=args.series or "regular",
+        limit=args.limit,
+        save_to_db=args.save,
+        headless=args.headless,
+        by_team=args.by_team,
+    )
+    if args.series:
+        # 특정 시리즈만 크롤링
+        crawl_series_batting_stats(request, browser=browser)
+        return
+
+    # 모든 시리즈 크롤링
+    all_data = crawl_all_series(request, workers=args.workers, browser=browser)
+
+    # 전체 요약
+    logger.info("%s", "\n" + "=" * 60)
+    logger.info("📈 전체 수집 요약 (%s년)", year)
+    logger.info("%s", "=" * 60)
+    for series_key, data in all_data.items():
+        series_name = SERIES_MAPPING[series_key]["name"]
+        logger.info("  %s: %s명", series_name, len(data))
+
+    total_players = sum(len(data) for data in all_data.values())
+    logger.info("\n총 수집 선수: %s명", total_players)
+
+
 def main() -> None:
     """Run the main entry point for this CLI command."""
     parser = argparse.ArgumentParser(description="KBO 전체 시리즈 타자 기록 크롤러")
 
     parser.add_argument("--year", type=int, default=datetime.now(KST).year, help="시즌 연도 (기본값: 당해 연도)")
+    parser.add_argument(
+        "--years",
+        type=_parse_years,
+        help="연도 범위 (예: 2015-2025). 지정 시 --year 대신 사용하며 브라우저 하나를 모든 연도에 재사용",
+    )
     parser.add_argument("--series", type=str, help="특정 시리즈만 크롤링 (regular, exhibition, wildcard, etc.)")
     parser.add_argument("--limit", type=int, help="수집할 선수 수 제한")
     parser.add_argument("--save", action="store_true", help="DB에 저장")
     parser.add_argument("--headless", action="store_true", help="헤드리스 모드로 실행")
     parser.add_argument("--by-team", action="store_true", help="팀별로 순회하여 모든 선수(비규정타석 포함) 수집")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="전체 시리즈 수집 시 병렬 브라우저(스레드) 수 (기본값: 1, 순차)",
+    )
 
     args = parser.parse_args()
 
-    if args.series:
-        # 특정 시리즈만 크롤링
-        crawl_series_batting_stats(
-            BattingSeriesCrawlRequest(
-                year=args.year,
-                series_key=args.series,
-                limit=args.limit,
-                save_to_db=args.save,
-                headless=args.headless,
-                by_team=args.by_team,
-            ),
-        )
-    else:
-        # 모든 시리즈 크롤링
-        all_data = crawl_all_series(
-            args.year,
-            args.limit,
-            save_to_db=args.save,
-            headless=args.headless,
-            by_team=args.by_team,
-        )
-
-        # 전체 요약
-        logger.info("%s", "\n" + "=" * 60)
-        logger.info("📈 전체 수집 요약 (%s년)", args.year)
-        logger.info("%s", "=" * 60)
-        for series_key, data in all_data.items():
-            series_name = get_series_mapping()[series_key]["name"]
-            logger.info("  %s: %s명", series_name, len(data))
+    years = args.years or [args.year]
+    if len(years) == 1 or (args.workers > 1 and not args.series):
+        # 병렬 시리즈 수집은 워커마다 브라우저를 띄우므로 공유 브라우저를 넘기지 않는다.
+        for year in years:
+            _crawl_year(args, year, browser=None)
+        return
 
-        total_players = sum(len(data) for data in all_data.values())
-        logger.info("\n총 수집 선수: %s명", total_players)
+    # 여러 연도를 돌 때는 Chromium을 한 번만 띄워 연도/시리즈마다 컨텍스트만 새로 연다.
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=args.headless)
+        try:
+            for year in years:
+                _crawl_year(args, year, browser=browser)
+        finally:
+            browser.close()
 
 
 if __name__ == "__main__":
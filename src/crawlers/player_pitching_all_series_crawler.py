@@ -22,10 +22,11 @@ import argparse
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from playwright.sync_api import ElementHandle, Page, sync_playwright
+from playwright.sync_api import Browser, ElementHandle, Page, sync_playwright
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeout
 from sqlalchemy.exc import SQLAlchemyError
@@ -40,10 +41,11 @@ from src.repositories.player_season_pitching_repository import save_pitching_sta
 from src.utils.fallback_monitor import FallbackMonitor
 from src.utils.player_season_stat_validation import filter_valid_season_stat_payloads
 from src.utils.player_stats_helpers import extract_rows_fast
+from src.utils.playwright_blocking import install_sync_resource_blocking
+from src.utils.playwright_helpers import select_option_if_changed, wait_for_postback
 from src.utils.playwright_retry import LONG_TIMEOUT, NAV_TIMEOUT, SEL_TIMEOUT, retry_wait_for_selector
 from src.utils.request_policy import RequestPolicy
 from src.utils.team_codes import resolve_team_code
-from src.utils.team_mapping import get_team_mapping_for_year
 from src.utils.type_helpers import (
     parse_innings,
     parse_innings_to_outs,
@@ -67,6 +69,9 @@ BASIC1_URL = PITCHER_BASIC1
 BASIC2_URL = PITCHER_BASIC2
 
 BASIC1_SORT_CODE = "G_CN"  # 'G' (경기) 헤더
+PLAYER_ID_PATTERN = re.compile(r"playerId=(\d+)")
+# KBO_FAST_PARSE=0이면 page.evaluate 일괄 추출 대신 DOM 순회 파서를 사용 (import 시 한 번만 읽음)
+FAST_PARSE_ENABLED = os.getenv("KBO_FAST_PARSE", "1") != "0"
 
 # 정규시즌 Basic2에서는 NP(투구수)만 수집
 BASIC2_SORT_SEQUENCE = [
@@ -161,6 +166,89 @@ PRIMARY_SORT_CONFIG = {
     "default": {"label": "G", "sort_code": "G_CN"},
 }
 
+# Basic2 헤더 → extra_stats["metrics"] 키와 변환 함수
+BASIC2_METRIC_FIELDS: dict[str, tuple[str, Callable[[str | None], int | float | None]]] = {
+    "CG": ("complete_games", safe_int_or_none),
+    "SHO": ("shutouts", safe_int_or_none),
+    "QS": ("quality_starts", safe_int_or_none),
+    "BSV": ("blown_saves", safe_int_or_none),
+    "TBF": ("tbf", safe_int_or_none),
+    "NP": ("np", safe_int_or_none),
+    "AVG": ("avg_against", safe_float_or_none),
+    "2B": ("doubles_allowed", safe_int_or_none),
+    "3B": ("triples_allowed", safe_int_or_none),
+    "SAC": ("sacrifices_allowed", safe_int_or_none),
+    "SF": ("sacrifice_flies_allowed", safe_int_or_none),
+}
+# Basic2 헤더 → PitcherStats 필드
+BASIC2_PITCHER_FIELDS = {
+    "IBB": "intentional_walks",
+    "WP": "wild_pitches",
+    "BK": "balks",
+}
+
+SEASON_SELECTOR = 'select[name*="ddlSeason"]'
+SERIES_SELECTOR = 'select[name*="ddlSeries"]'
+
+BASIC1_CORE_HEADERS = ("선수명", "팀명", "IP", "G", "ERA")
+BASIC1_EXTRACTION_JS = """
+() => {
+    const headers = Array.from(document.querySelectorAll('table.tData01 thead th')).map(
+        th => th.textContent.trim()
+    );
+    const headerIndex = {};
+    headers.forEach((h, i) => headerIndex[h] = i);
+
+    const playerIdRe = /playerId=(\\d+)/;
+    const rows = [];
+
+    document.querySelectorAll('table.tData01 tbody tr').forEach(row => {
+        const cells = Array.from(row.querySelectorAll('td'));
+        if (cells.length < headers.length) return;
+
+        // Player Info (Assuming "선수명" is present)
+        let nameIndex = headerIndex["선수명"];
+        if (nameIndex === undefined) return;
+
+        const nameCell = cells[nameIndex];
+        const link = nameCell.querySelector('a');
+        if (!link) return; // Should have link
+
+        const href = link.getAttribute('href');
+        const idMatch = playerIdRe.exec(href);
+        if (!idMatch) return;
+
+        const player_id = parseInt(idMatch[1]);
+        const player_name = link.textContent.trim();
+        const team_name = cells[headerIndex["팀명"]].textContent.trim();
+
+        // Extract raw text for mapping in Python
+        const raw = {};
+        for (const [key, idx] of Object.entries(headerIndex)) {
+            raw[key] = cells[idx].textContent.trim();
+        }
+
+        rows.push({ player_id, player_name, team_name, raw });
+    });
+    return { headers, rows };
+}
+"""
+
+# 헤더/행 텍스트를 한 번의 evaluate로 가져와 셀 단위 IPC 왕복을 피한다.
+TABLE_HEADERS_JS = """
+() => Array.from(document.querySelectorAll('table.tData01 thead th')).map(th => (th.textContent || '').trim())
+"""
+BASIC2_ROW_JS = """
+(row, nameIndex) => {
+    const cells = Array.from(row.querySelectorAll('td'));
+    const link = cells[nameIndex] ? cells[nameIndex].querySelector('a') : null;
+    return {
+        cells: cells.map(td => td.textContent || ''),
+        linkHref: link ? link.getAttribute('href') : null,
+    };
+}
+"""
+
 # ---------------------------------------------------------------------------
 # Helper utilities
 # ---------------------------------------------------------------------------
@@ -201,7 +289,14 @@ def extract_player_id(href: str | None) -> int | None:
     """
     if not href:
         return None
-    match = re.search(r"playerId=(\d+)", href)
+    _, sep, tail = href.partition("playerId=")
+    if not sep:
+        return None
+    digits = tail.split("&", 1)[0]
+    if digits.isascii() and digits.isdigit():
+        return int(digits)
+    # 프래그먼트가 붙은 href 등 정형 포맷이 아닐 때만 정규식으로 되돌아간다.
+    match = PLAYER_ID_PATTERN.search(href)
     return int(match.group(1)) if match else None
 
 
@@ -223,8 +318,6 @@ def wait_for_table(page: Page, timeout: int = 30000) -> None:
         )
     except PlaywrightTimeout:
         logger.exception("   ⚠️  테이블 행이 표시되지 않았습니다. (데이터 없음 가능성)")
-    finally:
-        page.wait_for_timeout(500)
 
 
 def go_to_next_page(page: Page, current_page: int, policy: RequestPolicy | None = None) -> bool:
@@ -258,11 +351,7 @@ def go_to_next_page(page: Page, current_page: int, policy: RequestPolicy | None
         if not btn or btn.get_attribute("disabled") or "disabled" in (btn.get_attribute("class") or ""):
             return False
 
-        if policy:
-            policy.delay()
-
-        page.click(selector, timeout=SEL_TIMEOUT)
-        page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
+        wait_for_postback(page, lambda: page.click(selector, timeout=SEL_TIMEOUT), policy)
 
         # 페이지 이동 후 테이블 대기
         wait_for_table(page)
@@ -284,10 +373,7 @@ def _apply_sort_by_code(
         page.wait_for_selector(selector, timeout=SEL_TIMEOUT)
         anchor = page.query_selector(selector)
         if anchor:
-            if policy:
-                policy.delay()
-            anchor.click()
-            page.wait_for_load_state("networkidle", timeout=LONG_TIMEOUT)
+            wait_for_postback(page, anchor.click, policy)
             if policy:
                 policy.delay()
             return True
@@ -296,10 +382,7 @@ def _apply_sort_by_code(
 
     has_sort_fn = page.evaluate("typeof sort === 'function'")
     if has_sort_fn:
-        if policy:
-            policy.delay()
-        page.evaluate(f"sort('{sort_code}')")
-        page.wait_for_load_state("networkidle", timeout=LONG_TIMEOUT)
+        wait_for_postback(page, lambda: page.evaluate(f"sort('{sort_code}')"), policy)
         if policy:
             policy.delay()
         return True
@@ -314,9 +397,7 @@ def _apply_sort_by_label(page: Page, header_label: str) -> bool:
 
         label = normalize_header(anchor.text_content() or "")
         if label == header_label:
-            anchor.click()
-            page.wait_for_load_state("networkidle", timeout=LONG_TIMEOUT)
-            page.wait_for_timeout(800)
+            wait_for_postback(page, anchor.click)
             return True
     return False
 
@@ -357,7 +438,7 @@ def apply_sort(
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class PitcherStats:
     """PitcherStats class."""
 
@@ -445,39 +526,13 @@ class PitcherStats:
 # ---------------------------------------------------------------------------
 
 
-def _get_and_validate_basic1_headers(page: Page) -> dict[str, int] | None:
-    try:
-        page.wait_for_selector("table.tData01", timeout=SEL_TIMEOUT)
-    except (PlaywrightError, PlaywrightTimeout):
-        logger.warning("기록 테이블을 찾을 수 없습니다. (타임아웃)")
-        return None
-
-    page.wait_for_timeout(2000)
-
-    headers = page.evaluate("""
-        () => {
-            const table = document.querySelector('table.tData01');
-            if (!table) return [];
-            const ths = table.querySelectorAll('thead th');
-            return Array.from(ths).map(th => th.textContent.trim());
-        }
-    """)
-    headers = [normalize_header(h) for h in headers]
-    header_index = {name: idx for idx, name in enumerate(headers)}
-
-    core_headers = ["선수명", "팀명", "IP", "G", "ERA"]
-    missing_core = [h for h in core_headers if h not in header_index]
+def _has_basic1_core_headers(headers: list[str]) -> bool:
+    header_names = {normalize_header(h) for h in headers}
+    missing_core = [h for h in BASIC1_CORE_HEADERS if h not in header_names]
     if missing_core:
         logger.warning("   ⚠️  Basic1 테이블 헤더에 필수 컬럼이 없습니다: %s", ", ".join(missing_core))
-        headers = page.evaluate("""
-            () => Array.from(document.querySelectorAll('table.tData01 thead th')).map(th => th.textContent.trim())
-        """)
-        headers = [normalize_header(h) for h in headers]
-        header_index = {name: idx for idx, name in enumerate(headers)}
-        if any(h not in header_index for h in core_headers):
-            return None
-
-    return header_index
+        return False
+    return True
 
 
 def _map_pitcher_basic1_stats(
@@ -588,62 +643,20 @@ def parse_basic1_page(
         Integer result.
 
     """
-    header_index = _get_and_validate_basic1_headers(page)
-
-    if not header_index:
+    try:
+        page.wait_for_selector("table.tData01", timeout=SEL_TIMEOUT)
+    except (PlaywrightError, PlaywrightTimeout):
+        logger.warning("기록 테이블을 찾을 수 없습니다. (타임아웃)")
         return 0
 
-    extraction_script = """
-    () => {
-        const rows = document.querySelectorAll('table.tData01 tbody tr');
-        if (rows.length === 0) return [];
-
-        const headers = Array.from(document.querySelectorAll('table.tData01 thead th')).map(
-            th => th.textContent.trim()
-        );
-        const headerIndex = {};
-        headers.forEach((h, i) => headerIndex[h] = i);
-
-        const results = [];
-
-        rows.forEach(row => {
-            const cells = Array.from(row.querySelectorAll('td'));
-            if (cells.length < headers.length) return;
-
-            // Player Info (Assuming "선수명" is present)
-            let nameIndex = headerIndex["선수명"];
-            if (nameIndex === undefined) return;
-
-            const nameCell = cells[nameIndex];
-            const link = nameCell.querySelector('a');
-            if (!link) return; // Should have link
-
-            const href = link.getAttribute('href');
-            const idMatch = href.match(/playerId=(\\d+)/);
-            if (!idMatch) return;
-
-            const player_id = parseInt(idMatch[1]);
-            const player_name = link.textContent.trim();
-            const team_name = cells[headerIndex["팀명"]].textContent.trim();
-
-            // Extract raw text for mapping in Python
-            const raw = {};
-            for (const [key, idx] of Object.entries(headerIndex)) {
-                raw[key] = cells[idx].textContent.trim();
-            }
-
-            results.push({ player_id, player_name, team_name, raw });
-        });
-        return results;
-    }
-    """
-
     try:
-        extracted_rows = page.evaluate(extraction_script)
-        get_team_mapping_for_year(season)
-        processed = 0
+        # 헤더와 행을 한 번의 evaluate로 받아 페이지마다 thead를 따로 읽지 않는다.
+        payload = page.evaluate(BASIC1_EXTRACTION_JS)
+        if not _has_basic1_core_headers(payload["headers"]):
+            return 0
 
-        for row in extracted_rows:
+        processed = 0
+        for row in payload["rows"]:
             if _map_pitcher_basic1_stats(row, season, league, pitchers, max_players):
                 processed += 1
 
@@ -660,40 +673,20 @@ def _extract_basic2_row_info(
     *,
     use_fast: bool,
 ) -> tuple[int | None, Callable[[int], str | None]] | None:
-    if use_fast:
-        cells = row.get("cells") or []  # type: ignore[union-attr]
-        if len(cells) < len(header_index):
-            return None
-        link_href = row.get("linkHref")  # type: ignore[union-attr]
-        player_id = extract_player_id(link_href)
-        if not player_id:
-            return None
+    if not use_fast:
+        # 느린 경로도 행당 evaluate 한 번으로 셀 텍스트와 링크를 함께 읽는다.
+        row = row.evaluate(BASIC2_ROW_JS, header_index["선수명"])  # type: ignore[union-attr]
 
-        def cell_text_fast(idx: int) -> str | None:
-            """Handle the cell text fast operation.
-
-            Args:
-                idx: Idx.
-                idx: Idx.
-
-            Returns:
-                The result of the operation.
-
-            """
-            return cells[idx] if len(cells) > idx else None
-
-        return player_id, cell_text_fast
-
-    cells = row.query_selector_all("td")  # type: ignore[union-attr]
+    cells = row.get("cells") or []  # type: ignore[union-attr]
     if len(cells) < len(header_index):
         return None
-    link = cells[header_index["선수명"]].query_selector("a")
-    player_id = extract_player_id(link.get_attribute("href") if link else None)
+    link_href = row.get("linkHref")  # type: ignore[union-attr]
+    player_id = extract_player_id(link_href)
     if not player_id:
         return None
 
-    def cell_text_slow(idx: int) -> str | None:
-        """Handle the cell text slow operation.
+    def cell_text(idx: int) -> str | None:
+        """Handle the cell text operation.
 
         Args:
             idx: Idx.
@@ -703,9 +696,9 @@ def _extract_basic2_row_info(
             The result of the operation.
 
         """
-        return cells[idx].text_content() if len(cells) > idx else None
+        return cells[idx] if len(cells) > idx else None
 
-    return player_id, cell_text_slow
+    return player_id, cell_text
 
 
 def _update_pitcher_basic2_stats(
@@ -716,33 +709,13 @@ def _update_pitcher_basic2_stats(
 ) -> None:
     metrics = stats.extra_stats.setdefault("metrics", {})
 
-    metric_mapping = {
-        "CG": ("complete_games", safe_int_or_none),
-        "SHO": ("shutouts", safe_int_or_none),
-        "QS": ("quality_starts", safe_int_or_none),
-        "BSV": ("blown_saves", safe_int_or_none),
-        "TBF": ("tbf", safe_int_or_none),
-        "NP": ("np", safe_int_or_none),
-        "AVG": ("avg_against", safe_float_or_none),
-        "2B": ("doubles_allowed", safe_int_or_none),
-        "3B": ("triples_allowed", safe_int_or_none),
-        "SAC": ("sacrifices_allowed", safe_int_or_none),
-        "SF": ("sacrifice_flies_allowed", safe_int_or_none),
-    }
-
-    for header_name, (key, caster) in metric_mapping.items():
+    for header_name, (key, caster) in BASIC2_METRIC_FIELDS.items():
         if header_name in header_index:
             value = caster(cell_text_fn(header_index[header_name]))
             if value is not None:
                 metrics[key] = value  # type: ignore[index]
 
-    single_mapping = {
-        "IBB": "intentional_walks",
-        "WP": "wild_pitches",
-        "BK": "balks",
-    }
-
-    for header_name, field_name in single_mapping.items():
+    for header_name, field_name in BASIC2_PITCHER_FIELDS.items():
         if header_name in header_index:
             val = safe_int_or_none(cell_text_fn(header_index[header_name]))
             if val is not None:
@@ -771,18 +744,25 @@ def parse_basic2_page(ctx: Basic2PageContext) -> int:
         logger.warning("⚠️  Basic2 테이블 헤더 파싱 실패 (타임아웃)")
         return 0
 
-    headers = [
-        normalize_header(th.text_content() or "") for th in ctx.page.query_selector_all("table.tData01 thead th")
-    ]
+    headers = [normalize_header(h) for h in ctx.page.evaluate(TABLE_HEADERS_JS)]
     header_index = {name: idx for idx, name in enumerate(headers)}
-    get_team_mapping_for_year(ctx.season)
-    use_fast = os.getenv("KBO_FAST_PARSE", "1") != "0"
+    use_fast = FAST_PARSE_ENABLED
 
     if "선수명" not in header_index or "팀명" not in header_index:
         logger.warning("⚠️  Basic2 테이블 헤더 파싱 실패")
         return 0
 
-    rows_data = extract_rows_fast(ctx.page, selector="table.tData01", link_query="a") if use_fast else None
+    rows_data = (
+        extract_rows_fast(
+            ctx.page,
+            selector="table.tData01",
+            link_query="a",
+            min_cells=len(header_index),
+            require_link=True,
+        )
+        if use_fast
+        else None
+    )
     rows = rows_data if rows_data is not None else ctx.page.query_selector_all("table.tData01 tbody tr")
     processed = 0
 
@@ -836,29 +816,18 @@ def setup_pitcher_page(page: Page, url: str, year: int, series_value: str, polic
 
     logger.info("   🌐 Navigating to %s...", url)
     try:
-        page.goto(url, wait_until="networkidle", timeout=LONG_TIMEOUT)
+        page.goto(url, wait_until="domcontentloaded", timeout=LONG_TIMEOUT)
     except CRAWLER_EXCEPTIONS:
         logger.exception("   ❌ %s 페이지 로딩 실패", url)
         return False
 
-    if policy:
-        policy.delay()
-
     try:
-        season_selector = 'select[name*="ddlSeason"]'
-        series_selector = 'select[name*="ddlSeries"]'
-
+        page.wait_for_selector(SEASON_SELECTOR, state="attached", timeout=NAV_TIMEOUT)
         logger.info("   ⚙️  Selecting Season %s...", year)
-        page.select_option(season_selector, str(year))
-        page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
-        if policy:
-            policy.delay()
+        select_option_if_changed(page, SEASON_SELECTOR, str(year), policy)
 
         logger.info("   ⚙️  Selecting Series %s...", series_value)
-        page.select_option(series_selector, value=series_value)
-        page.wait_for_load_state("networkidle", timeout=NAV_TIMEOUT)
-        if policy:
-            policy.delay()
+        select_option_if_changed(page, SERIES_SELECTOR, series_value, policy)
 
         # KBO 페이지 에러 감지 (500 에러 등)
         title = page.title()
@@ -1031,11 +1000,13 @@ def _select_pitcher_team_if_needed(page: Page, tm: dict, *, by_team: bool, polic
     if by_team and tm["value"]:
         logger.info("🔍 팀 선택: %s (%s)", tm["text"], tm["value"])
         try:
-            page.select_option(
-                'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlTeam$ddlTeam"]',
-                tm["value"],
+            wait_for_postback(
+                page,
+                lambda: page.select_option(
+                    'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlTeam$ddlTeam"]',
+                    tm["value"],
+                ),
             )
-            page.wait_for_load_state("networkidle", timeout=LONG_TIMEOUT)
             policy.delay()
         except CRAWLER_EXCEPTIONS:
             logger.exception("⚠️ 팀 선택 실패 (%s)", tm["text"])
@@ -1120,57 +1091,48 @@ class PitchingSeriesCrawlRequest:
     by_team: bool = False
 
 
-def crawl_pitcher_series(request: PitchingSeriesCrawlRequest) -> list[PitcherStats]:
-    """Crawl pitcher series.
+def _collect_pitcher_series(
+    browser: Browser,
+    request: PitchingSeriesCrawlRequest,
+    pitchers: dict[int, PitcherStats],
+    policy: RequestPolicy,
+) -> str | None:
+    """Run Basic1/Basic2 collection in a fresh context on ``browser``.
 
     Args:
+        browser: Browser.
         request: Selection and persistence settings.
+        pitchers: Pitchers.
+        policy: Policy.
 
     Returns:
-        List of results.
+        Fallback reason when the Basic1 page could not be set up, otherwise None.
 
     """
-    year = request.year
-    series_key = request.series_key
-    limit = request.limit
-    headless = request.headless
-    save_to_db = request.save_to_db
-    by_team = request.by_team
-    if series_key not in SERIES_MAPPING:
-        msg = f"지원하지 않는 시리즈 키: {series_key}"
-        raise ValueError(msg)
-
-    series_info = SERIES_MAPPING[series_key]
+    series_info = SERIES_MAPPING[request.series_key]
     league_name = series_info.get("league", "REGULAR")
-    logger.info("\n📊 %s년 %s 수집 시작 (by_team=%s)", year, series_info["name"], by_team)
-
-    pitchers: dict[int, PitcherStats] = {}
-    policy = RequestPolicy()
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        # Apply UA rotation via context
-        context = browser.new_context(**policy.build_context_kwargs(locale="ko-KR"))
+    # Apply UA rotation via context
+    context = browser.new_context(**policy.build_context_kwargs(locale="ko-KR"))
+    try:
+        install_sync_resource_blocking(context)
         page = context.new_page()
         page.set_default_timeout(60000)
 
         # Step 1: Basic1 - 시리즈별 정렬 후 전체 페이지 수집
-        if not setup_pitcher_page(page, BASIC1_URL, year, series_info["value"], policy=policy):
-            reason = "Basic1 page setup failed (possible KBO site error)"
-            logger.error("❌ Basic1 페이지 설정 실패. %s. DB에서 직접 집계하여 폴백(Fallback)을 시도합니다.", reason)
-            browser.close()
-            return _handle_pitching_fallback(year, series_key, reason, save_to_db=save_to_db)
+        if not setup_pitcher_page(page, BASIC1_URL, request.year, series_info["value"], policy=policy):
+            return "Basic1 page setup failed (possible KBO site error)"
 
         # 순회 대상 설정 (팀 옵션이 있으면 팀별, 없으면 전체 1회)
-        team_options = _get_pitcher_team_options(page, by_team=by_team)
+        team_options = _get_pitcher_team_options(page, by_team=request.by_team)
         _collect_pitcher_basic1_loop(
             PitcherBasic1Context(
                 page=page,
-                year=year,
+                year=request.year,
                 league_name=league_name,
                 iteration_targets=team_options,
-                by_team=by_team,
-                limit=limit,
+                by_team=request.by_team,
+                limit=request.limit,
                 policy=policy,
                 pitchers=pitchers,
             ),
@@ -1178,22 +1140,66 @@ def crawl_pitcher_series(request: PitchingSeriesCrawlRequest) -> list[PitcherSta
 
         logger.info("✅ Basic1 수집 완료: 총 %s명", len(pitchers))
 
-        if series_key == "regular" and not by_team:
+        if request.series_key == "regular" and not request.by_team:
             _collect_pitcher_basic2_additional(
                 Basic2AdditionalContext(
                     page=page,
-                    year=year,
+                    year=request.year,
                     league_name=league_name,
                     series_info=series_info,
-                    limit=limit,
+                    limit=request.limit,
                     policy=policy,
                     pitchers=pitchers,
                 ),
             )
-        elif by_team:
+        elif request.by_team:
             logger.info("[info] 팀별 순회 모드에서는 Basic2(상세 지표) 수집을 건너뜁니다.")
+    finally:
+        context.close()
+    return None
+
+
+def crawl_pitcher_series(request: PitchingSeriesCrawlRequest, browser: Browser | None = None) -> list[PitcherStats]:
+    """Crawl pitcher series.
+
+    Args:
+        request: Selection and persistence settings.
+        browser: Already-launched browser to reuse; a private one is launched and closed when omitted.
 
-        browser.close()
+    Returns:
+        List of results.
+
+    """
+    year = request.year
+    series_key = request.series_key
+    limit = request.limit
+    save_to_db = request.save_to_db
+    if series_key not in SERIES_MAPPING:
+        msg = f"지원하지 않는 시리즈 키: {series_key}"
+        raise ValueError(msg)
+
+    series_info = SERIES_MAPPING[series_key]
+    logger.info("\n📊 %s년 %s 수집 시작 (by_team=%s)", year, series_info["name"], request.by_team)
+
+    pitchers: dict[int, PitcherStats] = {}
+    policy = RequestPolicy()
+
+    if browser is not None:
+        fallback_reason = _collect_pitcher_series(browser, request, pitchers, policy)
+    else:
+        with sync_playwright() as playwright:
+            owned_browser = playwright.chromium.launch(headless=request.headless)
+            try:
+                fallback_reason = _collect_pitcher_series(owned_browser, request, pitchers, policy)
+            finally:
+                owned_browser.close()
+
+    if fallback_reason:
+        logger.error(
+            "❌ Basic1 페이지 설정 실패. %s. DB에서 직접 집계하여 폴백(Fallback)을 시도합니다.",
+            fallback_reason,
+        )
+        return _handle_pitching_fallback(year, series_key, fallback_reason, save_to_db=save_to_db)
 
     stats_list = list(pitchers.values())
     if limit:
@@ -1251,13 +1257,53 @@ def parse_arguments() -> argparse.Namespace:
         help="DB에 저장",
     )
     parser.add_argument("--by-team", action="store_true", help="팀별로 순회하여 모든 선수(비규정타석 포함) 수집")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="전체 시리즈 수집 시 병렬 브라우저(스레드) 수 (기본값: 1, 순차)",
+    )
     return parser.parse_args()
 
 
+def _crawl_all_series(args: argparse.Namespace) -> dict[str, list[PitcherStats]]:
+    def crawl(series_key: str, browser: Browser | None = None) -> list[PitcherStats]:
+        logger.info("\n🚀 %s 시작...", SERIES_MAPPING[series_key]["name"])
+        return crawl_pitcher_series(
+            PitchingSeriesCrawlRequest(
+                year=args.year,
+                series_key=series_key,
+                limit=args.limit,
+                headless=args.headless,
+                save_to_db=args.save,
+                by_team=args.by_team,
+            ),
+            browser=browser,
+        )
+
+    workers = max(1, min(args.workers, len(SERIES_MAPPING)))
+    if workers > 1:
+        # crawl_pitcher_series는 호출마다 자체 sync_playwright/브라우저를 열므로 스레드 간 공유 상태가 없다.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(SERIES_MAPPING, executor.map(crawl, SERIES_MAPPING), strict=True))
+
+    # 순차 모드에서는 Chromium을 한 번만 띄우고 시리즈마다 새 컨텍스트만 연다.
+    policy = RequestPolicy()
+    all_data = {}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=args.headless)
+        try:
+            for series_key in SERIES_MAPPING:
+                all_data[series_key] = crawl(series_key, browser)
+                policy.delay()
+        finally:
+            browser.close()
+    return all_data
+
+
 def main() -> None:
     """Run the main entry point for this CLI command."""
     args = parse_arguments()
-    policy = RequestPolicy()
 
     if args.series:
         # 특정 시리즈만 크롤링
@@ -1273,21 +1319,7 @@ def main() -> None:
         )
     else:
         # 모든 시리즈 크롤링 (타자 크롤러와 동일한 패턴)
-        all_data = {}
-        for series_key, series_info in SERIES_MAPPING.items():
-            logger.info("\n🚀 %s 시작...", series_info["name"])
-            series_data = crawl_pitcher_series(
-                PitchingSeriesCrawlRequest(
-                    year=args.year,
-                    series_key=series_key,
-                    limit=args.limit,
-                    headless=args.headless,
-                    save_to_db=args.save,
-                    by_team=args.by_team,
-                ),
-            )
-            all_data[series_key] = series_data
-            policy.delay()
+        all_data = _crawl_all_series(args)
 
         # 전체 요약
         logger.info("%s", "\n" + "=" * 60)
@@ -31,7 +31,12 @@ from src.utils.playwright_retry import SEL_TIMEOUT, SHORT_TIMEOUT
 from src.utils.request_policy import RequestPolicy
 from src.utils.schedule_validation import validate_schedule_game_payload
 from src.utils.stadium_codes import STADIUM_SHORT_NAME_MAP
-from src.utils.team_codes import normalize_kbo_game_id, resolve_team_code, team_code_from_game_id_segment
+from src.utils.team_codes import (
+    KBO_LEGACY_TECHNICAL_CODE,
+    normalize_kbo_game_id,
+    resolve_team_code,
+    team_code_from_game_id_segment,
+)
 
 logger = logging.getLogger(__name__)
 SCHEDULE_CRAWLER_EXCEPTIONS = (PlaywrightError, TimeoutError, RuntimeError, ValueError, TypeError, KeyError, OSError)
@@ -584,21 +589,8 @@ class ScheduleCrawler:
 
                     # KBO Website uses LEGACY codes in Game IDs.
                     # We must map our canonical codes (KH, DB, SSG, KIA) to KBO legacy (WO, OB, SK, HT).
-                    kbo_legacy_codes = {
-                        "KH": "WO",  # Kiwoom -> Woori
-                        "DB": "OB",  # Doosan -> OB
-                        "SSG": "SK",  # SSG -> SK (Wyverns)
-                        "KIA": "HT",  # KIA -> Haitai
-                        "LT": "LT",
-                        "LG": "LG",
-                        "NC": "NC",
-                        "HH": "HH",
-                        "KT": "KT",
-                        "SS": "SS",
-                    }
-
-                    kbo_away_code = kbo_legacy_codes.get(away_code, away_code)
-                    kbo_home_code = kbo_legacy_codes.get(home_code, home_code)
+                    kbo_away_code = KBO_LEGACY_TECHNICAL_CODE.get(away_code, away_code)
+                    kbo_home_code = KBO_LEGACY_TECHNICAL_CODE.get(home_code, home_code)
 
                     if g.get("game_date") and kbo_away_code and kbo_home_code:
                         # Construct ID: YYYYMMDD + AWAY + HOME + DH
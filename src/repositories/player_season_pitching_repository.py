@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 LAST_FILTER_COUNTS: Counter = Counter()
+# 다중 행 UPSERT 한 문장당 행 수 (~44컬럼 기준 바인드 변수 ~22k, SQLite 한도 32766 이내)
+PITCHING_UPSERT_CHUNK_SIZE = 500
 
 
 def get_last_filter_counts() -> dict[str, int]:
@@ -75,24 +77,13 @@ def save_pitching_stats_to_db(payloads: list[dict[str, Any]]) -> int:
         db_type = get_database_type()
         saved_count = 0
 
-        for payload in payloads:
-            data = _build_pitching_row(payload)
-            stmt = _build_pitching_upsert_stmt(data, db_type)
-            if stmt is None:
-                _merge_pitching_row(session, data)
-                saved_count += 1
-                continue
-
-            try:
-                session.execute(stmt)
-                saved_count += 1
-            except SQLAlchemyError:
-                logger.exception("⚠️ UPSERT 실패 (player_id=%s)", data.get("player_id"))
-                session.rollback()
-                continue
-
         try:
-            session.commit()
+            for rows in _group_pitching_rows([_build_pitching_row(payload) for payload in payloads]):
+                for start in range(0, len(rows), PITCHING_UPSERT_CHUNK_SIZE):
+                    chunk = rows[start : start + PITCHING_UPSERT_CHUNK_SIZE]
+                    saved_count += _save_pitching_chunk(session, chunk, db_type)
+                    # 청크마다 커밋해 다음 청크의 개별 처리 전환(rollback)이 앞서 저장한 청크를 되돌리지 않게 한다.
+                    session.commit()
             logger.info("✅ 투수 데이터 %s건 저장 완료 (player_season_pitching 테이블)", saved_count)
         except SQLAlchemyError:
             session.rollback()
@@ -102,6 +93,52 @@ def save_pitching_stats_to_db(payloads: list[dict[str, Any]]) -> int:
         return saved_count
 
 
+def _save_pitching_chunk(session: Session, rows: list[dict[str, Any]], db_type: str) -> int:
+    stmt = _build_pitching_upsert_stmt(rows, db_type)
+    if stmt is None:
+        for data in rows:
+            _merge_pitching_row(session, data)
+        return len(rows)
+    return _execute_pitching_upsert(session, stmt, rows, db_type)
+
+
+def _group_pitching_rows(rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    # None 컬럼은 행마다 제거되므로, 같은 컬럼 구성끼리 묶어야 다중 VALUES UPSERT가 가능하다.
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row), []).append(row)
+    return list(groups.values())
+
+
+def _execute_pitching_upsert(
+    session: Session,
+    stmt: object,
+    rows: list[dict[str, Any]],
+    db_type: str,
+) -> int:
+    try:
+        session.execute(stmt)
+        return len(rows)
+    except SQLAlchemyError:
+        session.rollback()
+        if len(rows) == 1:
+            logger.exception("⚠️ UPSERT 실패 (player_id=%s)", rows[0].get("player_id"))
+            return 0
+        logger.exception("⚠️ 배치 UPSERT 실패, 개별 처리로 전환합니다")
+
+    saved_count = 0
+    for data in rows:
+        try:
+            session.execute(_build_pitching_upsert_stmt([data], db_type))
+            # 다음 행의 실패 rollback이 이미 저장한 행을 되돌리지 않도록 행마다 커밋한다.
+            session.commit()
+            saved_count += 1
+        except SQLAlchemyError:
+            logger.exception("⚠️ UPSERT 실패 (player_id=%s)", data.get("player_id"))
+            session.rollback()
+    return saved_count
+
+
 def _build_pitching_row(payload: dict[str, Any]) -> dict[str, Any]:
     extra_stats = payload.get("extra_stats", {})
     metrics = extra_stats.get("metrics", {}) if isinstance(extra_stats, dict) else {}
@@ -159,22 +196,23 @@ def _build_pitching_row(payload: dict[str, Any]) -> dict[str, Any]:
     return {key: value for key, value in data.items() if value is not None}
 
 
-def _build_pitching_upsert_stmt(data: dict[str, Any], db_type: str) -> object | None:
+def _build_pitching_upsert_stmt(rows: list[dict[str, Any]], db_type: str) -> object | None:
     key_fields = ["player_id", "season", "league", "level"]
+    update_keys = [key for key in rows[0] if key not in key_fields]
     if db_type == "sqlite":
-        stmt = sqlite_insert(PlayerSeasonPitching).values(**data)
+        stmt = sqlite_insert(PlayerSeasonPitching).values(rows)
         return stmt.on_conflict_do_update(
             index_elements=key_fields,
-            set_={key: stmt.excluded[key] for key in data if key not in key_fields},
+            set_={key: stmt.excluded[key] for key in update_keys},
         )
     if db_type == "mysql":
-        stmt = mysql_insert(PlayerSeasonPitching).values(**data)
-        return stmt.on_duplicate_key_update({key: stmt.inserted[key] for key in data if key not in key_fields})
+        stmt = mysql_insert(PlayerSeasonPitching).values(rows)
+        return stmt.on_duplicate_key_update({key: stmt.inserted[key] for key in update_keys})
     if db_type == "postgresql":
-        stmt = postgresql_insert(PlayerSeasonPitching).values(**data)
+        stmt = postgresql_insert(PlayerSeasonPitching).values(rows)
         return stmt.on_conflict_do_update(
             index_elements=key_fields,
-            set_={key: stmt.excluded[key] for key in data if key not in key_fields},
+            set_={key: stmt.excluded[key] for key in update_keys},
         )
     return None
 
@@ -16,7 +16,7 @@ from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 
-from src.db.engine import SessionLocal, get_database_type
+from src.db.engine import Engine, SessionLocal, get_database_type
 from src.models.player import PlayerSeasonBatting
 from src.utils.player_season_stat_validation import filter_valid_season_stat_payloads
 
@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 LAST_FILTER_COUNTS: Counter = Counter()
 BATTING_CONFLICT_KEYS = ["player_id", "season", "league", "level"]
+# 다중 행 UPSERT 한 문장당 행 수 (31컬럼 기준 바인드 변수 ~15k, SQLite 한도 32766 이내)
+BATTING_UPSERT_CHUNK_SIZE = 500
 
 
 def get_last_filter_counts() -> dict[str, int]:
@@ -177,37 +179,57 @@ def _execute_single_upsert(session: Session, stmt: object, data: dict[str, Any])
         return 1
 
 
+def _existing_batting_rows(
+    session: Session,
+    rows: list[dict[str, Any]],
+) -> dict[tuple[Any, Any, Any, Any], PlayerSeasonBatting]:
+    # 행마다 SELECT 하지 않고 청크의 기존 레코드를 한 번에 읽어 업무 키로 색인한다.
+    existing = (
+        session.query(PlayerSeasonBatting)
+        .filter(
+            PlayerSeasonBatting.player_id.in_({row["player_id"] for row in rows}),
+            PlayerSeasonBatting.season.in_({row["season"] for row in rows}),
+        )
+        .all()
+    )
+    return {(record.player_id, record.season, record.league, record.level): record for record in existing}
+
+
 def _save_generic_rows(session: Session, rows: list[dict[str, Any]]) -> int:
     saved_count = 0
-    for data in rows:
-        existing = (
-            session.query(PlayerSeasonBatting)
-            .filter_by(
-                player_id=data["player_id"],
-                season=data["season"],
-                league=data["league"],
-                level=data["level"],
-            )
-            .first()
-        )
-        if existing:
-            for key, value in data.items():
-                if value is not None:
-                    setattr(existing, key, value)
-        else:
-            session.add(PlayerSeasonBatting(**data))
-        saved_count += 1
+    for start in range(0, len(rows), BATTING_UPSERT_CHUNK_SIZE):
+        chunk = rows[start : start + BATTING_UPSERT_CHUNK_SIZE]
+        existing_rows = _existing_batting_rows(session, chunk)
+        for data in chunk:
+            existing = existing_rows.get((data["player_id"], data["season"], data["league"], data["level"]))
+            if existing:
+                for key, value in data.items():
+                    if value is not None:
+                        setattr(existing, key, value)
+            else:
+                session.add(PlayerSeasonBatting(**data))
+            saved_count += 1
     return saved_count
 
 
+_DIALECT_ROW_SAVERS = {
+    "sqlite": _save_sqlite_rows,
+    "mysql": _save_mysql_rows,
+    "postgresql": _save_postgresql_rows,
+}
+
+
 def _save_rows_by_database_type(session: Session, rows: list[dict[str, Any]], db_type: str) -> int:
-    if db_type == "sqlite":
-        return _save_sqlite_rows(session, rows)
-    if db_type == "mysql":
-        return _save_mysql_rows(session, rows)
-    if db_type == "postgresql":
-        return _save_postgresql_rows(session, rows)
-    return _save_generic_rows(session, rows)
+    save_rows = _DIALECT_ROW_SAVERS.get(db_type)
+    if save_rows is None:
+        return _save_generic_rows(session, rows)
+
+    saved_count = 0
+    for start in range(0, len(rows), BATTING_UPSERT_CHUNK_SIZE):
+        saved_count += save_rows(session, rows[start : start + BATTING_UPSERT_CHUNK_SIZE])
+        # 청크마다 커밋해 다음 청크의 개별 처리 전환(rollback)이 앞서 저장한 청크를 되돌리지 않게 한다.
+        session.commit()
+    return saved_count
 
 
 def save_batting_stats_safe(payloads: list[dict[str, Any]]) -> int:
@@ -236,7 +258,9 @@ def save_batting_stats_safe(payloads: list[dict[str, Any]]) -> int:
     if not payloads:
         return 0
 
-    with SessionLocal() as session:
+    # 청크마다 커밋해도 같은 커넥션을 쓰도록 세션을 커넥션 하나에 묶는다.
+    # (풀로 돌아간 커넥션이 바뀌면 foreign_keys PRAGMA가 첫 청크에만 적용되고, OFF 상태 커넥션이 풀에 남는다.)
+    with Engine.connect() as connection, SessionLocal(bind=connection) as session:
         db_type = get_database_type()
 
         try:
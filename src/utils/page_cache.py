@@ -0,0 +1,88 @@
+"""File-backed cache for parsed KBO record tables.
+
+지난 시즌 기록은 바뀌지 않으므로 재크롤링/개발 반복 시 Playwright 왕복 없이 재사용한다.
+``KBO_PAGE_CACHE=1``일 때만 활성화되며, 당해 시즌은 TTL이 지나면 무효화된다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from src.constants import KST
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "data" / "page_cache"
+CURRENT_SEASON_TTL_SECONDS = 6 * 60 * 60
+PAGE_CACHE_ENABLED = os.getenv("KBO_PAGE_CACHE", "0") == "1"
+
+
+@dataclass(frozen=True, slots=True)
+class PageCacheKey:
+    """Identity of one parsed record table."""
+
+    year: int
+    series_key: str
+    view: str
+
+    def path(self, cache_dir: Path) -> Path:
+        """Return the JSON file backing this key.
+
+        Args:
+            cache_dir: Cache root directory.
+
+        Returns:
+            Path object.
+
+        """
+        return cache_dir / str(self.year) / self.series_key / f"{self.view}.json"
+
+
+def get_cached_rows(key: PageCacheKey, cache_dir: Path | None = None) -> list[dict] | None:
+    """Return cached rows for ``key`` or None on miss/expiry.
+
+    Args:
+        key: Cache key.
+        cache_dir: Cache root directory (default: data/page_cache).
+
+    Returns:
+        Cached rows, or None.
+
+    """
+    path = key.path(cache_dir or DEFAULT_CACHE_DIR)
+    try:
+        if key.year >= datetime.now(KST).year and time.time() - path.stat().st_mtime > CURRENT_SEASON_TTL_SECONDS:
+            return None
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable page cache entry %s", path)
+        return None
+    return rows if isinstance(rows, list) else None
+
+
+def put_cached_rows(key: PageCacheKey, rows: list[dict], cache_dir: Path | None = None) -> None:
+    """Store ``rows`` for ``key``.
+
+    Args:
+        key: Cache key.
+        rows: Parsed rows (JSON-serializable).
+        cache_dir: Cache root directory (default: data/page_cache).
+
+    """
+    path = key.path(cache_dir or DEFAULT_CACHE_DIR)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+    except (OSError, TypeError, ValueError):
+        logger.warning("Failed to write page cache entry %s", path)
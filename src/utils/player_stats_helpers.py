@@ -14,6 +14,9 @@ def extract_rows_fast(
     page: Page,
     selector: str = "table",
     link_query: str = "td:nth-child(2) a",
+    *,
+    min_cells: int = 0,
+    require_link: bool = False,
 ) -> list[dict[str, object]] | None:
     """Extract rows fast.
 
@@ -27,6 +30,8 @@ def extract_rows_fast(
         page: Playwright page object.
         selector: Selector.
         link_query: Link Query.
+        min_cells: Rows with fewer ``td`` cells are dropped in the browser.
+        require_link: Drop rows without a ``link_query`` match in the browser.
 
     Returns:
         The result of the operation.
@@ -41,18 +46,28 @@ def extract_rows_fast(
                 if (!table) return null;
                 const body = table.tBodies && table.tBodies.length ? table.tBodies[0] : table;
                 const rows = Array.from(body.querySelectorAll('tr'));
-                return rows.map((row) => {
-                    const cells = Array.from(row.querySelectorAll('td')).map(td => (td.textContent || '').trim());
+                const result = [];
+                for (const row of rows) {
+                    // 쓸모없는 행은 직렬화 전에 브라우저에서 걸러 CDP 전송량을 줄인다.
+                    const tds = row.querySelectorAll('td');
+                    if (tds.length < args.minCells) continue;
                     const link = row.querySelector(args.linkQuery);
-                    return {
-                        cells,
+                    if (args.requireLink && !link) continue;
+                    result.push({
+                        cells: Array.from(tds).map(td => (td.textContent || '').trim()),
                         linkText: link ? (link.textContent || '').trim() : null,
                         linkHref: link ? link.getAttribute('href') : null,
-                    };
-                });
+                    });
+                }
+                return result;
             }
             """,
-            {"selector": selector, "linkQuery": link_query},
+            {
+                "selector": selector,
+                "linkQuery": link_query,
+                "minCells": min_cells,
+                "requireLink": require_link,
+            },
         )
     except (PlaywrightError, RuntimeError, TypeError, ValueError):
         logger.exception("Failed to execute JS payload")
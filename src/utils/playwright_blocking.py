@@ -3,23 +3,42 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from playwright.async_api import BrowserContext as AsyncBrowserContext
     from playwright.async_api import Page as AsyncPage
+    from playwright.async_api import Request as AsyncRequest
     from playwright.async_api import Route as AsyncRoute
     from playwright.sync_api import BrowserContext as SyncBrowserContext
     from playwright.sync_api import Page as SyncPage
+    from playwright.sync_api import Request as SyncRequest
     from playwright.sync_api import Route as SyncRoute
 
 DEFAULT_BLOCKED_RESOURCE_TYPES: set[str] = {"image", "media", "font"}
+# 표 텍스트만 읽는 기록 크롤러용: 스타일시트까지 막는다 (document/xhr/fetch/script는 포스트백에 필요).
+TABLE_ONLY_BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset({*DEFAULT_BLOCKED_RESOURCE_TYPES, "stylesheet"})
+# 분석/광고 트래커는 리소스 타입(script/xhr)과 무관하게 호스트로 차단한다.
+DEFAULT_BLOCKED_HOSTS: tuple[str, ...] = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+)
+
+
+def _should_block(request: AsyncRequest | SyncRequest, types: set[str], hosts: tuple[str, ...]) -> bool:
+    if request.resource_type in types:
+        return True
+    host = urlsplit(request.url).hostname or ""
+    return any(host == blocked or host.endswith(f".{blocked}") for blocked in hosts)
 
 
 async def install_async_resource_blocking(
     target: AsyncBrowserContext | AsyncPage,
     blocked_types: Iterable[str] | None = None,
+    blocked_hosts: Iterable[str] | None = None,
 ) -> None:
     """Handle the install async resource blocking operation.
 
@@ -30,9 +49,11 @@ async def install_async_resource_blocking(
         blocked_types: Blocked Types.
         target: Target.
         blocked_types: Blocked Types.
+        blocked_hosts: Hosts (and their subdomains) to abort; defaults to analytics/ad trackers.
 
     """
     types = set(blocked_types or DEFAULT_BLOCKED_RESOURCE_TYPES)
+    hosts = DEFAULT_BLOCKED_HOSTS if blocked_hosts is None else tuple(blocked_hosts)
 
     async def handler(route: AsyncRoute) -> None:
         """Handle the handler operation.
@@ -43,7 +64,7 @@ async def install_async_resource_blocking(
             route: Route.
 
         """
-        if route.request.resource_type in types:
+        if _should_block(route.request, types, hosts):
             await route.abort()
         else:
             await route.continue_()
@@ -54,6 +75,7 @@ async def install_async_resource_blocking(
 def install_sync_resource_blocking(
     target: SyncBrowserContext | SyncPage,
     blocked_types: Iterable[str] | None = None,
+    blocked_hosts: Iterable[str] | None = None,
 ) -> None:
     """Sync install resource blocking.
 
@@ -64,9 +86,11 @@ def install_sync_resource_blocking(
         blocked_types: Blocked Types.
         target: Target.
         blocked_types: Blocked Types.
+        blocked_hosts: Hosts (and their subdomains) to abort; defaults to analytics/ad trackers.
 
     """
     types = set(blocked_types or DEFAULT_BLOCKED_RESOURCE_TYPES)
+    hosts = DEFAULT_BLOCKED_HOSTS if blocked_hosts is None else tuple(blocked_hosts)
 
     def handler(route: SyncRoute) -> None:
         """Handle the handler operation.
@@ -77,7 +101,7 @@ def install_sync_resource_blocking(
             route: Route.
 
         """
-        if route.request.resource_type in types:
+        if _should_block(route.request, types, hosts):
             route.abort()
         else:
             route.continue_()
@@ -86,7 +110,9 @@ def install_sync_resource_blocking(
 
 
 __all__ = [
+    "DEFAULT_BLOCKED_HOSTS",
     "DEFAULT_BLOCKED_RESOURCE_TYPES",
+    "TABLE_ONLY_BLOCKED_RESOURCE_TYPES",
     "install_async_resource_blocking",
     "install_sync_resource_blocking",
 ]
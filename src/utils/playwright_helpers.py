@@ -9,13 +9,26 @@ from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from src.utils.playwright_retry import NAV_TIMEOUT
+from src.utils.playwright_retry import NAV_TIMEOUT, SHORT_TIMEOUT
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from playwright.sync_api import Response
+
     from src.utils.request_policy import RequestPolicy
 
 logger = logging.getLogger(__name__)
 
+# ASP.NET UpdatePanel(PageRequestManager)이 비동기 포스트백 응답을 DOM에 반영했는지 확인한다.
+POSTBACK_IDLE_JS = """
+() => {
+    const prm = window.Sys && Sys.WebForms && Sys.WebForms.PageRequestManager;
+    return !prm || !prm.getInstance().get_isInAsyncPostBack();
+}
+"""
+SELECTED_VALUE_JS = "el => el.value"
+
 
 def goto_next_page(page: Page, policy: RequestPolicy | None = None) -> bool:
     """Handle the goto next page operation.
@@ -54,3 +67,77 @@ def goto_next_page(page: Page, policy: RequestPolicy | None = None) -> bool:
         return False
     else:
         return False
+
+
+def wait_for_postback(
+    page: Page,
+    action: Callable[[], object],
+    policy: RequestPolicy | None = None,
+    *,
+    timeout: int = SHORT_TIMEOUT,
+) -> bool:
+    """Run an ASP.NET postback action and wait until its response is applied.
+
+    첫 행 텍스트 비교와 달리, 결과 표가 그대로인 포스트백(이미 적용된 정렬 등)도
+    응답이 오는 즉시 끝난다.
+
+    Args:
+        page: Page.
+        action: 포스트백을 일으키는 동작 (select_option, click, sort() 호출 등).
+        policy: 주어지면 요청 전에 policy.delay()로 간격을 둔다.
+        timeout: 응답/반영 대기 시간(ms).
+
+    Returns:
+        True if the postback response arrived and was applied within ``timeout``.
+
+    """
+    if policy:
+        policy.delay()
+    document_url = page.url.split("?", 1)[0]
+
+    def _is_postback(response: Response) -> bool:
+        return response.request.method == "POST" and response.url.split("?", 1)[0] == document_url
+
+    acted = False
+    try:
+        with page.expect_response(_is_postback, timeout=timeout) as response_info:
+            action()
+            acted = True
+        response_info.value.finished()
+        page.wait_for_function(POSTBACK_IDLE_JS, timeout=timeout)
+    except PlaywrightError:
+        if not acted:
+            raise
+        # 응답이 없거나 전체 포스트백으로 컨텍스트가 바뀐 경우; 이후 셀렉터 대기가 표를 확인한다.
+        logger.debug("Timed out waiting for postback response; continuing")
+        return False
+    return True
+
+
+def select_option_if_changed(
+    page: Page,
+    selector: str,
+    value: str,
+    policy: RequestPolicy | None = None,
+    *,
+    timeout: int = SHORT_TIMEOUT,
+) -> bool:
+    """Select ``value`` unless it is already selected.
+
+    같은 값을 다시 select_option 하면 포스트백이 한 번 더 일어나므로 생략한다.
+
+    Args:
+        page: Page.
+        selector: Select element selector.
+        value: Option value.
+        policy: Policy.
+        timeout: 포스트백 대기 시간(ms).
+
+    Returns:
+        True if a selection (postback) was made.
+
+    """
+    if page.eval_on_selector(selector, SELECTED_VALUE_JS) == value:
+        return False
+    wait_for_postback(page, lambda: page.select_option(selector, value=value), policy, timeout=timeout)
+    return True
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Self
@@ -18,6 +19,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# When set, pools attach to an already running Chromium instead of launching their own.
+CDP_ENDPOINT_ENV = "KBO_CDP"
+
 
 @dataclass(frozen=True)
 class AsyncPlaywrightPoolOptions:
@@ -28,8 +32,10 @@ class AsyncPlaywrightPoolOptions:
     browser_type: str = "chromium"
     context_kwargs: dict[str, Any] | None = None
     block_resources: bool = True
+    blocked_resource_types: frozenset[str] | None = None
     timeout_ms: int | None = None
     requires_auth: bool = False
+    cdp_endpoint: str | None = None
 
 
 class AsyncPlaywrightPool:
@@ -56,8 +62,10 @@ class AsyncPlaywrightPool:
         self.browser_type = options.browser_type
         self.context_kwargs = options.context_kwargs or {}
         self.block_resources = options.block_resources
+        self.blocked_resource_types = options.blocked_resource_types
         self.timeout_ms = options.timeout_ms
         self.requires_auth = options.requires_auth
+        self.cdp_endpoint = options.cdp_endpoint or os.getenv(CDP_ENDPOINT_ENV) or None
 
         self._playwright = None
         self._browser: Browser | None = None
@@ -100,7 +108,7 @@ class AsyncPlaywrightPool:
         try:
             await self._start_browser_context()
             if self.block_resources and self._context:
-                await install_async_resource_blocking(self._context)
+                await install_async_resource_blocking(self._context, self.blocked_resource_types)
             await self._create_pages()
             self._started = True
         except (PlaywrightError, RuntimeError, OSError):
@@ -130,11 +138,15 @@ class AsyncPlaywrightPool:
         self._playwright = await async_playwright().start()  # type: ignore[assignment]
         browser_factory = getattr(self._playwright, self.browser_type)
 
-        # Add evasion arguments
-        launch_args = [
-            "--disable-blink-features=AutomationControlled",
-        ]
-        self._browser = await browser_factory.launch(headless=self.headless, args=launch_args)
+        if self.cdp_endpoint:
+            # Reuse a shared browser; each pool still gets its own isolated context.
+            self._browser = await browser_factory.connect_over_cdp(self.cdp_endpoint)
+        else:
+            # Add evasion arguments
+            launch_args = [
+                "--disable-blink-features=AutomationControlled",
+            ]
+            self._browser = await browser_factory.launch(headless=self.headless, args=launch_args)
 
         # Dynamic User-Agent Rotation
         if "user_agent" not in self.context_kwargs:
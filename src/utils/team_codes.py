@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from src.constants import DATE_STR_LEN, GAME_ID_FULL_LEN
 from src.utils.team_history import resolve_team_code_for_season
@@ -100,6 +101,7 @@ KBO_LEGACY_TECHNICAL_CODE = {
 LEGACY_GAME_ID_NORMALIZATION_START_YEAR = 2024
 
 
+@lru_cache(maxsize=256)
 def resolve_team_code(name: str | None, season_year: int | None = None) -> str | None:
     """Resolve team code.
 
@@ -252,6 +254,7 @@ GAME_ID_SEGMENT_TO_CODE = {
 }
 
 
+@lru_cache(maxsize=256)
 def team_code_from_game_id_segment(segment: str | None, season_year: int | None = None) -> str | None:
     """Handle the team code from game id segment operation.
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from functools import cache
+from functools import cache, lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -556,6 +556,7 @@ def get_team_mapper() -> TeamMapper:
     return mapper
 
 
+@lru_cache(maxsize=4096)
 def get_team_code(team_name: str, year: int | None = None) -> str | None:
     """간편 함수: 팀명으로 팀 코드 조회.
 
@@ -587,7 +588,9 @@ def get_team_mapping_for_year(year: int) -> dict[str, str]:
 def refresh_oci_mapping() -> bool:
     """OCI 매핑 갱신."""
     mapper = get_team_mapper()
-    return mapper.load_oci_mapping()
+    loaded = mapper.load_oci_mapping()
+    get_team_code.cache_clear()
+    return loaded
 
 
 if __name__ == "__main__":
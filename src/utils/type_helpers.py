@@ -5,6 +5,10 @@ from __future__ import annotations
 import re
 
 _EMPTY_SENTINELS = frozenset({"", "-", "\u2014", "\u2013", "null"})
+_RE_INNINGS_MIXED_FRACTION = re.compile(r"^(\d+)\s+(\d+)/(\d+)$")
+_RE_INNINGS_FRACTION = re.compile(r"^(\d+)/(\d+)$")
+# KBO 이닝 표기에서 실제로 나오는 분수 부분만 미리 계산해 둔다.
+_INNINGS_FRACTIONS = {"": 0.0, "1/3": 1 / 3, "2/3": 2 / 3}
 
 
 def to_int(val: object, default: int = 0) -> int:
@@ -47,9 +51,13 @@ def safe_int_or_none(value: object) -> int | None:
     """
     if value is None:
         return None
-    cleaned = str(value).replace(",", "").strip()
+    if type(value) is int:
+        return value
+    cleaned = (value if type(value) is str else str(value)).strip()
     if cleaned in _EMPTY_SENTINELS:
         return None
+    if "," in cleaned:
+        cleaned = cleaned.replace(",", "")
     try:
         return int(cleaned)
     except (ValueError, TypeError):
@@ -102,17 +110,22 @@ def parse_innings(value: str | None) -> float:
     txt = value.strip().replace(",", "")
     if not txt or txt == "-":
         return 0.0
-    if " " in txt:
-        parts = txt.split(" ")
-        val = float(parts[0])
-        if len(parts) > 1 and "/" in parts[1]:
-            frac = parts[1].split("/")
-            val += float(frac[0]) / float(frac[1])
-        return val
-    if "/" in txt:
-        frac = txt.split("/")
-        return float(frac[0]) / float(frac[1])
-    return float(txt)
+    parts = txt.split(" ", 2)
+    if len(parts) > 1:
+        # 'X Y/Z' 형태만 분수로 본다; 두 번째 토큰이 분수가 아니면 정수부만 쓴다.
+        whole, frac = parts[0], parts[1]
+        if "/" not in frac:
+            return float(whole)
+    elif "/" in txt:
+        whole, frac = "", txt
+    else:
+        return float(txt)
+    fraction = _INNINGS_FRACTIONS.get(frac)
+    if fraction is None:
+        # 분자나 분모가 비어 있으면 float('')가 ValueError를 그대로 올린다.
+        num, den = frac.split("/")[:2]
+        fraction = float(num) / float(den)
+    return float(whole) + fraction if whole else fraction
 
 
 def _parse_fraction_innings(cleaned: str) -> int | None:
@@ -127,7 +140,7 @@ def _parse_fraction_innings(cleaned: str) -> int | None:
         The result of the operation.
 
     """
-    frac_match = re.match(r"^(\d+)\s+(\d+)/(\d+)$", cleaned)
+    frac_match = _RE_INNINGS_MIXED_FRACTION.match(cleaned)
 
     if frac_match:
         whole = int(frac_match.group(1))
@@ -135,7 +148,7 @@ def _parse_fraction_innings(cleaned: str) -> int | None:
         den = int(frac_match.group(3))
         return whole * 3 + round(num * 3 / den)
 
-    frac_only = re.match(r"^(\d+)/(\d+)$", cleaned)
+    frac_only = _RE_INNINGS_FRACTION.match(cleaned)
     if frac_only:
         return round(int(frac_only.group(1)) * 3 / int(frac_only.group(2)))
 
@@ -181,6 +194,10 @@ def parse_innings_to_outs(text: str | None) -> int | None:
         text: Text.
 
     """
+    fast = _parse_simple_innings(text)
+    if fast is not None:
+        return fast
+
     cleaned = _clean_innings_text(text)
 
     if cleaned is None:
@@ -189,9 +206,8 @@ def parse_innings_to_outs(text: str | None) -> int | None:
     if ":" in cleaned:
         return _parse_colon_innings(cleaned)
     result = _parse_fraction_innings(cleaned)
-    if result is not None:
-        return result
-    result = _parse_decimal_innings(cleaned)
+    if result is None:
+        result = _parse_decimal_innings(cleaned)
     if result is not None:
         return result
     try:
@@ -200,6 +216,29 @@ def parse_innings_to_outs(text: str | None) -> int | None:
         return None
 
 
+def _parse_simple_innings(text: str | None) -> int | None:
+    """Parse the common box score shapes ('6', '5.1') without regex.
+
+    Args:
+        text: Text.
+
+    Returns:
+        Total outs, or None when the value needs the full parser.
+
+    """
+    if not text:
+        return None
+    stripped = str(text).strip()
+    if not stripped.isascii():
+        return None
+    if stripped.isdigit():
+        return int(stripped) * 3
+    whole, sep, outs = stripped.partition(".")
+    if sep and outs in ("0", "1", "2") and whole.isdigit():
+        return int(whole) * 3 + int(outs)
+    return None
+
+
 def _clean_innings_text(text: str | None) -> str | None:
     """Handle the clean innings text operation.
 
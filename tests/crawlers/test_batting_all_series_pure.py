@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import argparse
 from unittest.mock import MagicMock, patch
 
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from src.crawlers.player_batting_all_series_crawler import (
     BattingRowData,
     BattingSeriesCrawlRequest,
     _build_batting_data,
-    _extract_basic2_stat_by_header,
     _extract_player_id_from_href,
     _finalize_batting_summary,
     _collect_basic2_pages,
@@ -17,24 +18,27 @@ from src.crawlers.player_batting_all_series_crawler import (
     _handle_batting_fallback,
     _navigate_to_basic2,
     _apply_pa_sorting,
-    _parse_basic2_header_data_legacy,
     _select_team_if_needed,
     _select_year_option,
     _select_series_option,
     _save_batting_if_needed,
     _is_basic2_headers,
     _merge_basic2_data,
-    _parse_basic2_header_data_fast,
+    _parse_years,
+    parse_basic2_header_data,
     parse_batting_stats_table,
     crawl_series_batting_stats,
+    crawl_basic2_with_headers,
     crawl_all_series,
     BattingCrawlContext,
     go_to_next_page,
-    _parse_fast_row,
+    NEXT_PAGE_AVAILABLE_JS,
     build_batting_crawl_summary,
     get_series_mapping,
+    main,
     safe_parse_number,
 )
+from src.utils.playwright_retry import SEL_TIMEOUT
 
 
 class TestGetSeriesMapping:
@@ -273,89 +277,6 @@ class TestBuildBattingData:
         assert result["gdp"] == 1
 
 
-class TestExtractBasic2StatByHeader:
-    def test_walks(self):
-        batting_data = {}
-        _extract_basic2_stat_by_header("BB", ["", "", "", "", "30"], batting_data)
-        assert batting_data["walks"] == 30
-
-    def test_strikeouts(self):
-        batting_data = {}
-        _extract_basic2_stat_by_header("SO", ["", "", "", "", "", "", "", "15"], batting_data)
-        assert batting_data["strikeouts"] == 15
-
-    def test_slg(self):
-        batting_data = {}
-        _extract_basic2_stat_by_header("SLG", ["", "", "", "", "", "", "", "", "", "0.500"], batting_data)
-        assert batting_data["slg"] == 0.5
-
-    def test_extra_stat(self):
-        batting_data = {}
-        _extract_basic2_stat_by_header("MH", ["", "", "", "", "", "", "", "", "", "", "", "", "5"], batting_data)
-        assert batting_data["extra_stats"]["multi_hits"] == 5
-
-    def test_unknown_header(self):
-        batting_data = {}
-        _extract_basic2_stat_by_header("UNKNOWN", ["", "", "", "10"], batting_data)
-        assert "UNKNOWN" not in batting_data
-
-    def test_cells_too_short(self):
-        batting_data = {}
-        _extract_basic2_stat_by_header("BB", ["", "", ""], batting_data)
-        assert "walks" not in batting_data
-
-
-class TestParseFastRow:
-    def test_basic_row(self):
-        row = {
-            "cells": ["", "홍길동", "LG", "0.300", "120"],
-            "linkHref": "/Player.aspx?playerId=12345",
-            "linkText": "홍길동",
-        }
-        result = _parse_fast_row(row, "BB", 2023, {})
-        assert result is not None
-        player_id, data = result
-        assert player_id == 12345
-        assert data["player_name"] == "홍길동"
-
-    def test_short_cells(self):
-        row = {"cells": ["", "홍길동"], "linkHref": "/Player.aspx?playerId=12345"}
-        result = _parse_fast_row(row, "BB", 2023, {})
-        assert result is None
-
-    def test_no_player_id(self):
-        row = {"cells": ["", "홍길동", "LG"], "linkHref": "/Player.aspx?other=value"}
-        result = _parse_fast_row(row, "BB", 2023, {})
-        assert result is None
-
-    @patch("src.crawlers.player_batting_all_series_crawler.get_team_code")
-    def test_team_code_lookup(self, mock_get_team_code):
-        mock_get_team_code.return_value = "LG"
-        row = {
-            "cells": ["", "홍길동", "LG", "0.300", "120"],
-            "linkHref": "/Player.aspx?playerId=12345",
-            "linkText": "홍길동",
-        }
-        result = _parse_fast_row(row, "BB", 2023, {})
-        assert result is not None
-        _, data = result
-        assert data["team_code"] == "LG"
-
-    @patch("src.crawlers.player_batting_all_series_crawler.get_team_code")
-    def test_team_mapping_fallback(self, mock_get_team_code):
-        mock_get_team_code.return_value = None
-        row = {
-            "cells": ["", "홍길동", "LG", "0.300", "120"],
-            "linkHref": "/Player.aspx?playerId=12345",
-            "linkText": "홍길동",
-        }
-        team_mapping = {"LG": "LG"}
-        result = _parse_fast_row(row, "BB", 2023, team_mapping)
-        assert result is not None
-        _, data = result
-        assert data["team_code"] == "LG"
-
-
 class TestBuildBattingCrawlSummary:
     def test_all_valid(self):
         rows = [
@@ -457,10 +378,7 @@ class TestBattingPageParsers:
             ],
         }
 
-        with (
-            patch("src.crawlers.player_batting_all_series_crawler.get_team_mapping_for_year"),
-            patch("src.crawlers.player_batting_all_series_crawler.resolve_team_code", return_value="LG"),
-        ):
+        with patch("src.crawlers.player_batting_all_series_crawler.resolve_team_code", return_value="LG"):
             records = parse_batting_stats_table(page, "regular", 2025, use_fast=True)
 
         assert records[0]["player_id"] == 123
@@ -477,34 +395,20 @@ class TestBattingPageParsers:
 
         assert records == []
 
-    def test_fast_basic2_header_parser_extracts_requested_stat(self):
+    def test_parse_basic2_header_data_is_deprecated_full_table_parse(self):
         page = MagicMock()
-        page.query_selector.return_value = None
-        rows = [
-            {
-                "cells": ["1", "홍길동", "LG", "0.333", "12"],
-                "linkHref": "/Player/Detail.aspx?playerId=123",
-                "linkText": "홍길동",
-            },
-        ]
+        rows = [{"player_id": 123, "player_name": "홍길동", "walks": 12}]
 
         with (
-            patch("src.crawlers.player_batting_all_series_crawler.extract_rows_fast", return_value=rows),
             patch(
-                "src.crawlers.player_batting_all_series_crawler.get_team_mapping_for_year", return_value={"LG": "LG"}
-            ),
-            patch("src.crawlers.player_batting_all_series_crawler.get_team_code", return_value="LG"),
+                "src.crawlers.player_batting_all_series_crawler.parse_batting_stats_table", return_value=rows
+            ) as parse_table,
+            pytest.warns(DeprecationWarning),
         ):
-            records = _parse_basic2_header_data_fast(page, "BB", "볼넷", 2025)
+            records = parse_basic2_header_data(page, "BB", "볼넷", 2025)
 
-        assert records == {
-            123: {
-                "player_id": 123,
-                "player_name": "홍길동",
-                "team_code": "LG",
-                "walks": 12,
-            },
-        }
+        assert records == {123: rows[0]}
+        parse_table.assert_called_once_with(page, "regular", 2025, use_fast=None)
 
     def test_merge_basic2_data_updates_only_non_identity_values(self):
         basic1 = [
@@ -518,9 +422,9 @@ class TestBattingPageParsers:
             },
         ]
 
-        with patch(
-            "src.crawlers.player_batting_all_series_crawler.crawl_basic2_with_headers",
-            return_value={
+        merged = _merge_basic2_data(
+            basic1,
+            {
                 123: {
                     "player_id": 123,
                     "player_name": "다른 이름",
@@ -529,9 +433,9 @@ class TestBattingPageParsers:
                     "ops": None,
                 },
             },
-        ):
-            merged = _merge_basic2_data(basic1, MagicMock(), 2025, {}, MagicMock())
+        )
 
+        assert merged is basic1
         assert merged == [
             {
                 "player_id": 123,
@@ -545,79 +449,29 @@ class TestBattingPageParsers:
         ]
 
     def test_legacy_table_parser_reads_dom_rows(self):
-        class Node:
-            def __init__(self, text="", *, href=None, children=None):
-                self.text = text
-                self.href = href
-                self.children = children or {}
-
-            def get_attribute(self, name):
-                return self.href if name == "href" else None
-
-            def query_selector(self, selector):
-                return self.children.get(selector)
-
-            def query_selector_all(self, selector):
-                return self.children.get(selector, [])
-
-            def text_content(self):
-                return self.text
-
-        headers = [
-            Node(value) for value in ["순위", "선수명", "팀명", "AVG", "G", "PA", "AB", "R", "H", "2B", "3B", "HR"]
-        ]
-        cells = [Node(value) for value in ["1", "홍길동", "LG", "0.333", "10", "40", "30", "8", "12", "3", "1", "2"]]
-        cells[1].children["a"] = Node("홍길동", href="/Player/Detail.aspx?playerId=123")
-        row = Node(children={"td": cells})
-        table = Node(children={"thead": Node(children={"th": headers}), "tbody": Node(children={"tr": [row]})})
+        header_row = MagicMock()
+        header_row.evaluate.return_value = {"cells": [], "linkHref": None, "linkText": None}
+        row = MagicMock()
+        row.evaluate.return_value = {
+            "cells": ["1", "홍길동", "LG", "0.333", "10", "40", "30", "8", "12", "3", "1", "2"],
+            "linkHref": "/Player/Detail.aspx?playerId=123",
+            "linkText": "홍길동",
+        }
+        table = MagicMock()
+        table.eval_on_selector_all.return_value = ["순위", "선수명", "팀명", "AVG", "G", "PA", "AB", "R", "H"]
+        table.query_selector_all.return_value = [header_row, row]
         page = MagicMock()
-        page.query_selector.side_effect = lambda selector: table if selector == "table" else None
+        page.query_selector.return_value = table
 
-        with (
-            patch("src.crawlers.player_batting_all_series_crawler.get_team_mapping_for_year"),
-            patch("src.crawlers.player_batting_all_series_crawler.resolve_team_code", return_value="LG"),
-        ):
+        with patch("src.crawlers.player_batting_all_series_crawler.resolve_team_code", return_value="LG"):
             records = parse_batting_stats_table(page, "regular", 2025, use_fast=False)
 
+        assert len(records) == 1
         assert records[0]["player_id"] == 123
+        assert records[0]["player_name"] == "홍길동"
         assert records[0]["hits"] == 12
         assert records[0]["home_runs"] == 2
-
-    def test_legacy_basic2_parser_reads_header_specific_stat(self):
-        class Node:
-            def __init__(self, text="", *, href=None, children=None):
-                self.text = text
-                self.href = href
-                self.children = children or {}
-
-            def get_attribute(self, name):
-                return self.href if name == "href" else None
-
-            def query_selector(self, selector):
-                return self.children.get(selector)
-
-            def query_selector_all(self, selector):
-                return self.children.get(selector, [])
-
-            def text_content(self):
-                return self.text
-
-        cells = [Node(value) for value in ["1", "홍길동", "LG", "0.333", "12"]]
-        cells[1].children["a"] = Node("홍길동", href="/Player/Detail.aspx?playerId=123")
-        row = Node(children={"td": cells})
-        table = Node(children={"tbody": Node(children={"tr": [row]})})
-        page = MagicMock()
-        page.query_selector.side_effect = lambda selector: table if selector == "table" else None
-
-        with (
-            patch(
-                "src.crawlers.player_batting_all_series_crawler.get_team_mapping_for_year", return_value={"LG": "LG"}
-            ),
-            patch("src.crawlers.player_batting_all_series_crawler.get_team_code", return_value="LG"),
-        ):
-            records = _parse_basic2_header_data_legacy(page, "BB", "볼넷", 2025)
-
-        assert records[123]["walks"] == 12
+        row.evaluate.assert_called_once()
 
     def test_collect_basic2_pages_merges_duplicate_player_rows(self):
         page = MagicMock()
@@ -634,25 +488,59 @@ class TestBattingPageParsers:
             ),
             patch("src.crawlers.player_batting_all_series_crawler.go_to_next_page", side_effect=[True, False]),
         ):
-            _collect_basic2_pages(page, 2025, players)
+            complete = _collect_basic2_pages(page, 2025, players)
 
+        assert complete is True
         assert players == {
             1: {"player_id": 1, "avg": 0.3, "walks": 10},
             2: {"player_id": 2, "avg": 0.2},
         }
 
+    def test_collect_basic2_pages_reports_incomplete_on_later_page_errors(self):
+        players = {}
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.retry_wait_for_selector", return_value=True),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.parse_batting_stats_table",
+                side_effect=[[{"player_id": 1, "walks": 10}], ValueError("bad row")],
+            ) as parse,
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.go_to_next_page",
+                side_effect=[True, PlaywrightTimeoutError("pager")],
+            ) as next_page,
+        ):
+            complete = _collect_basic2_pages(MagicMock(), 2025, players)
+
+        assert complete is False
+        assert players == {1: {"player_id": 1, "walks": 10}}
+        assert parse.call_args.kwargs == {"strict": True}
+        assert next_page.call_args.kwargs == {"strict": True}
+
     def test_go_to_next_page_clicks_enabled_number_button(self):
         page = MagicMock()
-        button = MagicMock()
-        button.get_attribute.return_value = None
-        page.query_selector.side_effect = [MagicMock(), button]
+        page.evaluate.return_value = True
         policy = MagicMock()
 
         moved = go_to_next_page(page, 1, policy)
 
         assert moved is True
+        assert page.evaluate.call_args_list[0].args == (NEXT_PAGE_AVAILABLE_JS, 'a[href*="btnNo2"]')
+        page.query_selector.assert_not_called()
         policy.delay.assert_called_once()
         page.click.assert_called_once_with('a[href*="btnNo2"]', timeout=15000)
+        page.expect_response.assert_called_once()
+        page.wait_for_load_state.assert_not_called()
+
+    def test_go_to_next_page_stops_when_button_unavailable(self):
+        page = MagicMock()
+        page.evaluate.return_value = False
+        policy = MagicMock()
+
+        assert go_to_next_page(page, 5, policy) is False
+        assert page.evaluate.call_args.args[1] == 'a[href*="btnNext"]'
+        policy.delay.assert_not_called()
+        page.click.assert_not_called()
 
     def test_navigate_to_basic2_returns_false_when_link_is_unavailable(self):
         with patch("src.crawlers.player_batting_all_series_crawler.retry_wait_for_selector", return_value=False):
@@ -662,6 +550,8 @@ class TestBattingPageParsers:
 
     def test_crawl_series_orchestrates_basic1_basic2_and_finalization(self):
         page = MagicMock()
+        # networkidle이 끝나지 않아도 load 시점의 표로 계속 진행해야 한다.
+        page.wait_for_load_state.side_effect = PlaywrightTimeoutError("networkidle")
         browser = MagicMock()
         context = MagicMock()
         context.new_page.return_value = page
@@ -687,6 +577,7 @@ class TestBattingPageParsers:
                 return_value=[{"value": "", "text": "전체"}],
             ),
             patch("src.crawlers.player_batting_all_series_crawler._collect_batting_stats_loop", side_effect=_collect),
+            patch("src.crawlers.player_batting_all_series_crawler._crawl_basic2", return_value=({}, False)) as basic2,
             patch("src.crawlers.player_batting_all_series_crawler._merge_basic2_data", return_value=crawled),
             patch("src.crawlers.player_batting_all_series_crawler._finalize_batting_summary", return_value=crawled),
             patch("src.crawlers.player_batting_all_series_crawler._save_batting_if_needed") as save,
@@ -696,10 +587,71 @@ class TestBattingPageParsers:
             )
 
         assert result == crawled
+        page.set_default_timeout.assert_called_once_with(SEL_TIMEOUT)
+        assert basic2.call_args.kwargs == {"basic1_selected": True}
         playwright.chromium.launch.assert_called_once_with(headless=True)
         browser.close.assert_called_once()
         save.assert_called_once_with(crawled, save_to_db=True)
 
+    def test_crawl_basic2_skips_basic1_setup_when_selection_is_reused(self):
+        page = MagicMock()
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.retry_navigation") as navigate,
+            patch("src.crawlers.player_batting_all_series_crawler._select_year_option") as select_year,
+            patch("src.crawlers.player_batting_all_series_crawler._navigate_to_basic2", return_value=True),
+            patch("src.crawlers.player_batting_all_series_crawler._collect_basic2_pages"),
+        ):
+            crawl_basic2_with_headers(page, 2025, {"value": "0"}, MagicMock(), basic1_selected=True)
+
+        navigate.assert_not_called()
+        select_year.assert_not_called()
+
+    def test_crawl_series_reuses_given_browser_and_closes_only_context(self):
+        browser = MagicMock()
+        context = browser.new_context.return_value
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.sync_playwright") as sync_pw,
+            patch("src.crawlers.player_batting_all_series_crawler.install_sync_resource_blocking"),
+            patch("src.crawlers.player_batting_all_series_crawler.compliance.is_allowed_sync", return_value=True),
+            patch("src.crawlers.player_batting_all_series_crawler._select_season_and_series"),
+            patch("src.crawlers.player_batting_all_series_crawler._get_team_options", return_value=[]),
+            patch("src.crawlers.player_batting_all_series_crawler._collect_batting_stats_loop"),
+            patch("src.crawlers.player_batting_all_series_crawler._save_batting_if_needed"),
+        ):
+            result = crawl_series_batting_stats(
+                BattingSeriesCrawlRequest(year=2025, series_key="exhibition"),
+                browser=browser,
+            )
+
+        assert result == []
+        sync_pw.assert_not_called()
+        context.close.assert_called_once()
+        browser.close.assert_not_called()
+
+    def test_crawl_series_uses_cached_rows_without_starting_browser(self):
+        cached = [{"player_id": 123, "player_name": "홍길동"}]
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.PAGE_CACHE_ENABLED", new=True),
+            patch("src.crawlers.player_batting_all_series_crawler.get_cached_rows", return_value=cached) as get_cached,
+            patch("src.crawlers.player_batting_all_series_crawler.sync_playwright") as sync_pw,
+            patch(
+                "src.crawlers.player_batting_all_series_crawler._finalize_batting_summary",
+                side_effect=lambda rows, _info: rows,
+            ),
+            patch("src.crawlers.player_batting_all_series_crawler._save_batting_if_needed") as save,
+        ):
+            result = crawl_series_batting_stats(
+                BattingSeriesCrawlRequest(year=2015, series_key="regular", save_to_db=True),
+            )
+
+        assert result == cached
+        assert get_cached.call_args.args[0].view == "basic"
+        sync_pw.assert_not_called()
+        save.assert_called_once_with(cached, save_to_db=True)
+
     def test_crawl_series_rejects_unknown_series_before_browser_start(self):
         with patch("src.crawlers.player_batting_all_series_crawler.sync_playwright") as browser:
             result = crawl_series_batting_stats(BattingSeriesCrawlRequest(year=2025, series_key="unknown"))
@@ -717,7 +669,7 @@ class TestBattingPageParsers:
 
         page.select_option.assert_any_call(
             'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeason$ddlSeason"]',
-            "2025",
+            value="2025",
         )
         page.select_option.assert_any_call(
             'select[name="ctl00$ctl00$ctl00$cphContents$cphContents$cphContents$ddlSeries$ddlSeries"]',
@@ -725,10 +677,22 @@ class TestBattingPageParsers:
         )
         assert policy.delay.call_count == 2
 
+    def test_season_and_series_selectors_skip_values_already_selected(self):
+        page = MagicMock()
+        page.eval_on_selector.side_effect = ["2025", "0"]
+        policy = MagicMock()
+
+        with patch("src.crawlers.player_batting_all_series_crawler.retry_wait_for_selector", return_value=True):
+            _select_year_option(page, 2025, policy)
+            _select_series_option(page, "0", policy)
+
+        page.select_option.assert_not_called()
+        policy.delay.assert_not_called()
+
     def test_team_helpers_extract_select_and_sort(self):
         page = MagicMock()
         page.eval_on_selector_all.return_value = [{"value": "LG", "text": "LG"}, {"value": "", "text": "전체"}]
-        page.query_selector.return_value = MagicMock()
+        page.locator.return_value.count.return_value = 1
         policy = MagicMock()
 
         options = _get_team_options(page, by_team=True)
@@ -738,7 +702,8 @@ class TestBattingPageParsers:
         assert options == [{"value": "LG", "text": "LG"}]
         assert selected is True
         assert page.select_option.called
-        assert page.click.called
+        page.locator.return_value.first.click.assert_called_once()
+        page.query_selector.assert_not_called()
 
     def test_collect_batting_loop_updates_duplicate_player_until_last_page(self):
         page = MagicMock()
@@ -771,6 +736,155 @@ class TestBattingPageParsers:
 
         assert data == [{"player_id": 1, "avg": 0.3, "walks": 12}, {"player_id": 2, "avg": 0.2}]
 
+    def test_collect_batting_loop_stops_at_limit_without_overshooting(self):
+        data = []
+        ctx = BattingCrawlContext(
+            page=MagicMock(),
+            year=2025,
+            series_key="regular",
+            iteration_targets=[{"value": "", "text": "전체"}],
+            by_team=False,
+            limit=3,
+            policy=MagicMock(),
+            unique_players=set(),
+            all_players_data=data,
+        )
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler._apply_pa_sorting"),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.parse_batting_stats_table",
+                side_effect=[
+                    [{"player_id": 1}, {"player_id": 2}],
+                    [{"player_id": 3}, {"player_id": 4}],
+                ],
+            ),
+            patch("src.crawlers.player_batting_all_series_crawler.go_to_next_page", return_value=True) as next_page,
+        ):
+            _collect_batting_stats_loop(ctx)
+
+        assert data == [{"player_id": 1}, {"player_id": 2}, {"player_id": 3}]
+        next_page.assert_called_once()
+
+    def test_collect_batting_loop_marks_incomplete_on_parse_or_pager_error(self):
+        data = []
+        ctx = BattingCrawlContext(
+            page=MagicMock(),
+            year=2025,
+            series_key="regular",
+            iteration_targets=[{"value": "", "text": "전체"}],
+            by_team=False,
+            limit=None,
+            policy=MagicMock(),
+            unique_players=set(),
+            all_players_data=data,
+        )
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler._apply_pa_sorting"),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.parse_batting_stats_table",
+                side_effect=[ValueError("bad row"), [{"player_id": 2}]],
+            ) as parse,
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.go_to_next_page",
+                side_effect=[True, PlaywrightTimeoutError("pager")],
+            ),
+        ):
+            _collect_batting_stats_loop(ctx)
+
+        assert data == [{"player_id": 2}]
+        assert ctx.complete is False
+        assert parse.call_args.kwargs == {"strict": True}
+
+    def test_collect_batting_loop_stays_complete_when_pager_is_exhausted(self):
+        ctx = BattingCrawlContext(
+            page=MagicMock(),
+            year=2025,
+            series_key="regular",
+            iteration_targets=[{"value": "", "text": "전체"}],
+            by_team=False,
+            limit=None,
+            policy=MagicMock(),
+            unique_players=set(),
+            all_players_data=[],
+        )
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler._apply_pa_sorting"),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.parse_batting_stats_table",
+                return_value=[{"player_id": 1}],
+            ),
+            patch("src.crawlers.player_batting_all_series_crawler.go_to_next_page", return_value=False),
+        ):
+            _collect_batting_stats_loop(ctx)
+
+        assert ctx.complete is True
+
+    @pytest.mark.parametrize(
+        ("complete", "cached"),
+        [(True, True), (False, False)],
+    )
+    def test_crawl_series_caches_only_complete_collections(self, complete, cached):
+        rows = [{"player_id": 123, "player_name": "홍길동"}]
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.PAGE_CACHE_ENABLED", new=True),
+            patch("src.crawlers.player_batting_all_series_crawler.get_cached_rows", return_value=None),
+            patch("src.crawlers.player_batting_all_series_crawler.put_cached_rows") as put_cached,
+            patch("src.crawlers.player_batting_all_series_crawler.compliance.is_allowed_sync", return_value=True),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler._collect_batting_series",
+                return_value=(rows, None, complete),
+            ),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler._finalize_batting_summary",
+                side_effect=lambda data, _info: data,
+            ),
+            patch("src.crawlers.player_batting_all_series_crawler._save_batting_if_needed"),
+        ):
+            result = crawl_series_batting_stats(
+                BattingSeriesCrawlRequest(year=2015, series_key="regular"),
+                browser=MagicMock(),
+            )
+
+        assert result == rows
+        assert put_cached.called is cached
+
+    @pytest.mark.parametrize(
+        "basic2_result",
+        [({}, True), ({123: {"player_id": 123, "walks": 3}}, False)],
+        ids=["basic2-empty", "basic2-partial"],
+    )
+    def test_collect_series_is_incomplete_when_basic2_is_missing_or_partial(self, basic2_result):
+        from src.crawlers.player_batting_all_series_crawler import _collect_batting_series
+
+        def _collect(ctx):
+            ctx.all_players_data.append({"player_id": 123})
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.install_sync_resource_blocking"),
+            patch("src.crawlers.player_batting_all_series_crawler._select_season_and_series"),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler._get_team_options",
+                return_value=[{"value": "", "text": "전체"}],
+            ),
+            patch("src.crawlers.player_batting_all_series_crawler._collect_batting_stats_loop", side_effect=_collect),
+            patch("src.crawlers.player_batting_all_series_crawler._crawl_basic2", return_value=basic2_result),
+        ):
+            rows, fallback_reason, complete = _collect_batting_series(
+                MagicMock(),
+                BattingSeriesCrawlRequest(year=2025, series_key="regular"),
+                2025,
+                get_series_mapping()["regular"],
+                MagicMock(),
+            )
+
+        assert [row["player_id"] for row in rows] == [123]
+        assert fallback_reason is None
+        assert complete is False
+
     def test_batting_fallback_marks_source_and_saves_payloads(self):
         rows = [{"player_id": 123, "source": "FALLBACK"}]
 
@@ -799,16 +913,121 @@ class TestBattingPageParsers:
             "exhibition": {"name": "시범경기"},
         }
 
+        playwright = MagicMock()
+        manager = MagicMock()
+        manager.__enter__.return_value = playwright
+        manager.__exit__.return_value = False
+        browser = playwright.chromium.launch.return_value
+
         with (
             patch("src.crawlers.player_batting_all_series_crawler.RequestPolicy", return_value=policy),
             patch("src.crawlers.player_batting_all_series_crawler.get_series_mapping", return_value=mapping),
+            patch("src.crawlers.player_batting_all_series_crawler.sync_playwright", return_value=manager),
             patch(
                 "src.crawlers.player_batting_all_series_crawler.crawl_series_batting_stats",
                 side_effect=[[{"player_id": 1}], [{"player_id": 2}]],
             ) as crawl_series,
         ):
-            result = crawl_all_series(2025, limit=10, save_to_db=True, headless=True, by_team=True)
+            result = crawl_all_series(
+                BattingSeriesCrawlRequest(year=2025, limit=10, save_to_db=True, headless=True, by_team=True),
+            )
 
         assert result == {"regular": [{"player_id": 1}], "exhibition": [{"player_id": 2}]}
         assert crawl_series.call_count == 2
+        playwright.chromium.launch.assert_called_once_with(headless=True)
+        assert all(call.kwargs["browser"] is browser for call in crawl_series.call_args_list)
+        browser.close.assert_called_once()
+        assert [call.args[0] for call in crawl_series.call_args_list] == [
+            BattingSeriesCrawlRequest(2025, "regular", 10, save_to_db=True, headless=True, by_team=True),
+            BattingSeriesCrawlRequest(2025, "exhibition", 10, save_to_db=True, headless=True, by_team=True),
+        ]
         policy.delay.assert_called()
+
+    def test_crawl_all_series_runs_series_in_parallel_when_workers_given(self):
+        policy = MagicMock()
+        mapping = {
+            "regular": {"name": "정규시즌"},
+            "exhibition": {"name": "시범경기"},
+        }
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.RequestPolicy", return_value=policy),
+            patch("src.crawlers.player_batting_all_series_crawler.get_series_mapping", return_value=mapping),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.crawl_series_batting_stats",
+                side_effect=lambda request, **_kwargs: [{"series": request.series_key}],
+            ) as crawl_series,
+        ):
+            result = crawl_all_series(BattingSeriesCrawlRequest(year=2025), workers=4)
+
+        assert result == {"regular": [{"series": "regular"}], "exhibition": [{"series": "exhibition"}]}
+        assert crawl_series.call_count == 2
+        assert all(call.kwargs["browser"] is None for call in crawl_series.call_args_list)
+        # 병렬 모드에서도 워커마다 시리즈 사이에 지연한다.
+        assert policy.delay.call_count == 2
+
+    def test_crawl_all_series_rejects_shared_browser_with_parallel_workers(self):
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.crawl_series_batting_stats") as crawl_series,
+            pytest.raises(ValueError, match="workers > 1"),
+        ):
+            crawl_all_series(BattingSeriesCrawlRequest(year=2025), workers=2, browser=MagicMock())
+
+        crawl_series.assert_not_called()
+
+    def test_crawl_all_series_reuses_given_browser_without_launching(self):
+        browser = MagicMock()
+
+        with (
+            patch("src.crawlers.player_batting_all_series_crawler.RequestPolicy"),
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.get_series_mapping",
+                return_value={"regular": {"name": "정규시즌"}},
+            ),
+            patch("src.crawlers.player_batting_all_series_crawler.sync_playwright") as sync_pw,
+            patch(
+                "src.crawlers.player_batting_all_series_crawler.crawl_series_batting_stats",
+                return_value=[{"player_id": 1}],
+            ) as crawl_series,
+        ):
+            result = crawl_all_series(BattingSeriesCrawlRequest(year=2025), browser=browser)
+
+        assert result == {"regular": [{"player_id": 1}]}
+        sync_pw.assert_not_called()
+        assert crawl_series.call_args.kwargs["browser"] is browser
+        browser.close.assert_not_called()
+
+    def test_main_does_not_share_browser_when_series_run_in_parallel(self):
+        argv = ["prog", "--years", "2024-2025", "--workers", "2"]
+
+        with (
+            patch("sys.argv", argv),
+            patch("src.crawlers.player_batting_all_series_crawler.sync_playwright") as sync_pw,
+            patch("src.crawlers.player_batting_all_series_crawler._crawl_year") as crawl_year,
+        ):
+            main()
+
+        sync_pw.assert_not_called()
+        assert [call.args[1] for call in crawl_year.call_args_list] == [2024, 2025]
+        assert all(call.kwargs["browser"] is None for call in crawl_year.call_args_list)
+
+    def test_parse_years_accepts_range_or_single_year(self):
+        assert _parse_years("2015-2017") == [2015, 2016, 2017]
+        assert _parse_years("2024") == [2024]
+
+    @pytest.mark.parametrize("value", ["2025-2015", "2015-", "abcd", "2015-2017-2019", ""])
+    def test_parse_years_rejects_reversed_or_malformed_ranges(self, value):
+        with pytest.raises(argparse.ArgumentTypeError):
+            _parse_years(value)
+
+    def test_main_exits_with_usage_error_for_reversed_years(self, capsys):
+        with (
+            patch("sys.argv", ["prog", "--years", "2025-2015"]),
+            patch("src.crawlers.player_batting_all_series_crawler.sync_playwright") as sync_pw,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 2
+        assert "Start year must not be after end year" in capsys.readouterr().err
+        sync_pw.assert_not_called()
@@ -6,11 +6,9 @@ import pytest
 
 from src.crawlers.player_batting_all_series_crawler import (
     BattingRowData,
-    LegacyRowContext,
     _build_batting_data,
     _extract_player_id_from_href,
     _is_basic2_headers,
-    _parse_legacy_row,
     build_batting_crawl_summary,
     get_series_mapping,
     safe_parse_number,
@@ -178,97 +176,3 @@ class TestBuildBattingCrawlSummary:
         ]
         summary, valid = build_batting_crawl_summary(rows)
         assert summary["processed_rows"] == 2
-
-
-class TestParseLegacyRow:
-    class _MockCell:
-        def __init__(self, text: str, has_link: bool = False, href: str | None = None) -> None:
-            self._text = text
-            self._has_link = has_link
-            self._href = href
-
-        def text_content(self) -> str:
-            return self._text.strip()
-
-        def query_selector(self, _: str) -> object | None:
-            if self._has_link:
-                return TestParseLegacyRow._MockLink(self._text, self._href)
-            return None
-
-    class _MockLink:
-        def __init__(self, text: str, href: str | None) -> None:
-            self._text = text
-            self._href = href
-
-        def text_content(self) -> str:
-            return self._text.strip()
-
-        def get_attribute(self, name: str) -> str | None:
-            if name == "href":
-                return self._href
-            return None
-
-    class _MockRow:
-        def __init__(self, cells: list[object]) -> None:
-            self._cells = cells
-
-        def query_selector_all(self, _: str) -> list[object]:
-            return self._cells
-
-    def _make_row(self, cells: list[object]) -> object:
-        return self._MockRow(cells)
-
-    def test_valid_row(self) -> None:
-        cells = [
-            self._MockCell("1"),
-            self._MockCell("홍길동", has_link=True, href="/player.do?playerId=12345"),
-            self._MockCell("LG"),
-            self._MockCell(".300"),
-            self._MockCell("100"),
-            self._MockCell("400"),
-        ]
-        row = self._make_row(cells)
-        ctx = LegacyRowContext(
-            row=row,
-            row_idx=0,
-            current_header="",
-            description="",
-            year=2025,
-            team_mapping={},
-        )
-        result = _parse_legacy_row(ctx)
-        assert result is not None
-        pid, data = result
-        assert pid == 12345
-        assert data["player_name"] == "홍길동"
-
-    def test_insufficient_cells(self) -> None:
-        row = self._make_row([self._MockCell("1"), self._MockCell("홍길동")])
-        ctx = LegacyRowContext(
-            row=row,
-            row_idx=0,
-            current_header="",
-            description="",
-            year=2025,
-            team_mapping={},
-        )
-        result = _parse_legacy_row(ctx)
-        assert result is None
-
-    def test_no_link_returns_none(self) -> None:
-        cells = [
-            self._MockCell("1"),
-            self._MockCell("홍길동"),
-            self._MockCell("LG"),
-        ]
-        row = self._make_row(cells)
-        ctx = LegacyRowContext(
-            row=row,
-            row_idx=0,
-            current_header="",
-            description="",
-            year=2025,
-            team_mapping={},
-        )
-        result = _parse_legacy_row(ctx)
-        assert result is None
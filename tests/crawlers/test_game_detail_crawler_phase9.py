@@ -175,6 +175,9 @@ class TestParseSeasonYear:
     def test_invalid(self):
         assert GameDetailCrawler._parse_season_year("abc") is None
 
+    def test_non_leading_digits_fall_back_to_scan(self):
+        assert GameDetailCrawler._parse_season_year("D2025-10-13") == 2025
+
 
 class TestDeriveHitterStatsFromInningCells:
     def test_strikeout(self):
@@ -251,6 +254,14 @@ class TestPopulateHitterStats:
         GameDetailCrawler._populate_hitter_stats(stats, extras, cells)
         assert "plate_appearances" not in stats
 
+    def test_unparseable_values_are_not_stored(self):
+        stats = {}
+        extras = {}
+        cells = {"안타": "abc", "타율": "n/a"}
+        GameDetailCrawler._populate_hitter_stats(stats, extras, cells)
+        assert stats == {}
+        assert extras == {}
+
 
 class TestPopulatePitcherStats:
     def test_basic_stats(self):
@@ -542,24 +553,30 @@ class TestBuildPitcherPayload:
 
 
 class TestSelectHitterExtraRow:
-    def test_extra_has_names_match(self):
-        extra_map = {"홍길동": {"extra_hits": 1}}
-        extra_rows = [{"extra_hits": 99}]
+    def test_extra_has_names_aligned_index(self):
+        extra_rows = [{"playerName": "홍길동", "extra_hits": 1}, {"playerName": "김철수", "extra_hits": 2}]
+        result = GameDetailCrawler._select_hitter_extra_row(
+            extra_has_names=True,
+            extra_rows=extra_rows,
+            player_name="김철수",
+            idx=2,
+        )
+        assert result == {"playerName": "김철수", "extra_hits": 2}
+
+    def test_extra_has_names_falls_back_to_name_when_index_disagrees(self):
+        extra_rows = [{"playerName": "김철수", "extra_hits": 2}, {"playerName": "홍길동", "extra_hits": 1}]
         result = GameDetailCrawler._select_hitter_extra_row(
             extra_has_names=True,
-            extra_map=extra_map,
             extra_rows=extra_rows,
             player_name="홍길동",
             idx=1,
         )
-        assert result == {"extra_hits": 1}
+        assert result == {"playerName": "홍길동", "extra_hits": 1}
 
     def test_extra_has_names_no_match(self):
-        extra_map = {"홍길동": {"extra_hits": 1}}
         result = GameDetailCrawler._select_hitter_extra_row(
             extra_has_names=True,
-            extra_map=extra_map,
-            extra_rows=[],
+            extra_rows=[{"playerName": "홍길동", "extra_hits": 1}],
             player_name="김철수",
             idx=1,
         )
@@ -569,7 +586,6 @@ class TestSelectHitterExtraRow:
         extra_rows = [{"extra_hits": 10}, {"extra_hits": 20}]
         result = GameDetailCrawler._select_hitter_extra_row(
             extra_has_names=False,
-            extra_map={},
             extra_rows=extra_rows,
             player_name="any",
             idx=2,
@@ -579,7 +595,6 @@ class TestSelectHitterExtraRow:
     def test_by_index_out_of_range(self):
         result = GameDetailCrawler._select_hitter_extra_row(
             extra_has_names=False,
-            extra_map={},
             extra_rows=[{"extra_hits": 1}],
             player_name="any",
             idx=5,
@@ -807,6 +822,23 @@ class TestBoxscoreExtractionFlows:
         assert pool.release.await_count == 2
         pool.close.assert_not_awaited()
 
+    async def test_context_manager_reuses_one_pool_across_crawl_games_calls(self):
+        pool = MagicMock(max_pages=2)
+        pool.start = AsyncMock()
+        pool.acquire = AsyncMock(side_effect=lambda: MagicMock())
+        pool.release = AsyncMock()
+        pool.close = AsyncMock()
+
+        with patch("src.crawlers.game_detail_crawler.AsyncPlaywrightPool", return_value=pool) as pool_cls:
+            async with GameDetailCrawler(resolver=MagicMock()) as crawler:
+                crawler._crawl_single = AsyncMock(return_value={"game_id": "20250501LGOB0"})
+                await crawler.crawl_games([{"game_id": "20250501LGOB0", "game_date": "20250501"}])
+                await crawler.crawl_games([{"game_id": "20250502KTSS0", "game_date": "20250502"}])
+
+        pool_cls.assert_called_once()
+        pool.close.assert_awaited_once()
+        assert crawler.pool is None
+
     async def test_navigate_section_respects_compliance_block(self):
         crawler = GameDetailCrawler()
         ctx = BoxscoreCrawlContext(page=AsyncMock(), game_id="20250501LGOB0", game_date="20250501")
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from argparse import Namespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
 from src.crawlers.player_pitching_all_series_crawler import (
     PitcherStats,
@@ -10,7 +12,9 @@ from src.crawlers.player_pitching_all_series_crawler import (
     Basic2AdditionalContext,
     Basic2PageContext,
     PitcherBasic1Context,
+    SERIES_MAPPING,
     _collect_pitcher_basic2_additional,
+    _crawl_all_series,
     _collect_pitcher_basic1_loop,
     _get_pitcher_team_options,
     _select_pitcher_team_if_needed,
@@ -75,6 +79,11 @@ class TestExtractPlayerId:
     def test_large_id(self):
         assert extract_player_id("?playerId=999999") == 999999
 
+    def test_irregular_tail_falls_back_to_regex(self):
+        assert extract_player_id("?playerId=123#top") == 123
+        assert extract_player_id("?playerId=&ref=1&playerId=77") == 77
+        assert extract_player_id("?playerId=abc") is None
+
 
 class TestExtractBasic2RowInfo:
     def test_fast_path_valid(self):
@@ -337,13 +346,13 @@ class TestPitchingPageParsers:
                 },
             },
         ]
-        page.evaluate.side_effect = [headers, rows]
+        page.evaluate.return_value = {"headers": headers, "rows": rows}
         pitchers = {}
 
-        with patch("src.crawlers.player_pitching_all_series_crawler.get_team_mapping_for_year"):
-            processed = parse_basic1_page(page, 2025, "REGULAR", pitchers)
+        processed = parse_basic1_page(page, 2025, "REGULAR", pitchers)
 
         assert processed == 1
+        page.evaluate.assert_called_once()
         stats = pitchers[123]
         assert stats.team_code == "LG"
         assert stats.innings_outs == 32
@@ -353,42 +362,26 @@ class TestPitchingPageParsers:
 
     def test_parse_basic1_page_returns_zero_when_headers_are_invalid(self):
         page = MagicMock()
-        page.evaluate.return_value = ["선수명", "팀명"]
+        page.evaluate.return_value = {"headers": ["선수명", "팀명"], "rows": [{"player_id": 1}]}
+        pitchers = {}
 
-        processed = parse_basic1_page(page, 2025, "REGULAR", {})
+        processed = parse_basic1_page(page, 2025, "REGULAR", pitchers)
 
         assert processed == 0
+        assert pitchers == {}
+        page.evaluate.assert_called_once()
 
     def test_parse_basic2_page_uses_slow_dom_path_when_fast_parse_is_disabled(self, monkeypatch):
-        class Cell:
-            def __init__(self, text, href=None):
-                self.text = text
-                self.href = href
-
-            def get_attribute(self, name):
-                assert name == "href"
-                return self.href
-
-            def query_selector(self, selector):
-                assert selector == "a"
-                return self if self.href else None
-
-            def text_content(self):
-                return self.text
-
-        headers = [Cell("순위"), Cell("선수명"), Cell("팀명"), Cell("NP"), Cell("IBB")]
         row = MagicMock()
-        row.query_selector_all.return_value = [
-            Cell("1"),
-            Cell("홍길동", "/Player/Detail.aspx?playerId=123"),
-            Cell("LG"),
-            Cell("55"),
-            Cell("2"),
-        ]
+        row.evaluate.return_value = {
+            "cells": ["1", "홍길동", "LG", "55", "2"],
+            "linkHref": "/Player/Detail.aspx?playerId=123",
+        }
         page = MagicMock()
-        page.query_selector_all.side_effect = lambda selector: headers if "thead" in selector else [row]
+        page.evaluate.return_value = ["순위", "선수명", "팀명", "NP", "IBB"]
+        page.query_selector_all.return_value = [row]
         pitchers = {123: PitcherStats(player_id=123, season=2025, league="REGULAR")}
-        monkeypatch.setenv("KBO_FAST_PARSE", "0")
+        monkeypatch.setattr("src.crawlers.player_pitching_all_series_crawler.FAST_PARSE_ENABLED", False)
         ctx = Basic2PageContext(
             page=page,
             season=2025,
@@ -397,16 +390,16 @@ class TestPitchingPageParsers:
             sort_key="NP",
         )
 
-        with (
-            patch("src.crawlers.player_pitching_all_series_crawler.retry_wait_for_selector", return_value=True),
-            patch("src.crawlers.player_pitching_all_series_crawler.get_team_mapping_for_year"),
-        ):
+        with patch("src.crawlers.player_pitching_all_series_crawler.retry_wait_for_selector", return_value=True):
             processed = parse_basic2_page(ctx)
 
         assert processed == 1
         assert pitchers[123].extra_stats["metrics"]["np"] == 55
         assert pitchers[123].intentional_walks == 2
         assert pitchers[123].extra_stats["rankings"]["NP"] == 1
+        page.query_selector_all.assert_called_once_with("table.tData01 tbody tr")
+        assert row.evaluate.call_args.args[1] == 1
+        row.query_selector_all.assert_not_called()
 
     def test_collect_basic2_adapts_context_and_stops_at_last_page(self):
         pitchers = {123: PitcherStats(player_id=123, season=2025, league="REGULAR")}
@@ -443,9 +436,23 @@ class TestPitchingPageParsers:
         ready = setup_pitcher_page(page, "https://example.test/basic1", 2025, "0", policy)
 
         assert ready is True
-        page.select_option.assert_any_call('select[name*="ddlSeason"]', "2025")
+        page.select_option.assert_any_call('select[name*="ddlSeason"]', value="2025")
         page.select_option.assert_any_call('select[name*="ddlSeries"]', value="0")
-        assert policy.delay.call_count == 4
+        # 페이지 이동 1회 + 포스트백 2회, 요청마다 한 번씩 지연한다.
+        assert policy.delay.call_count == 3
+
+    def test_setup_pitcher_page_skips_values_already_selected(self):
+        page = MagicMock()
+        page.title.return_value = "KBO Record"
+        page.eval_on_selector.side_effect = ["2025", "0"]
+        policy = MagicMock()
+
+        ready = setup_pitcher_page(page, "https://example.test/basic1", 2025, "0", policy)
+
+        assert ready is True
+        page.select_option.assert_not_called()
+        page.wait_for_function.assert_not_called()
+        assert policy.delay.call_count == 1
 
     def test_setup_pitcher_page_returns_false_for_kbo_error_page(self):
         page = MagicMock()
@@ -467,6 +474,21 @@ class TestPitchingPageParsers:
         assert applied is True
         page.evaluate.assert_any_call("typeof sort === 'function'")
         page.evaluate.assert_any_call("sort('PIT_CN')")
+        # 첫 행 비교가 아니라 포스트백 응답을 기다린다.
+        page.expect_response.assert_called_once()
+        page.wait_for_load_state.assert_not_called()
+
+    def test_apply_sort_by_code_does_not_stall_when_first_row_is_unchanged(self):
+        page = MagicMock()
+        page.evaluate.return_value = "1 홍길동"
+        policy = MagicMock()
+
+        applied = _apply_sort_by_code(page, "PIT_CN", policy)
+
+        assert applied is True
+        page.expect_response.assert_called_once()
+        page.query_selector.return_value.click.assert_called_once_with()
+        page.wait_for_timeout.assert_not_called()
 
     def test_go_to_next_page_clicks_enabled_page_button(self):
         page = MagicMock()
@@ -548,6 +570,26 @@ class TestPitchingPageParsers:
         save.assert_called_once_with([stats.to_repository_payload()])
         browser.close.assert_called_once()
 
+    def test_crawl_pitcher_series_reuses_given_browser(self):
+        browser = MagicMock()
+        context = browser.new_context.return_value
+
+        with (
+            patch("src.crawlers.player_pitching_all_series_crawler.sync_playwright") as pw,
+            patch("src.crawlers.player_pitching_all_series_crawler.setup_pitcher_page", return_value=True),
+            patch(
+                "src.crawlers.player_pitching_all_series_crawler._get_pitcher_team_options",
+                return_value=[{"value": "", "text": "전체"}],
+            ),
+            patch("src.crawlers.player_pitching_all_series_crawler._collect_pitcher_basic1_loop"),
+        ):
+            result = crawl_pitcher_series(PitchingSeriesCrawlRequest(year=2025, series_key="playoff"), browser=browser)
+
+        assert result == []
+        pw.assert_not_called()
+        context.close.assert_called_once()
+        browser.close.assert_not_called()
+
     def test_crawl_pitcher_series_rejects_unknown_series(self):
         with pytest.raises(ValueError, match="지원하지 않는 시리즈"):
             crawl_pitcher_series(PitchingSeriesCrawlRequest(year=2025, series_key="unknown"))
@@ -577,3 +619,39 @@ class TestPitchingPageParsers:
 
         assert applied is True
         target.click.assert_called_once()
+
+
+class TestCrawlAllSeries:
+    def _args(self, workers):
+        return Namespace(year=2025, limit=None, headless=True, save=False, by_team=False, workers=workers)
+
+    def test_parallel_workers_keep_series_order(self):
+        with patch(
+            "src.crawlers.player_pitching_all_series_crawler.crawl_pitcher_series",
+            side_effect=lambda request, **_kwargs: [request.series_key],
+        ) as crawl:
+            all_data = _crawl_all_series(self._args(3))
+
+        assert list(all_data) == list(SERIES_MAPPING)
+        assert all(all_data[key] == [key] for key in SERIES_MAPPING)
+        assert crawl.call_count == len(SERIES_MAPPING)
+
+    def test_single_worker_crawls_sequentially_on_one_browser(self):
+        with (
+            patch(
+                "src.crawlers.player_pitching_all_series_crawler.crawl_pitcher_series",
+                return_value=[],
+            ) as crawl,
+            patch("src.crawlers.player_pitching_all_series_crawler.sync_playwright") as pw,
+            patch("src.crawlers.player_pitching_all_series_crawler.RequestPolicy") as policy_cls,
+            patch("src.crawlers.player_pitching_all_series_crawler.ThreadPoolExecutor") as executor,
+        ):
+            all_data = _crawl_all_series(self._args(1))
+
+        browser = pw.return_value.__enter__.return_value.chromium.launch.return_value
+        assert list(all_data) == list(SERIES_MAPPING)
+        assert policy_cls.return_value.delay.call_count == len(SERIES_MAPPING)
+        assert {call.kwargs["browser"] for call in crawl.call_args_list} == {browser}
+        pw.return_value.__enter__.return_value.chromium.launch.assert_called_once_with(headless=True)
+        browser.close.assert_called_once()
+        executor.assert_not_called()
@@ -86,6 +86,107 @@ class TestSavePitchingStats:
         result = save_pitching_stats_to_db([{}, {}])
         assert result == 2
 
+    @patch("src.repositories.player_season_pitching_repository.filter_valid_season_stat_payloads")
+    def test_rows_with_same_columns_share_one_upsert(self, mock_filter, session):
+        for player_id in (1, 2, 3):
+            session.add(PlayerBasic(player_id=player_id, name=f"P{player_id}"))
+        session.commit()
+
+        mock_filter.return_value = (
+            [
+                {"player_id": 1, "season": 2024, "league": "REGULAR", "games": 5, "wins": 3},
+                {"player_id": 2, "season": 2024, "league": "REGULAR", "games": 8, "wins": 6},
+                {"player_id": 3, "season": 2024, "league": "REGULAR", "games": 2},
+            ],
+            Counter(),
+        )
+
+        with patch.object(session, "execute", wraps=session.execute) as spy:
+            result = save_pitching_stats_to_db([{}, {}, {}])
+
+        assert result == 3
+        assert spy.call_count == 2
+        assert {row.player_id: row.wins for row in session.query(PlayerSeasonPitching)} == {1: 3, 2: 6, 3: None}
+
+    @patch("src.repositories.player_season_pitching_repository.filter_valid_season_stat_payloads")
+    def test_failed_batch_falls_back_to_single_rows(self, mock_filter, session):
+        session.add(PlayerBasic(player_id=1, name="A"))
+        session.add(PlayerBasic(player_id=2, name="B"))
+        session.commit()
+
+        mock_filter.return_value = (
+            [
+                {"player_id": 1, "season": 2024, "league": "REGULAR", "games": 5},
+                {"player_id": 2, "season": 2024, "league": "REGULAR", "games": 8},
+            ],
+            Counter(),
+        )
+        real_execute = session.execute
+
+        def execute(stmt, *args, **kwargs):
+            if execute.calls == 0:
+                execute.calls += 1
+                raise SQLAlchemyError("batch")
+            return real_execute(stmt, *args, **kwargs)
+
+        execute.calls = 0
+        with patch.object(session, "execute", side_effect=execute):
+            result = save_pitching_stats_to_db([{}, {}])
+
+        assert result == 2
+        assert session.query(PlayerSeasonPitching).count() == 2
+
+    @patch("src.repositories.player_season_pitching_repository.filter_valid_season_stat_payloads")
+    def test_failed_later_group_keeps_earlier_groups(self, mock_filter, session):
+        for player_id in (1, 2, 3):
+            session.add(PlayerBasic(player_id=player_id, name=f"P{player_id}"))
+        session.commit()
+
+        mock_filter.return_value = (
+            [
+                {"player_id": 1, "season": 2024, "league": "REGULAR", "games": 5, "wins": 3},
+                {"player_id": 2, "season": 2024, "league": "REGULAR", "games": 8},
+                {"player_id": 3, "season": 2024, "league": "REGULAR", "games": 2},
+            ],
+            Counter(),
+        )
+        real_execute = session.execute
+
+        def execute(stmt, *args, **kwargs):
+            execute.calls += 1
+            # 두 번째 컬럼 그룹(player 2, 3)의 배치 UPSERT만 실패시킨다.
+            if execute.calls == 2:
+                raise SQLAlchemyError("batch")
+            return real_execute(stmt, *args, **kwargs)
+
+        execute.calls = 0
+        with patch.object(session, "execute", side_effect=execute):
+            result = save_pitching_stats_to_db([{}, {}, {}])
+
+        assert result == 3
+        assert sorted(row.player_id for row in session.query(PlayerSeasonPitching)) == [1, 2, 3]
+
+    @patch("src.repositories.player_season_pitching_repository.filter_valid_season_stat_payloads")
+    def test_rows_are_upserted_in_chunks(self, mock_filter, session):
+        for player_id in range(1, 6):
+            session.add(PlayerBasic(player_id=player_id, name=f"P{player_id}"))
+        session.commit()
+
+        mock_filter.return_value = (
+            [{"player_id": player_id, "season": 2024, "league": "REGULAR", "games": 1} for player_id in range(1, 6)],
+            Counter(),
+        )
+
+        with (
+            patch("src.repositories.player_season_pitching_repository.PITCHING_UPSERT_CHUNK_SIZE", 2),
+            patch.object(session, "execute", wraps=session.execute) as spy,
+        ):
+            result = save_pitching_stats_to_db([{}] * 5)
+
+        assert result == 5
+        assert spy.call_count == 3
+        assert session.query(PlayerSeasonPitching).count() == 5
+
     @patch("src.repositories.player_season_pitching_repository.filter_valid_season_stat_payloads")
     def test_upsert_existing(self, mock_filter, session):
         session.add(PlayerBasic(player_id=1001, name="Test"))
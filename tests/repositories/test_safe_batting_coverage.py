@@ -44,8 +44,9 @@ def session(engine):
 
 
 @pytest.fixture(autouse=True)
-def _patch_deps(session):
+def _patch_deps(engine, session):
     with (
+        patch("src.repositories.safe_batting_repository.Engine", engine),
         patch("src.repositories.safe_batting_repository.SessionLocal", return_value=session),
         patch("src.repositories.safe_batting_repository.get_database_type", return_value="sqlite"),
         patch(
@@ -245,6 +246,23 @@ class TestSaveRowsByDatabaseType:
         result = _save_rows_by_database_type(session, rows, "postgresql")
         assert result == 1
 
+    def test_dialect_rows_are_upserted_in_chunks(self, session):
+        for player_id in range(1, 6):
+            session.add(PlayerBasic(player_id=player_id, name=f"P{player_id}"))
+        session.commit()
+        rows = [
+            {"player_id": player_id, "season": 2024, "league": "REGULAR", "level": "KBO1", "games": 5}
+            for player_id in range(1, 6)
+        ]
+        with (
+            patch("src.repositories.safe_batting_repository.BATTING_UPSERT_CHUNK_SIZE", 2),
+            patch.object(session, "execute", wraps=session.execute) as execute,
+        ):
+            result = _save_rows_by_database_type(session, rows, "sqlite")
+        assert result == 5
+        assert execute.call_count == 3
+        assert session.query(PlayerSeasonBatting).count() == 5
+
     def test_generic_path(self, session):
         session.add(PlayerBasic(player_id=1, name="A"))
         session.commit()
@@ -263,6 +281,23 @@ class TestSaveRowsByDatabaseType:
         assert existing.games == 10
         assert existing.hits == 3
 
+    def test_generic_prefetches_existing_rows_once_per_chunk(self, session):
+        session.add(PlayerBasic(player_id=1, name="A"))
+        session.add(PlayerBasic(player_id=2, name="B"))
+        session.add(PlayerSeasonBatting(player_id=1, season=2024, league="REGULAR", level="KBO1", games=5))
+        session.commit()
+        rows = [
+            {"player_id": 1, "season": 2024, "league": "REGULAR", "level": "KBO1", "games": 10},
+            {"player_id": 2, "season": 2024, "league": "REGULAR", "level": "KBO1", "games": 7},
+        ]
+        with patch.object(session, "query", wraps=session.query) as query:
+            result = _save_rows_by_database_type(session, rows, "unknown")
+        session.commit()
+        assert result == 2
+        assert query.call_count == 1
+        games = {row.player_id: row.games for row in session.query(PlayerSeasonBatting).all()}
+        assert games == {1: 10, 2: 7}
+
     def test_generic_inserts_new(self, session):
         session.add(PlayerBasic(player_id=1, name="A"))
         session.commit()
@@ -4,7 +4,7 @@ from collections import Counter
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
 from src.models.player import PlayerBasic, PlayerSeasonBatting
@@ -32,8 +32,9 @@ def session(engine):
 
 
 @pytest.fixture(autouse=True)
-def patch_deps(session):
+def patch_deps(engine, session):
     with (
+        patch("src.repositories.safe_batting_repository.Engine", engine),
         patch("src.repositories.safe_batting_repository.SessionLocal", return_value=session),
         patch("src.repositories.safe_batting_repository.get_database_type", return_value="sqlite"),
         patch(
@@ -128,6 +129,41 @@ class TestSaveBattingStats:
         counts = get_last_filter_counts()
         assert counts.get("invalid") == 3
 
+    @patch("src.repositories.safe_batting_repository.BATTING_UPSERT_CHUNK_SIZE", 1)
+    @patch("src.repositories.safe_batting_repository.filter_valid_season_stat_payloads")
+    def test_chunk_commits_keep_foreign_keys_off_on_one_connection(self, mock_filter, tmp_path):
+        file_engine = create_engine(f"sqlite:///{tmp_path / 'kbo.db'}")
+
+        @event.listens_for(file_engine, "connect")
+        def _enable_foreign_keys(dbapi_con, _record):
+            dbapi_con.execute("PRAGMA foreign_keys = ON")
+
+        PlayerBasic.__table__.create(file_engine)
+        PlayerSeasonBatting.__table__.create(file_engine)
+        # 풀에 유휴 커넥션을 여러 개 두어, 커밋 뒤 다른 커넥션을 받으면 FK 검사가 다시 켜지게 한다.
+        idle = [file_engine.connect() for _ in range(3)]
+        for conn in idle:
+            conn.close()
+
+        mock_filter.return_value = (
+            [{"player_id": pid, "season": 2024, "league": "REGULAR", "games": 5} for pid in (1, 2, 3)],
+            Counter(),
+        )
+        with (
+            patch("src.repositories.safe_batting_repository.Engine", file_engine),
+            patch("src.repositories.safe_batting_repository.SessionLocal", sessionmaker()),
+        ):
+            result = save_batting_stats_safe([{}, {}, {}])
+
+        assert result == 3
+        with file_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM player_season_batting")).scalar() == 3
+        pooled = [file_engine.connect() for _ in range(3)]
+        assert all(conn.execute(text("PRAGMA foreign_keys")).scalar() == 1 for conn in pooled)
+        for conn in pooled:
+            conn.close()
+        file_engine.dispose()
+
 
 class TestQueryAndCleanup:
     def test_get_batting_stats_count(self, session):
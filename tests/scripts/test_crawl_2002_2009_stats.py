@@ -59,9 +59,9 @@ class TestCrawl20022009Stats:
     def test_main_executes(self):
         with (
             patch("scripts.crawl_2002_2009_stats.sync_playwright") as mock_pw,
+            patch("scripts.crawl_2002_2009_stats.RequestPolicy"),
             patch("scripts.crawl_2002_2009_stats.save_batting_stats_safe"),
             patch("scripts.crawl_2002_2009_stats.save_pitching_stats_safe"),
-            patch("scripts.crawl_2002_2009_stats.time.sleep"),
         ):
             mock_browser = MagicMock()
             mock_context = MagicMock()
@@ -73,3 +73,180 @@ class TestCrawl20022009Stats:
             from scripts.crawl_2002_2009_stats import main
 
             main()
+
+    def test_postback_waits_on_response_with_script_timeout(self):
+        from scripts.crawl_2002_2009_stats import TABLE_WAIT_TIMEOUT_MS, _postback
+
+        page = MagicMock()
+        action = MagicMock()
+
+        _postback(page, action)
+
+        action.assert_called_once_with()
+        assert page.expect_response.call_args.kwargs == {"timeout": TABLE_WAIT_TIMEOUT_MS}
+        page.wait_for_load_state.assert_not_called()
+
+    def test_build_batting_data_maps_columns_and_pads_short_rows(self):
+        from scripts.crawl_2002_2009_stats import _build_batting_data
+
+        cells = ["1", "홍길동", "삼성", "0.312", "120", "500", "450", "80", "140", "-"]
+        data = _build_batting_data(cells, 1, "홍길동", "SS", "regular", False)
+
+        assert data["player_id"] == 1
+        assert data["avg"] == 0.312
+        assert data["games"] == 120
+        assert data["hits"] == 140
+        assert data["doubles"] is None
+        assert data["ops"] is None
+
+    def test_cell_parsers_handle_placeholders_and_padding(self):
+        from scripts.crawl_2002_2009_stats import _parse_float, _parse_int
+
+        assert _parse_int(" 12 ") == 12
+        assert _parse_float("0.305") == 0.305
+        assert _parse_int("-") is None
+        assert _parse_float("N/A") is None
+        assert _parse_int("   ") is None
+        assert _parse_float("   ") is None
+
+    def test_specialized_cell_parsers_keep_type(self):
+        from scripts.crawl_2002_2009_stats import _parse_float, _parse_int
+
+        assert _parse_int("7") == 7
+        assert _parse_int("0.5") is None
+        assert _parse_int("-") is None
+        assert _parse_float("0.5") == 0.5
+        assert _parse_float("N/A") is None
+        assert _parse_float("") is None
+
+    def test_parse_page_skips_rows_already_seen_for_team(self):
+        from scripts.crawl_2002_2009_stats import _parse_page
+
+        row = {"player_id": 7, "player_name": "홍길동", "team_name": "삼성", "cells": [], "is_basic2": False}
+        page = MagicMock()
+        page.evaluate.return_value = {"results": [row, dict(row)]}
+        build = MagicMock(side_effect=lambda **kwargs: {"player_id": kwargs["player_id"]})
+        all_players: dict = {}
+        seen: set = set()
+
+        with patch("scripts.crawl_2002_2009_stats.resolve_team_code", return_value="SS"):
+            assert _parse_page(page, "js", build, 2005, "regular", "REGULAR", all_players, seen) is False
+            _parse_page(page, "js", build, 2005, "regular", "REGULAR", all_players, seen)
+
+        assert build.call_count == 1
+        assert seen == {7}
+        assert all_players[7]["season"] == 2005
+
+    def test_main_saves_every_year_from_parallel_lanes(self):
+        with (
+            patch("scripts.crawl_2002_2009_stats.sync_playwright"),
+            patch(
+                "scripts.crawl_2002_2009_stats.crawl_stats_for_year",
+                side_effect=lambda _page, year, mode, _policy: [{"player_id": year, "mode": mode}],
+            ),
+            patch("scripts.crawl_2002_2009_stats.save_batting_stats_safe") as save_batting,
+            patch("scripts.crawl_2002_2009_stats.save_pitching_stats_safe") as save_pitching,
+        ):
+            from scripts.crawl_2002_2009_stats import main
+
+            main(workers=3)
+
+        saved_years = sorted(call.args[0][0]["player_id"] for call in save_batting.call_args_list)
+        assert saved_years == list(range(2002, 2010))
+        assert save_pitching.call_count == 8
+
+    def test_build_pitching_data_parses_fractional_innings(self):
+        from scripts.crawl_2002_2009_stats import _build_pitching_data
+
+        cells = ["1", "홍길동", "삼성", "3.21", "30", "12", "8", "0", "0", "0.600", "180 2/3", "170"]
+        data = _build_pitching_data(cells, 1, "홍길동", "SS", "regular", False)
+
+        assert data["innings_outs"] == 542
+        assert data["innings_pitched"] == pytest.approx(180 + 2 / 3)
+        assert data["era"] == 3.21
+        assert data["hits_allowed"] == 170
+        assert data["whip"] is None
+
+        short = _build_pitching_data(cells[:5], 1, "홍길동", "SS", "regular", False)
+        assert short["innings_outs"] is None
+        assert short["innings_pitched"] is None
+
+    def test_go_to_next_page_stops_without_pager_link(self):
+        from scripts.crawl_2002_2009_stats import _go_to_next_page
+
+        page = MagicMock()
+        page.locator.return_value.first.count.return_value = 0
+
+        assert _go_to_next_page(page, 3) is None
+        page.query_selector.assert_not_called()
+        page.locator.return_value.first.click.assert_not_called()
+
+    def test_go_to_next_page_clicks_pager_link(self):
+        from scripts.crawl_2002_2009_stats import _go_to_next_page
+
+        page = MagicMock()
+        page.locator.return_value.first.count.return_value = 1
+
+        assert _go_to_next_page(page, 3) == 4
+        assert "btnNo4" in page.locator.call_args.args[0]
+        page.locator.return_value.first.click.assert_called_once_with()
+
+    def test_reset_to_first_page_skips_click_when_page_one_is_current(self):
+        from scripts.crawl_2002_2009_stats import _reset_to_first_page
+
+        page = MagicMock()
+        page1_btn = page.locator.return_value.first
+        page1_btn.count.return_value = 1
+        page1_btn.get_attribute.return_value = "on"
+
+        _reset_to_first_page(page)
+
+        page1_btn.click.assert_not_called()
+        page.wait_for_function.assert_not_called()
+
+    def test_reset_to_first_page_clicks_when_another_page_is_current(self):
+        from scripts.crawl_2002_2009_stats import _reset_to_first_page
+
+        page = MagicMock()
+        page1_btn = page.locator.return_value.first
+        page1_btn.count.return_value = 1
+        page1_btn.get_attribute.return_value = None
+
+        _reset_to_first_page(page)
+
+        page1_btn.click.assert_called_once_with()
+        page.wait_for_function.assert_called_once()
+
+    def test_workers_default_to_one_and_are_opt_in(self):
+        from scripts.crawl_2002_2009_stats import YEAR_WORKERS, _parse_args
+
+        assert YEAR_WORKERS == 1
+        assert _parse_args([]).workers == 1
+        assert _parse_args(["--workers", "3"]).workers == 3
+
+    def test_postbacks_are_paced_by_request_policy(self):
+        from scripts.crawl_2002_2009_stats import _go_to_next_page
+
+        page = MagicMock()
+        page.locator.return_value.first.count.return_value = 1
+        policy = MagicMock()
+
+        _go_to_next_page(page, 1, policy)
+
+        policy.delay.assert_called_once_with()
+        page.locator.return_value.first.click.assert_called_once_with()
+
+    def test_lane_shares_one_policy_across_years(self):
+        from scripts.crawl_2002_2009_stats import _crawl_years
+
+        results = MagicMock()
+        with (
+            patch("scripts.crawl_2002_2009_stats.sync_playwright"),
+            patch("scripts.crawl_2002_2009_stats.RequestPolicy") as policy_cls,
+            patch("scripts.crawl_2002_2009_stats.crawl_stats_for_year", return_value=[]) as crawl,
+        ):
+            _crawl_years([2002, 2003], results)
+
+        policy_cls.assert_called_once_with()
+        assert {call.args[3] for call in crawl.call_args_list} == {policy_cls.return_value}
+        assert results.put.call_count == 2
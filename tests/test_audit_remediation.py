@@ -86,6 +86,7 @@ def test_audit_batting_remediation_within_threshold(tmp_path):
     with (
         patch.object(audit_module, "SessionLocal", TestSessionLocal),
         patch.object(safe_bat_repo, "SessionLocal", TestSessionLocal),
+        patch.object(safe_bat_repo, "Engine", engine),
         patch.object(safe_pitch_repo, "SessionLocal", TestSessionLocal),
         patch.object(team_stats_repo, "SessionLocal", TestSessionLocal),
     ):
@@ -179,6 +180,7 @@ def test_audit_batting_remediation_aborted_by_max_mismatches(tmp_path):
     with (
         patch.object(audit_module, "SessionLocal", TestSessionLocal),
         patch.object(safe_bat_repo, "SessionLocal", TestSessionLocal),
+        patch.object(safe_bat_repo, "Engine", engine),
         patch.object(safe_pitch_repo, "SessionLocal", TestSessionLocal),
         patch.object(team_stats_repo, "SessionLocal", TestSessionLocal),
     ):
@@ -267,6 +269,7 @@ def test_audit_batting_remediation_aborted_by_max_game_diff(tmp_path):
     with (
         patch.object(audit_module, "SessionLocal", TestSessionLocal),
         patch.object(safe_bat_repo, "SessionLocal", TestSessionLocal),
+        patch.object(safe_bat_repo, "Engine", engine),
         patch.object(safe_pitch_repo, "SessionLocal", TestSessionLocal),
         patch.object(team_stats_repo, "SessionLocal", TestSessionLocal),
     ):
@@ -355,6 +358,7 @@ def test_audit_pitching_remediation_within_threshold(tmp_path):
     with (
         patch.object(audit_module, "SessionLocal", TestSessionLocal),
         patch.object(safe_bat_repo, "SessionLocal", TestSessionLocal),
+        patch.object(safe_bat_repo, "Engine", engine),
         patch.object(safe_pitch_repo, "SessionLocal", TestSessionLocal),
         patch.object(team_stats_repo, "SessionLocal", TestSessionLocal),
     ):
@@ -442,6 +446,7 @@ def test_audit_pitching_remediation_aborted_by_max_innings_outs_diff(tmp_path):
     with (
         patch.object(audit_module, "SessionLocal", TestSessionLocal),
         patch.object(safe_bat_repo, "SessionLocal", TestSessionLocal),
+        patch.object(safe_bat_repo, "Engine", engine),
         patch.object(safe_pitch_repo, "SessionLocal", TestSessionLocal),
         patch.object(team_stats_repo, "SessionLocal", TestSessionLocal),
     ):
@@ -7,27 +7,17 @@ from src.crawlers.player_pitching_all_series_crawler import (
 )
 
 
-class _Header:
-    def __init__(self, text):
-        self.text = text
-
-    def inner_text(self):
-        return self.text
-
-    def text_content(self):
-        return self.text
-
-
 class _FakePage:
+    def evaluate(self, script):
+        assert script == module.TABLE_HEADERS_JS
+        return ["순위", "선수명", "팀명", "NP"]
+
     def query_selector_all(self, selector):
-        if selector == "table.tData01 thead th":
-            return [_Header("순위"), _Header("선수명"), _Header("팀명"), _Header("NP")]
         return []
 
 
 def test_parse_basic2_page_does_not_create_pitcher_without_basic1(monkeypatch):
     monkeypatch.setattr(module, "retry_wait_for_selector", lambda *_args, **_kwargs: True)
-    monkeypatch.setattr(module, "get_team_mapping_for_year", lambda _year: {"삼성": "SS"})
     monkeypatch.setattr(
         module,
         "extract_rows_fast",
@@ -57,7 +47,6 @@ def test_parse_basic2_page_does_not_create_pitcher_without_basic1(monkeypatch):
 
 def test_parse_basic2_page_enriches_existing_basic1_pitcher(monkeypatch):
     monkeypatch.setattr(module, "retry_wait_for_selector", lambda *_args, **_kwargs: True)
-    monkeypatch.setattr(module, "get_team_mapping_for_year", lambda _year: {"삼성": "SS"})
     monkeypatch.setattr(
         module,
         "extract_rows_fast",
@@ -25,6 +25,7 @@ def _build_session_factory(tmp_path, name):
 def test_save_batting_stats_filters_invalid_and_basic2_only_payloads(monkeypatch, tmp_path):
     SessionLocal, engine = _build_session_factory(tmp_path, "batting.db")
     monkeypatch.setattr(batting_repo, "SessionLocal", SessionLocal)
+    monkeypatch.setattr(batting_repo, "Engine", engine)
     monkeypatch.setattr(batting_repo, "get_database_type", lambda: "sqlite")
 
     saved = batting_repo.save_batting_stats_safe(
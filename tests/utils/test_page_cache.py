@@ -0,0 +1,44 @@
+"""Tests for page_cache — file-backed parsed table cache."""
+
+import os
+import time
+from datetime import datetime
+
+from src.constants import KST
+from src.utils.page_cache import CURRENT_SEASON_TTL_SECONDS, PageCacheKey, get_cached_rows, put_cached_rows
+
+
+class TestPageCache:
+    def test_round_trip(self, tmp_path):
+        key = PageCacheKey(2015, "regular", "basic")
+        rows = [{"player_id": 1, "player_name": "홍길동", "extra_stats": {"errors": None}}]
+
+        put_cached_rows(key, rows, cache_dir=tmp_path)
+
+        assert get_cached_rows(key, cache_dir=tmp_path) == rows
+        assert (tmp_path / "2015" / "regular" / "basic.json").exists()
+
+    def test_miss_returns_none(self, tmp_path):
+        assert get_cached_rows(PageCacheKey(2015, "regular", "basic"), cache_dir=tmp_path) is None
+
+    def test_current_season_entry_expires_after_ttl(self, tmp_path):
+        key = PageCacheKey(datetime.now(KST).year, "regular", "basic")
+        put_cached_rows(key, [{"player_id": 1}], cache_dir=tmp_path)
+        stale = time.time() - CURRENT_SEASON_TTL_SECONDS - 60
+        os.utime(key.path(tmp_path), (stale, stale))
+
+        assert get_cached_rows(key, cache_dir=tmp_path) is None
+
+    def test_past_season_entry_never_expires(self, tmp_path):
+        key = PageCacheKey(2010, "regular", "basic")
+        put_cached_rows(key, [{"player_id": 1}], cache_dir=tmp_path)
+        os.utime(key.path(tmp_path), (0, 0))
+
+        assert get_cached_rows(key, cache_dir=tmp_path) == [{"player_id": 1}]
+
+    def test_corrupt_entry_is_ignored(self, tmp_path):
+        key = PageCacheKey(2010, "regular", "basic")
+        key.path(tmp_path).parent.mkdir(parents=True)
+        key.path(tmp_path).write_text("{not json", encoding="utf-8")
+
+        assert get_cached_rows(key, cache_dir=tmp_path) is None
@@ -41,3 +41,11 @@ class TestExtractRowsFast:
         page.evaluate.assert_called_once()
         args = page.evaluate.call_args
         assert args[0][1]["selector"] == "table.custom"
+
+    def test_row_filters_are_forwarded_to_js(self) -> None:
+        page = MagicMock()
+        page.evaluate.return_value = []
+        extract_rows_fast(page, min_cells=16, require_link=True)
+        args = page.evaluate.call_args[0][1]
+        assert args["minCells"] == 16
+        assert args["requireLink"] is True
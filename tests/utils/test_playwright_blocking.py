@@ -5,7 +5,9 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.utils.playwright_blocking import (
+    DEFAULT_BLOCKED_HOSTS,
     DEFAULT_BLOCKED_RESOURCE_TYPES,
+    TABLE_ONLY_BLOCKED_RESOURCE_TYPES,
     install_async_resource_blocking,
     install_sync_resource_blocking,
 )
@@ -16,6 +18,13 @@ class TestConstants:
         assert "image" in DEFAULT_BLOCKED_RESOURCE_TYPES
         assert "media" in DEFAULT_BLOCKED_RESOURCE_TYPES
         assert "font" in DEFAULT_BLOCKED_RESOURCE_TYPES
+        assert "google-analytics.com" in DEFAULT_BLOCKED_HOSTS
+
+    def test_table_only_types_add_stylesheets_but_keep_scripts(self):
+        assert TABLE_ONLY_BLOCKED_RESOURCE_TYPES >= DEFAULT_BLOCKED_RESOURCE_TYPES
+        assert "stylesheet" in TABLE_ONLY_BLOCKED_RESOURCE_TYPES
+        assert "stylesheet" not in DEFAULT_BLOCKED_RESOURCE_TYPES
+        assert not {"document", "script", "xhr", "fetch"} & TABLE_ONLY_BLOCKED_RESOURCE_TYPES
 
 
 class TestInstallSyncResourceBlocking:
@@ -42,6 +51,7 @@ class TestInstallSyncResourceBlocking:
         handler = target.route.call_args[0][1]
         route = MagicMock()
         route.request.resource_type = "script"
+        route.request.url = "https://www.koreabaseball.com/js/common.js"
         handler(route)
         route.continue_.assert_called_once()
 
@@ -57,9 +67,38 @@ class TestInstallSyncResourceBlocking:
 
         route_allow = MagicMock()
         route_allow.request.resource_type = "image"
+        route_allow.request.url = "https://www.koreabaseball.com/images/logo.png"
         handler(route_allow)
         route_allow.continue_.assert_called_once()
 
+    def test_blocks_tracker_hosts_regardless_of_type(self):
+        target = MagicMock()
+        install_sync_resource_blocking(target)
+
+        handler = target.route.call_args[0][1]
+        tracker = MagicMock()
+        tracker.request.resource_type = "script"
+        tracker.request.url = "https://www.google-analytics.com/analytics.js"
+        handler(tracker)
+        tracker.abort.assert_called_once()
+
+        lookalike = MagicMock()
+        lookalike.request.resource_type = "script"
+        lookalike.request.url = "https://notdoubleclick.net/x.js"
+        handler(lookalike)
+        lookalike.continue_.assert_called_once()
+
+    def test_empty_blocked_hosts_disables_host_blocking(self):
+        target = MagicMock()
+        install_sync_resource_blocking(target, blocked_hosts=())
+
+        handler = target.route.call_args[0][1]
+        route = MagicMock()
+        route.request.resource_type = "script"
+        route.request.url = "https://www.google-analytics.com/analytics.js"
+        handler(route)
+        route.continue_.assert_called_once()
+
 
 class TestInstallAsyncResourceBlocking:
     @pytest.mark.asyncio
@@ -87,5 +126,6 @@ class TestInstallAsyncResourceBlocking:
         handler = target.route.call_args[0][1]
         route = AsyncMock()
         route.request.resource_type = "document"
+        route.request.url = "https://www.koreabaseball.com/Record/Player/PitcherBasic/Basic1.aspx"
         await handler(route)
         route.continue_.assert_awaited_once()
@@ -2,7 +2,10 @@
 
 from unittest.mock import MagicMock
 
-from src.utils.playwright_helpers import goto_next_page
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from src.utils.playwright_helpers import POSTBACK_IDLE_JS, goto_next_page, select_option_if_changed, wait_for_postback
 
 
 class TestGotoNextPage:
@@ -72,3 +75,67 @@ class TestGotoNextPage:
         page = MagicMock()
         page.query_selector.side_effect = RuntimeError("fail")
         assert not goto_next_page(page)
+
+
+class TestWaitForPostback:
+    def test_waits_for_same_document_post_response(self):
+        page = MagicMock()
+        page.url = "https://www.koreabaseball.com/Record/Player/HitterBasic/Basic1.aspx?sort=PA"
+        policy = MagicMock()
+        action = MagicMock()
+
+        assert wait_for_postback(page, action, policy, timeout=1234) is True
+
+        policy.delay.assert_called_once_with()
+        action.assert_called_once_with()
+        is_postback = page.expect_response.call_args.args[0]
+        assert page.expect_response.call_args.kwargs == {"timeout": 1234}
+        postback = MagicMock(url="https://www.koreabaseball.com/Record/Player/HitterBasic/Basic1.aspx")
+        postback.request.method = "POST"
+        other = MagicMock(url="https://www.koreabaseball.com/ws/Main.asmx/GetKboGameList")
+        other.request.method = "POST"
+        document_get = MagicMock(url=postback.url)
+        document_get.request.method = "GET"
+        assert is_postback(postback) is True
+        assert is_postback(other) is False
+        assert is_postback(document_get) is False
+        page.wait_for_function.assert_called_once_with(POSTBACK_IDLE_JS, timeout=1234)
+
+    def test_missing_response_is_tolerated(self):
+        page = MagicMock()
+        page.url = "https://example.test/Basic1.aspx"
+        page.expect_response.return_value.__exit__.side_effect = PlaywrightTimeoutError("no postback")
+
+        assert wait_for_postback(page, MagicMock()) is False
+        page.wait_for_function.assert_not_called()
+
+    def test_action_errors_propagate(self):
+        page = MagicMock()
+        page.url = "https://example.test/Basic1.aspx"
+        action = MagicMock(side_effect=PlaywrightTimeoutError("click failed"))
+
+        with pytest.raises(PlaywrightTimeoutError):
+            wait_for_postback(page, action)
+
+
+class TestSelectOptionIfChanged:
+    def test_skips_value_already_selected(self):
+        page = MagicMock()
+        page.eval_on_selector.return_value = "2025"
+        policy = MagicMock()
+
+        assert select_option_if_changed(page, "select#season", "2025", policy) is False
+        page.select_option.assert_not_called()
+        page.expect_response.assert_not_called()
+        policy.delay.assert_not_called()
+
+    def test_selects_new_value_through_postback(self):
+        page = MagicMock()
+        page.url = "https://example.test/Basic1.aspx"
+        page.eval_on_selector.return_value = "2024"
+        policy = MagicMock()
+
+        assert select_option_if_changed(page, "select#season", "2025", policy) is True
+        page.select_option.assert_called_once_with("select#season", value="2025")
+        page.expect_response.assert_called_once()
+        policy.delay.assert_called_once_with()
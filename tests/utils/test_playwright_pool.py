@@ -215,3 +215,49 @@ class TestStart:
         assert pool._playwright is None
         assert pool._queue is None
         assert not pool._started
+
+    @pytest.mark.asyncio
+    async def test_start_forwards_custom_blocked_resource_types(self):
+        blocked = frozenset({"image", "stylesheet"})
+        pool = AsyncPlaywrightPool(max_pages=1, blocked_resource_types=blocked)
+        mock_playwright = MagicMock()
+        mock_playwright.stop = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_context = AsyncMock()
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        async_pw = AsyncMock()
+        async_pw.start = AsyncMock(return_value=mock_playwright)
+
+        with (
+            patch("src.utils.playwright_pool.async_playwright", return_value=async_pw),
+            patch("src.utils.playwright_pool.install_async_resource_blocking", new=AsyncMock()) as install,
+        ):
+            await pool.start()
+
+        install.assert_awaited_once_with(mock_context, blocked)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_start_connects_over_cdp_when_endpoint_set(self, monkeypatch):
+        monkeypatch.setenv("KBO_CDP", "http://127.0.0.1:9222")
+        pool = AsyncPlaywrightPool(max_pages=1, block_resources=False)
+        mock_playwright = MagicMock()
+        mock_playwright.stop = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_context = AsyncMock()
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+        mock_playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+        mock_playwright.chromium.launch = AsyncMock()
+
+        async_pw = AsyncMock()
+        async_pw.start = AsyncMock(return_value=mock_playwright)
+
+        with patch("src.utils.playwright_pool.async_playwright", return_value=async_pw):
+            await pool.start()
+
+        mock_playwright.chromium.connect_over_cdp.assert_awaited_once_with("http://127.0.0.1:9222")
+        mock_playwright.chromium.launch.assert_not_awaited()
+        mock_browser.new_context.assert_awaited_once()
+        await pool.close()
@@ -38,6 +38,12 @@ class TestResolveTeamCode:
         assert resolve_team_code("LG") == "LG"
         assert resolve_team_code("두산 베어스") == "DB"
 
+    def test_repeated_lookups_hit_cache(self):
+        resolve_team_code.cache_clear()
+        resolve_team_code("한화", 2025)
+        resolve_team_code("한화", 2025)
+        assert resolve_team_code.cache_info().hits == 1
+
 
 class TestKboGameIdTeamCode:
     def test_none_returns_none(self):
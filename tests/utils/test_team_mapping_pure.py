@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from src.utils.team_codes import resolve_team_code
-from src.utils.team_mapping import TeamMapper
+from src.utils.team_mapping import TeamMapper, get_team_code, get_team_mapping_for_year, refresh_oci_mapping
 
 
 def _make_mapper() -> TeamMapper:
@@ -115,3 +117,26 @@ class TestGetAllTeamsForYear:
         mapper.year_specific_mapping = {2020: {"TEST": "T1"}}
         teams = mapper.get_all_teams_for_year(2021)
         assert "TEST" not in teams
+
+
+class TestModuleGetTeamCode:
+    def test_repeated_lookups_are_cached_until_refresh(self) -> None:
+        mapper = MagicMock()
+        mapper.get_team_code.return_value = "SS"
+        get_team_code.cache_clear()
+        with patch("src.utils.team_mapping.get_team_mapper", return_value=mapper):
+            assert get_team_code("삼성", 2005) == "SS"
+            assert get_team_code("삼성", 2005) == "SS"
+            assert mapper.get_team_code.call_count == 1
+
+            refresh_oci_mapping()
+            get_team_code("삼성", 2005)
+            assert mapper.get_team_code.call_count == 2
+        get_team_code.cache_clear()
+
+    def test_year_mapping_returns_independent_dicts(self) -> None:
+        with patch("src.utils.team_mapping.get_team_mapper", return_value=_make_mapper()):
+            first = get_team_mapping_for_year(2005)
+            first["LG"] = "XX"
+
+            assert get_team_mapping_for_year(2005)["LG"] == "LG"
@@ -84,6 +84,18 @@ class TestParseInnings:
     def test_whole_and_fraction_other(self):
         assert parse_innings("9 2/3") == pytest.approx(9.667, rel=0.01)
 
+    @pytest.mark.parametrize("value", ["5/", "/", "a/", "/3", "5 1/"])
+    def test_fraction_missing_numerator_or_denominator_raises(self, value):
+        with pytest.raises(ValueError):
+            parse_innings(value)
+
+    def test_extra_fraction_parts_are_ignored(self):
+        assert parse_innings("3/2/") == 1.5
+
+    def test_non_fraction_second_token_keeps_whole(self):
+        assert parse_innings("5 x") == 5.0
+        assert parse_innings("5 1/3 extra") == pytest.approx(5.333, rel=0.01)
+
 
 class TestSafeIntOrNone:
     def test_none(self):
@@ -53,6 +53,11 @@ class TestSafeIntOrNone:
     def test_invalid(self) -> None:
         assert safe_int_or_none("abc") is None
 
+    def test_int_passthrough_and_thousands_separator(self) -> None:
+        assert safe_int_or_none(7) == 7
+        assert safe_int_or_none(" 12,345 ") == 12345
+        assert safe_int_or_none(True) is None
+
 
 class TestSafeFloat:
     def test_valid(self) -> None:
@@ -91,6 +96,14 @@ class TestParseInnings:
     def test_empty(self) -> None:
         assert parse_innings("") == 0.0
 
+    def test_fraction_shapes(self) -> None:
+        assert parse_innings("112 1/3") == pytest.approx(112 + 1 / 3)
+        assert parse_innings("2/3") == pytest.approx(2 / 3)
+        assert parse_innings("1,024 2/3") == pytest.approx(1024 + 2 / 3)
+        assert parse_innings("5 3/4") == pytest.approx(5.75)
+        assert parse_innings("7 -") == 7.0
+        assert parse_innings(" - ") == 0.0
+
 
 class TestParseInsToOuts:
     def test_whole_innings(self) -> None:
@@ -106,3 +119,10 @@ class TestParseInsToOuts:
 
     def test_empty(self) -> None:
         assert parse_innings_to_outs("") is None
+
+    def test_simple_and_fallback_shapes_agree(self) -> None:
+        assert parse_innings_to_outs(" 5.2 ") == 17
+        assert parse_innings_to_outs("0.1") == 1
+        assert parse_innings_to_outs("5 1/3") == 16
+        assert parse_innings_to_outs("⅔") == 2
+        assert parse_innings_to_outs("-") is None